@@ -2,13 +2,25 @@
 SQLAdmin configuration for FastAPI application.
 Provides admin interface for managing database models.
 """
+from datetime import datetime
+from typing import Any
+
+import anyio
 from sqladmin import Admin, ModelView
 from sqladmin.authentication import AuthenticationBackend
+from starlette.middleware import Middleware
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.datastructures import UploadFile
 from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 from sqlmodel import Session, select
+from wtforms import FileField
 
+from app import crud
+from app.api.routes.events import invalidate_event_facets
 from app.core.db import engine
+from app.core.geo import geocode
+from app.core.media import inline_images_to_references, store_image
 from app.core.security import verify_password
 from app.models import (
     User,
@@ -23,11 +35,65 @@ from app.models import (
 )
 
 
+# Limit for non-file admin form fields, which Starlette buffers in memory
+# (default 1MB). Images are uploaded as files instead, which Starlette
+# spools to a temporary file on disk above 1MB, and stored as WebP
+# references, so this only has to fit long Markdown content.
+ADMIN_FORM_MAX_PART_SIZE = 8 * 1024 * 1024
+_FORM_MAX_PART_SIZE_KEY = "app.form_max_part_size"
+
+
+def _install_scoped_form_limit() -> None:
+    """
+    Let a middleware raise the multipart part limit for its requests.
+
+    sqladmin calls `request.form()` without arguments, so Request.form is
+    wrapped once to default `max_part_size` to the value FormLimitMiddleware
+    put in the ASGI scope. Requests outside the admin keep Starlette's limit.
+    """
+    original_form = Request.form
+    if getattr(original_form, "_scoped_limit", False):
+        return
+
+    def form(self: Request, **kwargs: Any) -> Any:
+        max_part_size = self.scope.get(_FORM_MAX_PART_SIZE_KEY)
+        if max_part_size is not None:
+            kwargs.setdefault("max_part_size", max_part_size)
+        return original_form(self, **kwargs)
+
+    form._scoped_limit = True  # type: ignore[attr-defined]
+    Request.form = form  # type: ignore[method-assign]
+
+
+class FormLimitMiddleware:
+    def __init__(self, app: ASGIApp, max_part_size: int) -> None:
+        self.app = app
+        self.max_part_size = max_part_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            scope[_FORM_MAX_PART_SIZE_KEY] = self.max_part_size
+        await self.app(scope, receive, send)
+
+
 class AdminAuth(AuthenticationBackend):
     """
     Custom authentication backend for SQLAdmin.
     Uses existing User model and password verification.
     """
+
+    def __init__(self, secret_key: str) -> None:
+        super().__init__(secret_key=secret_key)
+        # sqladmin adds these to the /admin sub-app only
+        self.middlewares = [
+            Middleware(
+                SessionMiddleware,
+                secret_key=secret_key,
+                max_age=60 * 60 * 24 * 30,
+                https_only=False,
+                same_site="lax",
+            )
+        ]
     
     async def login(self, request: Request) -> bool:
         """
@@ -153,6 +219,15 @@ class TourAdmin(ModelView, model=Tour):
     can_view_details = True
     can_export = True
 
+    async def on_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        """Locate the meeting point in the offline gazetteer unless coordinates are given."""
+        if data.get("latitude") is None or data.get("longitude") is None:
+            place = geocode(data.get("meeting_point"))
+            if place is not None:
+                data["latitude"], data["longitude"] = place.latitude, place.longitude
+
 
 class TourDateAdmin(ModelView, model=TourDate):
     """
@@ -237,6 +312,14 @@ class BlogPostAdmin(ModelView, model=BlogPost):
     can_delete = True
     can_view_details = True
     can_export = True
+    # Cover image is uploaded as a file and stored as a WebP /blog-media URL
+    form_overrides = {"cover_image_url": FileField}
+    form_args = {
+        "cover_image_url": {
+            "label": "Cover image",
+            "description": "Upload to replace the current image; leave empty to keep it.",
+        }
+    }
     column_formatters = {
     BlogPost.title: lambda model, attr: (model.title[:60] + "...") if model.title and len(model.title) > 50 else (model.title or ""),
     BlogPost.slug: lambda model, attr: (model.slug[:30] + "...") if model.slug and len(model.slug) > 50 else (model.slug or ""),
@@ -244,6 +327,31 @@ class BlogPostAdmin(ModelView, model=BlogPost):
     BlogPost.updated_at: lambda model, attr: model.updated_at.strftime("%Y-%m-%d %H:%M:%S") if model.updated_at else "",
 }
 
+    async def on_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        """
+        Store uploaded / inline Base64 images as WebP files referenced by URL,
+        and bump updated_at.
+        """
+        slug = data.get("slug") or model.slug
+        upload = data.get("cover_image_url")
+        if isinstance(upload, UploadFile):
+            if upload.filename:
+                # Pillow reads the spooled upload; keep the conversion off the event loop
+                data["cover_image_url"] = await anyio.to_thread.run_sync(
+                    store_image, upload.file, slug
+                )
+            else:
+                data.pop("cover_image_url")
+
+        content = data.get("content_markdown")
+        if content and "data:image/" in content:
+            data["content_markdown"] = await anyio.to_thread.run_sync(
+                inline_images_to_references, content, slug
+            )
+        data["updated_at"] = datetime.now()
+
 
 class OAuthAccountAdmin(ModelView, model=OAuthAccount):
     """
@@ -294,6 +402,37 @@ class EventAdmin(ModelView, model=Event):
     can_view_details = True
     can_export = True
 
+    async def on_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        """
+        Locate the venue in the offline gazetteer unless coordinates are
+        given, and bump updated_at (Instagram card fingerprints and
+        copy_db.py --incremental rely on it).
+        """
+        if data.get("latitude") is None or data.get("longitude") is None:
+            place = geocode(
+                data.get("venue_name"), data.get("venue_address"), data.get("neighborhood")
+            )
+            if place is not None:
+                data["latitude"], data["longitude"] = place.latitude, place.longitude
+        data["updated_at"] = datetime.now()
+
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        """Regenerate the event's occurrence rows for the calendar."""
+        await anyio.to_thread.run_sync(_sync_event_occurrences, model.id)
+        invalidate_event_facets()
+
+
+def _sync_event_occurrences(event_id: int) -> None:
+    with Session(engine) as session:
+        event = session.get(Event, event_id)
+        if event is not None:
+            crud.sync_event_occurrences(session=session, events=[event])
+            session.commit()
+
 
 def setup_admin(app, secret_key: str) -> Admin:
     """
@@ -306,19 +445,21 @@ def setup_admin(app, secret_key: str) -> Admin:
     Returns:
         Admin instance
     """
-    # Add session middleware for authentication
-    app.add_middleware(SessionMiddleware, secret_key=secret_key, max_age=60*60*24*30, https_only=False, same_site='lax')
-    
-    # Create authentication backend
+    # Create authentication backend (it brings the session middleware)
     authentication_backend = AdminAuth(secret_key=secret_key)
-    
-    # Initialize admin
+
+    _install_scoped_form_limit()
+
+    # Initialize admin; its middleware wraps /admin requests only
     admin = Admin(
         app=app,
         engine=engine,
         authentication_backend=authentication_backend,
         base_url="/admin",
         title="Admin Panel",
+        middlewares=[
+            Middleware(FormLimitMiddleware, max_part_size=ADMIN_FORM_MAX_PART_SIZE)
+        ],
     )
     
     # Add all views
@@ -33,6 +33,7 @@ from app.models import (
 )  # noqa: F401
 from sqlmodel import SQLModel
 from app.core.config import settings # noqa
+from app.core.db import SSH_TUNNEL_PORT, get_database_url, needs_ssh_tunnel  # noqa
 from app.ssh_util import ssh_tunnel  # noqa
 
 
@@ -79,23 +80,13 @@ def run_migrations_online():
     """
     configuration = config.get_section(config.config_ini_section)
     
-    # Check if we need SSH tunnel (only if POSTGRES_SERVER is not localhost)
-    needs_ssh_tunnel = (
-        settings.ENVIRONMENT == "local" 
-        and settings.POSTGRES_SERVER not in ("localhost", "127.0.0.1")
-    )
-    
-    if needs_ssh_tunnel:
-        # Use SSH tunnel on port 5433 to avoid conflict with local PostgreSQL
-        db_url = str(settings.SQLALCHEMY_DATABASE_URI).replace(
-            f":{settings.POSTGRES_PORT}", ":5433"
-        ).replace(
-            settings.POSTGRES_SERVER, "127.0.0.1"
-        )
+    tunnel = needs_ssh_tunnel()
+    if tunnel:
+        db_url = get_database_url(host="127.0.0.1", port=SSH_TUNNEL_PORT)
     else:
-        db_url = get_url()
-    
-    configuration["sqlalchemy.url"] = db_url
+        db_url = get_database_url()
+
+    configuration["sqlalchemy.url"] = db_url.render_as_string(hide_password=False)
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
@@ -103,8 +94,8 @@ def run_migrations_online():
     )
 
     # In local environment with remote DB, create SSH tunnel before connecting to DB
-    if needs_ssh_tunnel:
-        with ssh_tunnel(local_port=5433):
+    if tunnel:
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
             with connectable.connect() as connection:
                 context.configure(
                     connection=connection, target_metadata=target_metadata, compare_type=True
@@ -0,0 +1,51 @@
+"""add_coordinates_and_geo_index
+
+Revision ID: 20261019geoi
+Revises: 20261019evoc
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "20261019geoi"
+down_revision = "20261019evoc"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # earthdistance ships with PostgreSQL (contrib); creating the
+    # extensions needs a role with CREATE on the database
+    op.execute(
+        """
+        CREATE EXTENSION IF NOT EXISTS cube;
+        CREATE EXTENSION IF NOT EXISTS earthdistance;
+
+        ALTER TABLE events ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+        ALTER TABLE events ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+        ALTER TABLE tours ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+        ALTER TABLE tours ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+
+        CREATE INDEX IF NOT EXISTS ix_events_earth_location
+            ON events USING gist (ll_to_earth(latitude, longitude))
+            WHERE latitude IS NOT NULL AND longitude IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS ix_tours_earth_location
+            ON tours USING gist (ll_to_earth(latitude, longitude))
+            WHERE latitude IS NOT NULL AND longitude IS NOT NULL;
+        """
+    )
+
+
+def downgrade():
+    op.execute(
+        """
+        DROP INDEX IF EXISTS ix_tours_earth_location;
+        DROP INDEX IF EXISTS ix_events_earth_location;
+        ALTER TABLE tours DROP COLUMN IF EXISTS longitude;
+        ALTER TABLE tours DROP COLUMN IF EXISTS latitude;
+        ALTER TABLE events DROP COLUMN IF EXISTS longitude;
+        ALTER TABLE events DROP COLUMN IF EXISTS latitude;
+        """
+    )
@@ -0,0 +1,44 @@
+"""add_event_filter_indexes
+
+Revision ID: 20261019evfi
+Revises: 20261019geoi
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "20261019evfi"
+down_revision = "20261019geoi"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created from the models before this revision have tags as
+    # json; this is a no-op where the column is already jsonb
+    op.execute(
+        """
+        ALTER TABLE events ALTER COLUMN tags TYPE JSONB USING tags::jsonb;
+
+        CREATE INDEX IF NOT EXISTS ix_events_category ON events (category);
+        CREATE INDEX IF NOT EXISTS ix_events_neighborhood ON events (neighborhood);
+        CREATE INDEX IF NOT EXISTS ix_events_price_type ON events (price_type);
+        CREATE INDEX IF NOT EXISTS ix_events_language ON events (language);
+        CREATE INDEX IF NOT EXISTS ix_events_tags
+            ON events USING gin (tags jsonb_path_ops);
+        """
+    )
+
+
+def downgrade():
+    op.execute(
+        """
+        DROP INDEX IF EXISTS ix_events_tags;
+        DROP INDEX IF EXISTS ix_events_language;
+        DROP INDEX IF EXISTS ix_events_price_type;
+        DROP INDEX IF EXISTS ix_events_neighborhood;
+        DROP INDEX IF EXISTS ix_events_category;
+        """
+    )
@@ -0,0 +1,69 @@
+"""add_event_occurrence_table
+
+Revision ID: 20261019evoc
+Revises: 20261019tdix
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "20261019evoc"
+down_revision = "20261019tdix"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS event_occurrence (
+            id SERIAL PRIMARY KEY,
+            event_id INTEGER NOT NULL REFERENCES events (id) ON DELETE CASCADE,
+            date DATE NOT NULL,
+            start_time_local VARCHAR(20)
+        );
+
+        CREATE INDEX IF NOT EXISTS ix_event_occurrence_date_event_id
+            ON event_occurrence (date, event_id);
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_event_occurrence_event_id_date
+            ON event_occurrence (event_id, date);
+        """
+    )
+    # Backfill with the same rules as crud.event_occurrence_dates
+    # (EVENT_OCCURRENCE_HORIZON_DAYS = 180)
+    op.execute(
+        """
+        INSERT INTO event_occurrence (event_id, date, start_time_local)
+        SELECT span.id, day::date, span.start_time_local
+        FROM (
+            SELECT
+                e.id,
+                e.start_time_local,
+                bounds.first_day,
+                LEAST(
+                    COALESCE(
+                        e.end_date,
+                        CASE WHEN e.is_long_term
+                            THEN CURRENT_DATE + 180 ELSE e.start_date END
+                    ),
+                    GREATEST(e.start_date, CURRENT_DATE) + 180
+                ) AS last_day
+            FROM events e
+            CROSS JOIN LATERAL (
+                SELECT CASE WHEN e.is_long_term
+                    THEN GREATEST(e.start_date, CURRENT_DATE - 180)
+                    ELSE e.start_date END AS first_day
+            ) bounds
+        ) span
+        CROSS JOIN LATERAL generate_series(
+            span.first_day, span.last_day, interval '1 day'
+        ) AS day
+        ON CONFLICT (event_id, date) DO NOTHING
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS event_occurrence")
@@ -0,0 +1,30 @@
+"""add_tour_date_covering_index
+
+Revision ID: 20261019tdix
+Revises: 20260524adde
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "20261019tdix"
+down_revision = "20260524adde"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Covers the tour detail join: tours is found by its unique slug, then
+    # tour_date by (tour_id, id) with date and time read from the index
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_tour_date_tour_id_id
+        ON tour_date (tour_id, id) INCLUDE (date, time)
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_tour_date_tour_id_id")
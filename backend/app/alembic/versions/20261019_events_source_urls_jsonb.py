@@ -0,0 +1,33 @@
+"""events_source_urls_jsonb
+
+Revision ID: 20261019evsu
+Revises: 20261019evfi
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "20261019evsu"
+down_revision = "20261019evfi"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # As with tags in 20261019evfi: databases created from the models have
+    # source_urls as json, the ones created by 20260524adde already jsonb
+    op.execute(
+        """
+        ALTER TABLE events
+            ALTER COLUMN source_urls TYPE JSONB USING source_urls::jsonb;
+
+        CREATE INDEX IF NOT EXISTS ix_events_source_urls
+            ON events USING gin (source_urls jsonb_path_ops);
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_events_source_urls")
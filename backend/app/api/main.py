@@ -4,6 +4,7 @@ from app.api.routes import (
     blog_posts,
     contacts,
     events,
+    export,
     login,
     oauth,
     private,
@@ -22,6 +23,7 @@ api_router.include_router(tours.router, prefix="/tours", tags=["tours"])
 api_router.include_router(contacts.router, prefix="/contacts", tags=["contacts"])
 api_router.include_router(blog_posts.router)
 api_router.include_router(events.router)
+api_router.include_router(export.router)
 
 
 if settings.ENVIRONMENT == "local":
@@ -0,0 +1,25 @@
+"""
+JSON response classes.
+
+The app defaults to ORJSONResponse. Hot read endpoints can additionally skip
+FastAPI's response_model re-validation and `jsonable_encoder` pass by
+returning `ModelResponse(model)`: the model is already validated, so it is
+serialized straight to bytes by pydantic-core. Plain dicts/lists work too
+(Decimal, date and UUID values are handled the same way as in models). The
+route should still declare `response_model` so the OpenAPI schema stays
+accurate.
+"""
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import ORJSONResponse
+from starlette.responses import Response
+
+__all__ = ["ModelResponse", "ORJSONResponse"]
+
+
+class ModelResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
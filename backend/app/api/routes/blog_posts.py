@@ -1,13 +1,35 @@
 from typing import Any
 
+import sqlalchemy as sa
 from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from sqlmodel import col, func, select
 
 from app.api.deps import SessionDep
+from app.api.responses import ModelResponse
+from app.core.statements import hot_statement
 from app.models import BlogPost, BlogPostPublic, BlogPostsPublic
 
 router = APIRouter(prefix="/blog-posts", tags=["blog-posts"])
 
+# Built once, see app/core/statements.py
+BLOG_POSTS_COUNT_STATEMENT = hot_statement(
+    "blog_posts_count", select(func.count()).select_from(BlogPost)
+)
+BLOG_POSTS_PAGE_STATEMENT = hot_statement(
+    "blog_posts_page",
+    select(BlogPost)
+    .order_by(col(BlogPost.created_at).desc())
+    .offset(sa.bindparam("skip"))
+    .limit(sa.bindparam("limit")),
+    skip=0,
+    limit=1,
+)
+BLOG_POST_DETAIL_STATEMENT = hot_statement(
+    "blog_post_detail",
+    select(BlogPost).where(BlogPost.slug == sa.bindparam("slug")),
+    slug="",
+)
+
 
 @router.get("/", response_model=BlogPostsPublic)
 def read_blog_posts(
@@ -19,20 +41,14 @@ def read_blog_posts(
     Retrieve blog posts with pagination.
     Returns list of blog posts ordered by creation date (newest first).
     """
-    # Count total posts
-    count_statement = select(func.count()).select_from(BlogPost)
-    count = session.exec(count_statement).one()
+    count = session.exec(BLOG_POSTS_COUNT_STATEMENT).one()
 
-    # Get posts with pagination, ordered by created_at descending
-    statement = (
-        select(BlogPost)
-        .order_by(BlogPost.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    posts = session.exec(statement).all()
+    # Newest first
+    posts = session.exec(
+        BLOG_POSTS_PAGE_STATEMENT, params={"skip": skip, "limit": limit}
+    ).all()
 
-    return BlogPostsPublic(data=posts, count=count)
+    return ModelResponse(BlogPostsPublic(data=posts, count=count))
 
 
 @router.get("/{slug}", response_model=BlogPostPublic)
@@ -44,10 +60,9 @@ def read_blog_post_by_slug(
     Retrieve a specific blog post by slug.
     Returns blog post details.
     """
-    statement = select(BlogPost).where(BlogPost.slug == slug)
-    post = session.exec(statement).first()
+    post = session.exec(BLOG_POST_DETAIL_STATEMENT, params={"slug": slug}).first()
 
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
 
-    return post
+    return ModelResponse(BlogPostPublic.model_validate(post))
@@ -1,13 +1,31 @@
+import time
+from collections.abc import Callable
 from datetime import date, timedelta
-from typing import Any
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, HTTPException
+import sqlalchemy as sa
+from fastapi import APIRouter, HTTPException, Query
 from sqlalchemy import and_, or_
-from sqlmodel import col, func, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Session, col, func, select
 
 from app.api.deps import SessionDep
+from app.api.responses import ModelResponse
+from app.core import geo
 from app.core.config import settings
-from app.models import Event, EventPublic, EventsPublic
+from app.core.statements import hot_statement
+from app.models import (
+    EVENT_SUMMARY_FIELDS,
+    Event,
+    EventFacetCount,
+    EventFacetsPublic,
+    EventOccurrence,
+    EventPublic,
+    EventsCalendarPublic,
+    EventsPublic,
+    EventsSummaryPublic,
+)
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -18,8 +36,12 @@ def ensure_events_enabled() -> None:
 
 
 def active_events_filter():
-    today = date.today()
-    current_week_start = today - timedelta(days=today.weekday())
+    """
+    Visible-window filter; the dates are bind parameters filled in by
+    `active_events_params()`, so statements using it can be built once.
+    """
+    today = sa.bindparam("today", type_=sa.Date)
+    current_week_start = sa.bindparam("week_start", type_=sa.Date)
 
     return or_(
         and_(
@@ -36,34 +58,313 @@ def active_events_filter():
     )
 
 
-@router.get("/", response_model=EventsPublic)
+def active_events_params(today: date | None = None) -> dict[str, date]:
+    today = today or date.today()
+    return {"today": today, "week_start": today - timedelta(days=today.weekday())}
+
+
+def _page_params(skip: int, limit: int) -> dict[str, Any]:
+    return {"skip": skip, "limit": limit, **active_events_params()}
+
+
+# Optional /events/ filters by name. Each clause brings its own bind
+# parameter(s), named after the filter, and statements are built (and
+# cached) once per combination of active filters, in this order.
+EVENT_FILTERS: dict[str, Callable[[], Any]] = {
+    "category": lambda: col(Event.category) == sa.bindparam("category"),
+    "neighborhood": lambda: col(Event.neighborhood) == sa.bindparam("neighborhood"),
+    "price_type": lambda: col(Event.price_type) == sa.bindparam("price_type"),
+    "language": lambda: col(Event.language) == sa.bindparam("language"),
+    # jsonb containment, served by the GIN index on tags
+    "tags": lambda: col(Event.tags).contains(sa.bindparam("tags", type_=JSONB)),
+    "near": lambda: geo.near_filter(col(Event.latitude), col(Event.longitude)),
+}
+# Scalar columns with facet counts (tags are counted per element)
+FACET_FIELDS = ("category", "neighborhood", "price_type", "language")
+
+
+def _visible_events_where(filters: tuple[str, ...]) -> list[Any]:
+    return [
+        col(Event.is_visible).is_(True),
+        active_events_filter(),
+        *(EVENT_FILTERS[name]() for name in filters),
+    ]
+
+
+@lru_cache(maxsize=64)
+def events_count_statement(filters: tuple[str, ...] = ()) -> Any:
+    return select(func.count()).select_from(Event).where(*_visible_events_where(filters))
+
+
+EVENTS_COUNT_STATEMENT = hot_statement(
+    "events_count", events_count_statement(), **active_events_params()
+)
+
+
+@lru_cache(maxsize=128)
+def events_page_statement(
+    columns: tuple[str, ...] | None, filters: tuple[str, ...] = ()
+) -> Any:
+    """Page of visible events, with all columns or only `columns`."""
+    if columns is None:
+        statement = select(Event)
+    else:
+        # Plain SQLAlchemy select keeps Row results even for a single column
+        statement = sa.select(*(getattr(Event, name) for name in columns))
+    return (
+        statement.where(*_visible_events_where(filters))
+        .order_by(col(Event.start_date), col(Event.start_time_local), col(Event.title))
+        .offset(sa.bindparam("skip"))
+        .limit(sa.bindparam("limit"))
+    )
+
+
+hot_statement("events_page", events_page_statement(None), **_page_params(0, 1))
+hot_statement(
+    "events_page_summary",
+    events_page_statement(tuple(EVENT_SUMMARY_FIELDS)),
+    **_page_params(0, 1),
+)
+hot_statement(
+    "events_page_near",
+    events_page_statement(None, ("near",)),
+    **_page_params(0, 1),
+    **geo.near_params((-34.6037, -58.3816), geo.DEFAULT_NEAR_RADIUS_M),
+)
+
+EVENT_DETAIL_STATEMENT = hot_statement(
+    "event_detail",
+    select(Event).where(
+        Event.slug == sa.bindparam("slug"),
+        col(Event.is_visible).is_(True),
+        active_events_filter(),
+    ),
+    slug="",
+    **active_events_params(),
+)
+
+def _events_facets_statement() -> Any:
+    tag = (
+        sa.func.jsonb_array_elements_text(col(Event.tags))
+        .table_valued("value")
+        .lateral("tag")
+    )
+    facet_columns = [getattr(Event, name) for name in FACET_FIELDS] + [tag.c.value]
+    return (
+        sa.select(
+            # 0 for the column the row is grouped by
+            *(sa.func.grouping(column) for column in facet_columns),
+            *facet_columns,
+            func.count(sa.distinct(col(Event.id))),
+        )
+        .select_from(Event)
+        .outerjoin(tag, sa.true())
+        .where(*_visible_events_where(()))
+        .group_by(sa.func.grouping_sets(*facet_columns))
+    )
+
+
+# All facet counts in one grouped pass over the active events
+EVENTS_FACETS_STATEMENT = hot_statement(
+    "events_facets", _events_facets_statement(), **active_events_params()
+)
+
+# Facet counts of the current active-events window:
+# (today, week_start) -> (expiry time, facets)
+_facets_cache: dict[tuple[date, date], tuple[float, EventFacetsPublic]] = {}
+
+
+def invalidate_event_facets() -> None:
+    _facets_cache.clear()
+
+
+def event_facets(session: Session) -> EventFacetsPublic:
+    params = active_events_params()
+    key = (params["today"], params["week_start"])
+    cached = _facets_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    names = (*FACET_FIELDS, "tags")
+    counts: dict[str, list[EventFacetCount]] = {name: [] for name in names}
+    for row in session.exec(EVENTS_FACETS_STATEMENT, params=params):
+        groupings, values, count = row[: len(names)], row[len(names) : -1], row[-1]
+        index = groupings.index(0)
+        if values[index] is not None:
+            counts[names[index]].append(EventFacetCount(value=values[index], count=count))
+    for items in counts.values():
+        items.sort(key=lambda item: (-item.count, item.value))
+
+    facets = EventFacetsPublic(**counts)
+    # Only the current window is kept
+    _facets_cache.clear()
+    _facets_cache[key] = (time.monotonic() + settings.EVENT_FACETS_CACHE_SECONDS, facets)
+    return facets
+
+
+# Longest date range /events/calendar answers, in days
+CALENDAR_MAX_DAYS = 62
+
+# Range scan on ix_event_occurrence_date_event_id, no date arithmetic
+EVENTS_CALENDAR_STATEMENT = hot_statement(
+    "events_calendar",
+    sa.select(
+        col(EventOccurrence.date),
+        col(EventOccurrence.start_time_local),
+        *(getattr(Event, name) for name in EVENT_SUMMARY_FIELDS),
+    )
+    .join_from(EventOccurrence, Event, col(EventOccurrence.event_id) == col(Event.id))
+    .where(
+        col(EventOccurrence.date).between(
+            sa.bindparam("date_from", type_=sa.Date),
+            sa.bindparam("date_to", type_=sa.Date),
+        ),
+        col(Event.is_visible).is_(True),
+    )
+    .order_by(
+        col(EventOccurrence.date),
+        col(EventOccurrence.start_time_local),
+        col(Event.title),
+    ),
+    date_from=date.today(),
+    date_to=date.today(),
+)
+
+
+def parse_event_fields(
+    fields: str | None, view: Literal["full", "summary"]
+) -> list[str] | None:
+    """
+    Resolve the `fields`/`view` query parameters into a list of Event columns.
+    Returns None when the full EventPublic representation is requested.
+    """
+    if fields:
+        names = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [name for name in names if name not in EventPublic.model_fields]
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown event fields: {', '.join(unknown)}",
+            )
+        # id is always included so clients can key list items
+        if "id" not in names:
+            names.insert(0, "id")
+        return names
+    if view == "summary":
+        return list(EVENT_SUMMARY_FIELDS)
+    return None
+
+
+@router.get("/", response_model=EventsPublic | EventsSummaryPublic)
 def read_events(
     session: SessionDep,
     skip: int = 0,
     limit: int = 100,
+    fields: str | None = None,
+    view: Literal["full", "summary"] = "full",
+    category: str | None = None,
+    neighborhood: str | None = None,
+    price_type: str | None = None,
+    language: str | None = None,
+    tags: str | None = None,
+    near: str | None = None,
+    radius: Annotated[
+        float, Query(gt=0, le=geo.MAX_NEAR_RADIUS_M)
+    ] = geo.DEFAULT_NEAR_RADIUS_M,
 ) -> Any:
     """
     Retrieve visible events for the public site.
+    `view=summary` returns only slug, title, dates, is_long_term and
+    official_url; `fields=slug,title,...` selects an arbitrary subset of
+    EventPublic fields. Only the requested columns are read from the database.
+    `category`, `neighborhood`, `price_type` and `language` match exactly;
+    `tags=a,b` keeps events having all of those tags (see /events/facets
+    for the available values).
+    `near=lat,lng` keeps events within `radius` meters (default 2000) of
+    that point; events without coordinates are left out.
     """
     ensure_events_enabled()
+    columns = parse_event_fields(fields, view)
 
-    count_statement = (
-        select(func.count())
-        .select_from(Event)
-        .where(col(Event.is_visible).is_(True), active_events_filter())
+    # Active filters and their bind parameters
+    active: dict[str, dict[str, Any]] = {
+        name: {name: value}
+        for name, value in (
+            ("category", category),
+            ("neighborhood", neighborhood),
+            ("price_type", price_type),
+            ("language", language),
+        )
+        if value is not None
+    }
+    if tags:
+        active["tags"] = {"tags": [tag.strip() for tag in tags.split(",") if tag.strip()]}
+    if near is not None:
+        try:
+            point = geo.parse_near(near)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=f"Invalid near: {e}")
+        active["near"] = geo.near_params(point, radius)
+    filters = [name for name in EVENT_FILTERS if name in active]
+    filter_params = {key: value for params in active.values() for key, value in params.items()}
+
+    count = session.exec(
+        events_count_statement(tuple(filters)),
+        params={**active_events_params(), **filter_params},
+    ).one()
+
+    statement = events_page_statement(
+        None if columns is None else tuple(columns), tuple(filters)
     )
-    count = session.exec(count_statement).one()
+    params = {**_page_params(skip, limit), **filter_params}
 
-    statement = (
-        select(Event)
-        .where(col(Event.is_visible).is_(True), active_events_filter())
-        .order_by(col(Event.start_date), col(Event.start_time_local), col(Event.title))
-        .offset(skip)
-        .limit(limit)
+    if columns is None:
+        events = session.exec(statement, params=params).all()
+        return ModelResponse(EventsPublic(data=events, count=count))
+
+    rows = session.exec(statement, params=params).all()
+    return ModelResponse(
+        {"data": [dict(row._mapping) for row in rows], "count": count}
     )
-    events = session.exec(statement).all()
 
-    return EventsPublic(data=events, count=count)
+
+@router.get("/facets", response_model=EventFacetsPublic)
+def read_event_facets(session: SessionDep) -> Any:
+    """
+    Number of visible events per category, neighborhood, price type,
+    language and tag, for building the /events/ filters. Cached for
+    EVENT_FACETS_CACHE_SECONDS within the current active-events window.
+    """
+    ensure_events_enabled()
+    return ModelResponse(event_facets(session))
+
+
+@router.get("/calendar", response_model=EventsCalendarPublic)
+def read_events_calendar(
+    session: SessionDep,
+    date_from: Annotated[date, Query(alias="from")],
+    date_to: Annotated[date, Query(alias="to")],
+) -> Any:
+    """
+    Visible events day by day between `from` and `to` (inclusive): one item
+    per day an event takes place, ordered by date and start time.
+    """
+    ensure_events_enabled()
+    if date_to < date_from:
+        raise HTTPException(status_code=422, detail="`to` is before `from`")
+    if (date_to - date_from).days >= CALENDAR_MAX_DAYS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Date range is limited to {CALENDAR_MAX_DAYS} days",
+        )
+
+    rows = session.exec(
+        EVENTS_CALENDAR_STATEMENT,
+        params={"date_from": date_from, "date_to": date_to},
+    ).all()
+    return ModelResponse(
+        {"data": [dict(row._mapping) for row in rows], "count": len(rows)}
+    )
 
 
 @router.get("/{slug}", response_model=EventPublic)
@@ -76,14 +377,11 @@ def read_event_by_slug(
     """
     ensure_events_enabled()
 
-    statement = select(Event).where(
-        Event.slug == slug,
-        col(Event.is_visible).is_(True),
-        active_events_filter(),
-    )
-    event = session.exec(statement).first()
+    event = session.exec(
+        EVENT_DETAIL_STATEMENT, params={"slug": slug, **active_events_params()}
+    ).first()
 
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    return event
+    return ModelResponse(EventPublic.model_validate(event))
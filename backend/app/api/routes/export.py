@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import get_current_active_superuser
+from app.core.db import engine
+from app.core.export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    ExportName,
+    export_filename,
+    iter_export,
+)
+
+router = APIRouter(
+    prefix="/export",
+    tags=["export"],
+    dependencies=[Depends(get_current_active_superuser)],
+)
+
+
+@router.get("/{name}")
+def export_table(name: ExportName, format: ExportFormat = "ndjson") -> StreamingResponse:
+    """
+    Stream a whole table (events, contacts or blog posts) as NDJSON or CSV.
+    Rows are read in batches through a server-side cursor, so memory use
+    does not grow with the table.
+    """
+    # The generator opens its own connection: the request's session is
+    # closed before the body is sent
+    return StreamingResponse(
+        iter_export(engine, name, format),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_filename(name, format)}"'
+        },
+    )
@@ -1,10 +1,13 @@
 
 from typing import Any
 from fastapi import APIRouter, HTTPException
-from sqlmodel import select
+import sqlalchemy as sa
+from sqlmodel import col
 from datetime import date
 
 from app.api.deps import SessionDep
+from app.api.responses import ModelResponse
+from app.core.statements import hot_statement
 from app.models import Tour, TourDate
 from pydantic import BaseModel
 
@@ -30,12 +33,63 @@ class TourDetailResponse(BaseModel):
     cost: str
     additional_cost: str
     meeting_point: str
+    latitude: float | None = None
+    longitude: float | None = None
     max_capacity: int | None
     date: date
     time: str
     date_id: int
 
 
+# Built once at import: the statement's cache key is memoized, so every
+# request hits the compiled cache, and the Core row it returns carries exactly
+# the TourDetailResponse fields with no ORM entities or identity map involved.
+# Served by tours' unique slug index and ix_tour_date_tour_id_id.
+TOUR_DETAIL_STATEMENT = hot_statement(
+    "tour_detail",
+    sa.select(
+        Tour.name,
+        Tour.slug,
+        Tour.description,
+        Tour.additional_description,
+        Tour.duration,
+        Tour.cost,
+        Tour.additional_cost,
+        Tour.meeting_point,
+        Tour.latitude,
+        Tour.longitude,
+        Tour.max_capacity,
+        TourDate.date,
+        TourDate.time,
+        col(TourDate.id).label("date_id"),
+    )
+    .join_from(Tour, TourDate, col(Tour.id) == col(TourDate.tour_id))
+    .where(
+        col(Tour.slug) == sa.bindparam("slug"),
+        col(TourDate.id) == sa.bindparam("date_id"),
+    ),
+    slug="",
+    date_id=0,
+)
+
+TOURS_PAGE_STATEMENT = hot_statement(
+    "tours_page",
+    sa.select(
+        Tour.name,
+        Tour.slug,
+        TourDate.id,
+        TourDate.date,
+        TourDate.time
+    )
+    .join_from(Tour, TourDate, col(Tour.id) == col(TourDate.tour_id))
+    .order_by(TourDate.date, TourDate.time)
+    .offset(sa.bindparam("skip"))
+    .limit(sa.bindparam("limit")),
+    skip=0,
+    limit=1,
+)
+
+
 @router.get("/", response_model=list[ScheduledTourResponse])
 def read_tours(
     session: SessionDep,
@@ -46,22 +100,9 @@ def read_tours(
     Retrieve scheduled tours with their dates.
     Returns tours with dates ordered by date and time.
     """
-    # Join Tour and TourDate tables
-    statement = (
-        select(
-            Tour.name,
-            Tour.slug,
-            TourDate.id,
-            TourDate.date,
-            TourDate.time
-        )
-        .join(TourDate, Tour.id == TourDate.tour_id)
-        .order_by(TourDate.date, TourDate.time)
-        .offset(skip)
-        .limit(limit)
-    )
-    
-    results = session.exec(statement).all()
+    results = session.exec(
+        TOURS_PAGE_STATEMENT, params={"skip": skip, "limit": limit}
+    ).all()
     
     # Convert results to response model
     # SQLModel returns Row objects that can be accessed as tuples
@@ -89,33 +130,11 @@ def read_tour_by_slug_and_date(
     Retrieve a specific tour by slug and date_id.
     Returns tour details with the specific date information.
     """
-    # Join Tour and TourDate tables and filter by slug and date_id
-    statement = (
-        select(Tour, TourDate)
-        .join(TourDate, Tour.id == TourDate.tour_id)
-        .where(Tour.slug == slug)
-        .where(TourDate.id == date_id)
-    )
-    
-    result = session.exec(statement).first()
-    
-    if not result:
+    row = session.exec(
+        TOUR_DETAIL_STATEMENT, params={"slug": slug, "date_id": date_id}
+    ).first()
+
+    if not row:
         raise HTTPException(status_code=404, detail="Tour not found")
-    
-    tour, tour_date = result
-    
-    return TourDetailResponse(
-        name=tour.name,
-        slug=tour.slug,
-        description=tour.description,
-        additional_description=tour.additional_description,
-        duration=tour.duration,
-        cost=tour.cost,
-        additional_cost=tour.additional_cost,
-        meeting_point=tour.meeting_point,
-        max_capacity=tour.max_capacity,
-        date=tour_date.date,
-        time=tour_date.time,
-        date_id=tour_date.id,
-    )
 
+    return ModelResponse(dict(row._mapping))
@@ -0,0 +1,199 @@
+"""
+Response compression middleware.
+
+Compresses complete (non-streaming) responses with brotli or gzip, depending
+on the client's Accept-Encoding. Compressed bodies are kept in a small LRU
+cache keyed by a digest of the uncompressed body, so hot list responses that
+do not change between requests are compressed once.
+"""
+import gzip
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Map each encoding named in an Accept-Encoding header to its quality."""
+    offered: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        offered[name] = quality
+    return offered
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported encoding from an Accept-Encoding header."""
+    offered = parse_accept_encoding(accept_encoding)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    for encoding in candidates:
+        if offered.get(encoding, offered.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def vary_fields(headers: MutableHeaders) -> set[str]:
+    """Lower-cased header names listed in the Vary header(s)."""
+    return {
+        field.strip().lower()
+        for value in headers.getlist("vary")
+        for field in value.split(",")
+    }
+
+
+def compress(body: bytes, encoding: str, *, gzip_level: int, brotli_quality: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressedBodyCache:
+    """LRU cache of compressed bodies keyed by (encoding, body digest)."""
+
+    def __init__(self, max_entries: int = 256, max_body_size: int = 4 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_body_size = max_body_size
+        self._entries: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+
+    def get_or_compress(
+        self, body: bytes, encoding: str, *, gzip_level: int, brotli_quality: int
+    ) -> bytes:
+        if self.max_entries <= 0 or len(body) > self.max_body_size:
+            return compress(
+                body, encoding, gzip_level=gzip_level, brotli_quality=brotli_quality
+            )
+
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            return cached
+
+        compressed = compress(
+            body, encoding, gzip_level=gzip_level, brotli_quality=brotli_quality
+        )
+        self._entries[key] = compressed
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return compressed
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CompressionMiddleware:
+    """
+    Compress JSON/text responses above `minimum_size` bytes.
+
+    Streaming responses (bodies sent in several chunks, e.g. StaticFiles) are
+    passed through untouched so their memory use stays bounded, and so are
+    partial (206 / Content-Range) responses and anything under
+    `exclude_path_prefixes` (e.g. /blog-media, which has its own variants).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        cache_size: int = 256,
+        exclude_path_prefixes: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.exclude_path_prefixes = tuple(exclude_path_prefixes)
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = CompressedBodyCache(max_entries=cache_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (
+            self.exclude_path_prefixes
+            and scope["path"].startswith(self.exclude_path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            assert start_message is not None
+            body: bytes = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+
+            if message.get("more_body", False) or not self._should_compress(
+                start_message["status"], headers, body
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self.cache.get_or_compress(
+                body,
+                encoding,
+                gzip_level=self.gzip_level,
+                brotli_quality=self.brotli_quality,
+            )
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            if "accept-encoding" not in vary_fields(headers):
+                headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, status: int, headers: MutableHeaders, body: bytes) -> bool:
+        if len(body) < self.minimum_size or "content-encoding" in headers:
+            return False
+        # Content-Range refers to the uncompressed representation
+        if status == 206 or "content-range" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
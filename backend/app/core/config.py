@@ -99,6 +99,20 @@ class Settings(BaseSettings):
             fill_if_empty("POSTGRES_DB", dbname)
         return merged
 
+    # Connection pool / statement cache settings (see app/core/db.py)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_QUERY_CACHE_SIZE: int = 500
+    # psycopg prepares a query server-side once its SQL text has run this
+    # many times on a connection (psycopg's default is 5). With 1, every
+    # query text seen twice is prepared, ORM queries included; the hot
+    # statements (app/core/statements.py) on their second run. psycopg keeps
+    # at most 100 prepared per connection and evicts the least recently used
+    DB_PREPARE_THRESHOLD: int = 1
+    # Execute the hot statements once at startup
+    DB_WARMUP_ENABLED: bool = True
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
@@ -157,6 +171,36 @@ class Settings(BaseSettings):
         )
 
         return self
+    # Response compression (see app/core/compression.py)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CACHE_SIZE: int = 256
+
+    # Request timing / DB query metrics (see app/core/metrics.py): /metrics
+    # endpoint and Server-Timing response header
+    METRICS_ENABLED: bool = True
+
+    # N+1 detector / slow-query log (see app/core/querydebug.py), for
+    # development and test runs
+    QUERY_DEBUG: bool = False
+    # Statement shapes repeated this many times in one request/script are reported
+    QUERY_DEBUG_REPEAT_THRESHOLD: int = 5
+    SLOW_QUERY_MS: int = 200
+
+    # /blog-media (see app/core/static.py): when set, e.g. to
+    # "/_blog_media_internal", responses only carry an X-Accel-Redirect to this
+    # nginx internal location and nginx sends the file itself
+    MEDIA_ACCEL_REDIRECT_PREFIX: str | None = None
+
+    # Mount the sqladmin panel at /admin; off on API-only workers for a
+    # faster cold start
+    ADMIN_ENABLED: bool = True
+
+    # /events/facets counts are recomputed at most this often
+    EVENT_FACETS_CACHE_SECONDS: int = 300
+    # Move the event occurrence window forward at startup when it runs short
+    # (crud.ensure_event_occurrences_current)
+    EVENT_OCCURRENCES_REFRESH_ON_STARTUP: bool = True
+
     # feature flag registration
     feature_registration_enabled: bool = False
     FEATURE_SHOW_EVENTS: bool = False
@@ -1,10 +1,62 @@
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy.engine import URL, make_url
 from sqlmodel import Session, create_engine, select
 
-from app import crud
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.querydebug import install_query_debug
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+# Local port of the SSH tunnel to the VPS database (5432 is left free for a
+# local PostgreSQL)
+SSH_TUNNEL_PORT = 5433
+
+
+def needs_ssh_tunnel() -> bool:
+    """Local development against the remote database goes through an SSH tunnel."""
+    return settings.ENVIRONMENT == "local" and settings.POSTGRES_SERVER not in (
+        "localhost",
+        "127.0.0.1",
+    )
+
+
+def get_database_url(host: str | None = None, port: int | None = None) -> URL:
+    url = make_url(str(settings.SQLALCHEMY_DATABASE_URI))
+    return url.set(host=host or url.host, port=port or url.port)
+
+
+def create_db_engine(
+    host: str | None = None, port: int | None = None, **options: Any
+) -> Engine:
+    """
+    Create an engine with the app's pool, statement cache and psycopg
+    prepared-statement settings. `host`/`port` override the configured
+    server, e.g. to go through the SSH tunnel. Callers that create their own
+    engine are responsible for calling `engine.dispose()`.
+    """
+    engine_options: dict[str, Any] = {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        "connect_args": {"prepare_threshold": settings.DB_PREPARE_THRESHOLD},
+    }
+    engine_options.update(options)
+    engine = create_engine(get_database_url(host, port), **engine_options)
+    instrument_engine(engine)
+    install_query_debug(engine)
+    return engine
+
+
+def create_tunnel_engine(**options: Any) -> Engine:
+    """Engine for the remote database through `ssh_tunnel(SSH_TUNNEL_PORT)`."""
+    return create_db_engine(host="127.0.0.1", port=SSH_TUNNEL_PORT, **options)
+
+
+engine = create_tunnel_engine() if needs_ssh_tunnel() else create_db_engine()
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
@@ -30,4 +82,6 @@ def init_db(session: Session) -> None:
             password=settings.FIRST_SUPERUSER_PASSWORD,
             is_superuser=True,
         )
+        from app import crud
+
         user = crud.create_user(session=session, user_create=user_in)
@@ -0,0 +1,74 @@
+"""
+Streaming table export as NDJSON or CSV.
+
+Rows are read through a server-side cursor (`yield_per`), EXPORT_BATCH_SIZE
+at a time, and each batch is encoded into one chunk before the next is
+fetched, so memory stays flat whatever the table size. Used by
+/api/v1/export/{name} (app/api/routes/export.py) and scripts/export_data.py.
+"""
+import csv
+import io
+import json
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import date
+from typing import Any, Literal
+
+import sqlalchemy as sa
+from pydantic_core import to_json
+from sqlalchemy.engine import Engine
+
+from app.models import BlogPost, Contact, Event
+
+ExportName = Literal["events", "contacts", "blog-posts"]
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_TABLES: dict[str, sa.Table] = {
+    "events": Event.__table__,  # type: ignore[attr-defined]
+    "contacts": Contact.__table__,  # type: ignore[attr-defined]
+    "blog-posts": BlogPost.__table__,  # type: ignore[attr-defined]
+}
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+EXPORT_BATCH_SIZE = 1000
+
+
+def export_filename(name: str, fmt: str, today: date | None = None) -> str:
+    return f"{name}-{(today or date.today()).isoformat()}.{fmt}"
+
+
+def _csv_value(value: Any) -> Any:
+    # JSON columns (tags, source_urls) stay parseable in a single cell
+    if isinstance(value, list | dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def encode_ndjson(rows: Sequence[Mapping[str, Any]]) -> bytes:
+    return b"".join(to_json(dict(row)) + b"\n" for row in rows)
+
+
+def encode_csv(rows: Sequence[Mapping[str, Any]], columns: Sequence[str] | None = None) -> bytes:
+    """CSV lines for `rows`; with `columns`, the header line comes first."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if columns is not None:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(row[key]) for key in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def iter_export(
+    engine: Engine, name: str, fmt: str, *, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Encoded chunks of the whole `name` table, one per batch, in id order."""
+    table = EXPORT_TABLES[name]
+    columns = [column.name for column in table.columns]
+    if fmt == "csv":
+        # The header goes out even for an empty table
+        yield encode_csv([], columns)
+    encode = encode_csv if fmt == "csv" else encode_ndjson
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(
+            sa.select(table).order_by(table.c.id)
+        )
+        for batch in result.mappings().partitions():
+            yield encode(batch)
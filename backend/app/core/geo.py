@@ -0,0 +1,116 @@
+"""
+Offline geocoding and "near" queries.
+
+Coordinates come from a local gazetteer (app/data/gazetteer_buenos_aires.csv:
+landmarks, barrios and nearby cities with their aliases), so geocoding
+needs no network: the most specific place named in an event's venue /
+address / neighborhood, or a tour's meeting point, wins.
+
+Distance queries use Postgres' cube + earthdistance extensions: the
+migration adds a GiST index on `ll_to_earth(latitude, longitude)`, which
+`near_filter` hits with an `earth_box` bounding-box test before the exact
+`earth_distance` check.
+"""
+import csv
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import sqlalchemy as sa
+
+GAZETTEER_PATH = Path(__file__).resolve().parents[1] / "data" / "gazetteer_buenos_aires.csv"
+# Most specific first
+PLACE_KINDS = ("landmark", "neighborhood", "city")
+
+# Default and largest accepted `radius` of a near query, in meters
+DEFAULT_NEAR_RADIUS_M = 2000
+MAX_NEAR_RADIUS_M = 50_000
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    kind: str
+    latitude: float
+    longitude: float
+
+
+def normalize(text: str) -> str:
+    """Lowercase, accents stripped, words separated by single spaces."""
+    ascii_text = (
+        unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    )
+    return _NON_WORD_RE.sub(" ", ascii_text.lower()).strip()
+
+
+@cache
+def load_gazetteer(path: Path = GAZETTEER_PATH) -> dict[str, list[tuple[str, Place]]]:
+    """Normalized aliases per place kind, longest alias first."""
+    by_kind: dict[str, list[tuple[str, Place]]] = {kind: [] for kind in PLACE_KINDS}
+    with path.open(encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            place = Place(
+                name=row["name"],
+                kind=row["kind"],
+                latitude=float(row["latitude"]),
+                longitude=float(row["longitude"]),
+            )
+            names = [row["name"], *filter(None, row["aliases"].split("|"))]
+            by_kind[place.kind].extend((normalize(name), place) for name in names)
+    for aliases in by_kind.values():
+        aliases.sort(key=lambda item: -len(item[0]))
+    return by_kind
+
+
+def geocode(*texts: str | None) -> Place | None:
+    """
+    The most specific gazetteer place named in any of `texts` (whole-word
+    match, accents and case ignored), or None.
+    """
+    padded = [f" {normalize(text)} " for text in texts if text]
+    if not padded:
+        return None
+    for aliases in load_gazetteer().values():
+        for alias, place in aliases:
+            if any(f" {alias} " in text for text in padded):
+                return place
+    return None
+
+
+def parse_near(value: str) -> tuple[float, float]:
+    """Parse a `lat,lng` query value; ValueError if malformed or out of range."""
+    lat_text, sep, lng_text = value.partition(",")
+    if not sep:
+        raise ValueError("expected lat,lng")
+    latitude, longitude = float(lat_text), float(lng_text)
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError("coordinates out of range")
+    return latitude, longitude
+
+
+def near_filter(latitude: Any, longitude: Any) -> Any:
+    """
+    Rows within `radius` meters of (`near_lat`, `near_lng`); all three are
+    bind parameters, see `near_params`.
+    """
+    origin = sa.func.ll_to_earth(
+        sa.bindparam("near_lat", type_=sa.Float), sa.bindparam("near_lng", type_=sa.Float)
+    )
+    location = sa.func.ll_to_earth(latitude, longitude)
+    radius = sa.bindparam("radius", type_=sa.Float)
+    return sa.and_(
+        # Matches the partial index predicate
+        latitude.is_not(None),
+        longitude.is_not(None),
+        sa.func.earth_box(origin, radius).op("@>", is_comparison=True)(location),
+        sa.func.earth_distance(origin, location) <= radius,
+    )
+
+
+def near_params(near: tuple[float, float], radius: float) -> dict[str, float]:
+    return {"near_lat": near[0], "near_lng": near[1], "radius": radius}
@@ -0,0 +1,102 @@
+"""
+Blog media storage: images converted to WebP on disk under
+BLOG_MEDIA_ROOT/{slug}/, referenced by their /blog-media/... URL.
+
+Shared by the docx importer (make_convert_image) and the admin upload
+fields. Pillow is imported on first use.
+"""
+import base64
+import binascii
+import io
+import re
+import shutil
+import uuid
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+BLOG_MEDIA_ROOT = Path(__file__).resolve().parents[2] / "data" / "blog_media"
+BLOG_MEDIA_URL_PREFIX = "/blog-media"
+
+# Optional downscale for large raster images
+MAX_IMAGE_PIXELS = 1200
+WEBP_QUALITY = 75
+
+# data:image/png;base64,.... inside HTML attributes or Markdown image links
+_DATA_URI_RE = re.compile(r"data:image/[\w.+-]+;base64,([A-Za-z0-9+/=\s]+)")
+
+
+def prepare_image_for_webp(source: bytes | IO[bytes]) -> "Image.Image":
+    """
+    Open an image and bring it to an RGB(A) mode WebP can store, downscaled
+    to MAX_IMAGE_PIXELS. `source` may be a (spooled) file, which Pillow
+    reads lazily instead of needing the whole upload in memory.
+    """
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+    # JPEG can decode straight at a reduced scale
+    img.draft("RGB", (MAX_IMAGE_PIXELS, MAX_IMAGE_PIXELS))
+    if img.mode not in ("RGB", "RGBA"):
+        if img.mode == "P" and "transparency" in img.info:
+            img = img.convert("RGBA")
+        else:
+            img = img.convert("RGB")
+    w, h = img.size
+    if max(w, h) > MAX_IMAGE_PIXELS:
+        img.thumbnail((MAX_IMAGE_PIXELS, MAX_IMAGE_PIXELS), Image.Resampling.LANCZOS)
+    return img
+
+
+def encode_webp(source: bytes | IO[bytes]) -> bytes:
+    """WebP bytes for an image; raises OSError if it can't be decoded."""
+    out = io.BytesIO()
+    prepare_image_for_webp(source).save(out, format="WEBP", quality=WEBP_QUALITY)
+    return out.getvalue()
+
+
+def public_url(slug: str, filename: str) -> str:
+    return f"{BLOG_MEDIA_URL_PREFIX}/{slug}/{filename}"
+
+
+def store_image(source: bytes | IO[bytes], slug: str, root: Path = BLOG_MEDIA_ROOT) -> str:
+    """
+    Store an image for `slug` as WebP and return its public URL. Anything
+    Pillow can't decode is stored as-is with a .bin name, like the importer
+    does.
+    """
+    post_dir = root / slug
+    post_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        payload = encode_webp(source)
+    except OSError:
+        filename = f"{uuid.uuid4().hex}.bin"
+        if isinstance(source, bytes):
+            (post_dir / filename).write_bytes(source)
+        else:
+            source.seek(0)
+            with (post_dir / filename).open("wb") as f:
+                shutil.copyfileobj(source, f)
+        return public_url(slug, filename)
+
+    filename = f"{uuid.uuid4().hex}.webp"
+    (post_dir / filename).write_bytes(payload)
+    return public_url(slug, filename)
+
+
+def inline_images_to_references(content: str, slug: str, root: Path = BLOG_MEDIA_ROOT) -> str:
+    """
+    Replace base64 `data:image/...` URIs in HTML/Markdown content with
+    stored WebP files, so the content only carries /blog-media references.
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        try:
+            raw = base64.b64decode(re.sub(r"\s+", "", match.group(1)), validate=True)
+        except (binascii.Error, ValueError):
+            return match.group(0)
+        return store_image(raw, slug, root)
+
+    return _DATA_URI_RE.sub(replace, content)
@@ -0,0 +1,249 @@
+"""
+Request timing and database query instrumentation.
+
+`MetricsMiddleware` times every HTTP request and records a latency histogram
+per (method, route template, status). `instrument_engine` hooks SQLAlchemy's
+cursor events so every statement executed while a request is in flight is
+counted against it. Both are exposed as Prometheus text on `/metrics` and,
+per response, as a `Server-Timing` header, e.g.
+
+    Server-Timing: app;dur=12.4, db;dur=3.1;desc="4 queries"
+
+A route whose query count per request keeps growing with the data (the
+`db_queries` histogram) is the usual sign of an N+1.
+"""
+import bisect
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# Label for requests that did not match a route (404s, mounted apps), so
+# arbitrary paths can't blow up the number of series
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class RequestStats:
+    """Database work done while handling the current request."""
+
+    queries: int = 0
+    db_time: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Thread-safe in-process store for the request and query metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: dict[tuple[str, str, str], Histogram] = {}
+        self._db_queries: dict[str, Histogram] = {}
+        self._db_time: dict[str, float] = {}
+
+    def record_request(
+        self, method: str, route: str, status: int, duration: float, stats: RequestStats
+    ) -> None:
+        with self._lock:
+            key = (method, route, str(status))
+            latency = self._latency.get(key)
+            if latency is None:
+                latency = self._latency[key] = Histogram(LATENCY_BUCKETS)
+            latency.observe(duration)
+
+            queries = self._db_queries.get(route)
+            if queries is None:
+                queries = self._db_queries[route] = Histogram(QUERY_COUNT_BUCKETS)
+            queries.observe(stats.queries)
+            self._db_time[route] = self._db_time.get(route, 0.0) + stats.db_time
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency.clear()
+            self._db_queries.clear()
+            self._db_time.clear()
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            lines += [
+                "# HELP http_request_duration_seconds HTTP request latency by route.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route, status), histogram in sorted(self._latency.items()):
+                labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+                lines += _histogram_lines("http_request_duration_seconds", labels, histogram)
+
+            lines += [
+                "# HELP http_request_db_queries Database queries per HTTP request by route.",
+                "# TYPE http_request_db_queries histogram",
+            ]
+            for route, histogram in sorted(self._db_queries.items()):
+                labels = f'route="{_escape(route)}"'
+                lines += _histogram_lines("http_request_db_queries", labels, histogram)
+
+            lines += [
+                "# HELP http_request_db_seconds_total Time spent in database queries by route.",
+                "# TYPE http_request_db_seconds_total counter",
+            ]
+            for route, seconds in sorted(self._db_time.items()):
+                lines.append(f'http_request_db_seconds_total{{route="{_escape(route)}"}} {seconds}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> list[str]:
+    lines = []
+    cumulative = 0
+    # The last count (values above every bound) only shows up in +Inf
+    for bound, count in zip(histogram.buckets, histogram.counts[:-1], strict=True):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+registry = MetricsRegistry()
+
+
+@dataclass
+class ExecutedStatement:
+    """A statement run on an instrumented engine, with its wall time."""
+
+    cursor: Any
+    statement: str
+    parameters: Any
+    executemany: bool
+    elapsed: float
+
+
+# Called after every statement of every instrumented engine; the query
+# debugger (app/core/querydebug.py) adds itself here too
+_statement_observers: list[Callable[[ExecutedStatement], None]] = []
+
+
+def observe_statements(observer: Callable[[ExecutedStatement], None]) -> None:
+    if observer not in _statement_observers:
+        _statement_observers.append(observer)
+
+
+def _before_cursor_execute(conn, *_args):  # type: ignore[no-untyped-def]
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, _context, executemany):  # type: ignore[no-untyped-def]
+    executed = ExecutedStatement(
+        cursor=cursor,
+        statement=statement,
+        parameters=parameters,
+        executemany=executemany,
+        elapsed=time.perf_counter() - conn.info["query_start_time"].pop(),
+    )
+    for observer in _statement_observers:
+        observer(executed)
+
+
+def _count_against_request(executed: ExecutedStatement) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += executed.elapsed
+
+
+observe_statements(_count_against_request)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement of `engine` once and hand it to the statement
+    observers; by default that counts queries and DB time against the
+    current request.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """
+    Time HTTP requests, record them in `registry` and add a Server-Timing
+    header. Add it last so it wraps the other middleware.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: MetricsRegistry = registry,
+        server_timing: bool = True,
+    ) -> None:
+        self.app = app
+        self.metrics = metrics
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f"app;dur={elapsed_ms:.1f}, "
+                        f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries"',
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = getattr(scope.get("route"), "path_format", None) or UNMATCHED_ROUTE
+            self.metrics.record_request(
+                scope["method"], route, status, time.perf_counter() - started, stats
+            )
@@ -0,0 +1,167 @@
+"""
+N+1 detector and slow-query log.
+
+`track_queries(label)` groups the statements executed inside it by shape
+(whitespace collapsed, literals replaced with `?`). With QUERY_DEBUG on, a
+shape executed QUERY_DEBUG_REPEAT_THRESHOLD times or more is logged as a
+possible N+1 when the block exits, and every query slower than
+SLOW_QUERY_MS is logged with its bound parameters and EXPLAIN plan.
+
+QueryDebugMiddleware wraps each request in `track_queries` (it is only
+added when QUERY_DEBUG is on); scripts wrap their run the same way. Tests
+use the tracker directly to assert a query budget, see
+`tests/utils/queries.py`.
+"""
+import logging
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import ExecutedStatement, instrument_engine, observe_statements
+
+logger = logging.getLogger("app.queries")
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN \((?:\?|%\(\w+\)s|%s)(?:, (?:\?|%\(\w+\)s|%s))*\)", re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so repeats with different literals group together."""
+    shape = _WHITESPACE_RE.sub(" ", statement).strip()
+    shape = _STRING_LITERAL_RE.sub("?", shape)
+    shape = _NUMBER_LITERAL_RE.sub("?", shape)
+    return _IN_LIST_RE.sub("IN (...)", shape)
+
+
+@dataclass
+class QueryTracker:
+    label: str
+    statements: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return sum(self.statements.values())
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed at least `threshold` times, most frequent first."""
+        return [
+            (shape, count)
+            for shape, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def summary(self) -> str:
+        return "\n".join(
+            f"  {count}× {shape}" for shape, count in self.statements.most_common()
+        )
+
+
+_tracker: ContextVar[QueryTracker | None] = ContextVar("query_tracker", default=None)
+# Trackers that see queries from every thread, e.g. a test asserting on
+# requests the TestClient runs in its own event loop thread
+_process_trackers: list[QueryTracker] = []
+_process_trackers_lock = threading.Lock()
+
+
+@contextmanager
+def track_queries(label: str, *, process_wide: bool = False) -> Iterator[QueryTracker]:
+    tracker = QueryTracker(label)
+    if process_wide:
+        with _process_trackers_lock:
+            _process_trackers.append(tracker)
+        token = None
+    else:
+        token = _tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        if token is None:
+            with _process_trackers_lock:
+                _process_trackers.remove(tracker)
+        else:
+            _tracker.reset(token)
+        if settings.QUERY_DEBUG:
+            report_repeated(tracker)
+
+
+def report_repeated(
+    tracker: QueryTracker, threshold: int | None = None
+) -> list[tuple[str, int]]:
+    repeated = tracker.repeated(threshold or settings.QUERY_DEBUG_REPEAT_THRESHOLD)
+    for shape, count in repeated:
+        logger.warning("Possible N+1 in %s: %d× %s", tracker.label, count, shape)
+    return repeated
+
+
+def _explain(cursor: Any, statement: str, parameters: Any) -> str:
+    # Plain SELECTs only: EXPLAIN without ANALYZE does not run the query,
+    # and a raw DBAPI cursor keeps this out of the engine events
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return ""
+    try:
+        with cursor.connection.cursor() as explain_cursor:
+            explain_cursor.execute("EXPLAIN " + statement, parameters)
+            return "\n".join(row[0] for row in explain_cursor.fetchall())
+    except Exception as e:
+        return f"(EXPLAIN failed: {e})"
+
+
+def _record_statement(executed: ExecutedStatement) -> None:
+    tracker = _tracker.get()
+    if tracker is not None or _process_trackers:
+        shape = statement_shape(executed.statement)
+        if tracker is not None:
+            tracker.statements[shape] += 1
+        with _process_trackers_lock:
+            for process_tracker in _process_trackers:
+                process_tracker.statements[shape] += 1
+
+    elapsed_ms = executed.elapsed * 1000
+    if settings.QUERY_DEBUG and elapsed_ms >= settings.SLOW_QUERY_MS:
+        plan = (
+            ""
+            if executed.executemany
+            else _explain(executed.cursor, executed.statement, executed.parameters)
+        )
+        logger.warning(
+            "Slow query (%.0f ms): %s\n  parameters: %r%s",
+            elapsed_ms,
+            executed.statement,
+            executed.parameters,
+            f"\n{plan}" if plan else "",
+        )
+
+
+def install_query_debug(engine: Engine) -> None:
+    """
+    Feed `engine`'s statements to the active trackers and the slow-query log,
+    through the same timing hooks as the request metrics.
+    """
+    instrument_engine(engine)
+    observe_statements(_record_statement)
+
+
+class QueryDebugMiddleware:
+    """Group each request's queries and report repeated statement shapes."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
@@ -0,0 +1,29 @@
+"""
+Session middleware limited to a few path prefixes.
+
+Starlette's SessionMiddleware decodes (and re-signs) the session cookie on
+every request it wraps. The public API only needs a session on the OAuth
+routes, so everything else skips it.
+"""
+from collections.abc import Iterable
+from typing import Any
+
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ScopedSessionMiddleware:
+    def __init__(
+        self, app: ASGIApp, path_prefixes: Iterable[str], **session_options: Any
+    ) -> None:
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+        self.session_app = SessionMiddleware(app, **session_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and scope["path"].startswith(
+            self.path_prefixes
+        ):
+            await self.session_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
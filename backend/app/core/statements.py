@@ -0,0 +1,71 @@
+"""
+Hot read statements, built once and warmed at startup.
+
+Routes on the hot path build their `select(...)` at import time with
+`bindparam()` placeholders for everything that varies per request
+(pagination, slugs, today's date) and register it with `hot_statement()`.
+A statement object built once memoizes its cache key, so per request
+SQLAlchemy skips building the chain and goes straight to its compiled
+cache; the SQL text is identical on every execution, so psycopg prepares
+it server-side after DB_PREPARE_THRESHOLD executions and Postgres reuses
+the plan.
+
+`warm_up_statements()` runs every registered statement once from the
+lifespan, so the first requests of a new worker don't pay for ORM
+compilation.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from sqlalchemy import Engine
+from sqlalchemy.sql import Executable
+from sqlmodel import Session
+
+logger = logging.getLogger("app.statements")
+
+StatementT = TypeVar("StatementT", bound=Executable)
+
+
+@dataclass(frozen=True)
+class HotStatement:
+    name: str
+    statement: Executable
+    # Sample values for the statement's bind parameters, used by the warm-up
+    warmup_params: dict[str, Any]
+
+
+_hot_statements: dict[str, HotStatement] = {}
+
+
+def hot_statement(name: str, statement: StatementT, **warmup_params: Any) -> StatementT:
+    """Register `statement` for warm-up and return it unchanged."""
+    _hot_statements[name] = HotStatement(name, statement, warmup_params)
+    return statement
+
+
+def hot_statements() -> list[HotStatement]:
+    return list(_hot_statements.values())
+
+
+def warm_up_statements(engine: Engine) -> dict[str, float]:
+    """
+    Execute every hot statement once. Returns the time each took, in ms;
+    a failing statement is logged and skipped so it can't block startup.
+    """
+    timings: dict[str, float] = {}
+    with Session(engine) as session:
+        for hot in hot_statements():
+            started = time.perf_counter()
+            try:
+                session.exec(hot.statement, params=hot.warmup_params).all()  # type: ignore[call-overload]
+            except Exception as e:
+                logger.warning("Warm-up of %s failed: %s", hot.name, e)
+                session.rollback()
+                continue
+            timings[hot.name] = (time.perf_counter() - started) * 1000
+    logger.info(
+        "Warmed up %d statements in %.0f ms", len(timings), sum(timings.values())
+    )
+    return timings
@@ -0,0 +1,101 @@
+"""
+Static file serving for /blog-media.
+
+Media filenames are unique (see app/core/media.py) and never rewritten, so
+MediaFiles marks every response `immutable` with a one-year max-age. On top
+of what StaticFiles already does (ETag / Last-Modified revalidation, Range
+requests; the body is read and sent in 64 KB chunks by FileResponse):
+
+- SVG/text files are served from a pre-generated `<name>.br` / `<name>.gz`
+  sibling when the client accepts that encoding (the siblings are written by
+  scripts/precompress_media.py; /blog-media is excluded from
+  CompressionMiddleware, see app/main.py);
+- with `accel_redirect_prefix` set, the response carries no body, only an
+  `X-Accel-Redirect` header naming the file under an nginx `internal`
+  location, so nginx sends the bytes (and the variants, via gzip_static)
+  with sendfile and the worker is freed right away.
+"""
+import mimetypes
+import os
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+from app.core.compression import COMPRESSIBLE_CONTENT_TYPES, parse_accept_encoding
+
+# Pre-generated variants in order of preference: (content-coding, file suffix)
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+MEDIA_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def precompressed_variant(
+    path: Path, accept_encoding: str
+) -> tuple[Path, os.stat_result, str] | None:
+    """The best existing `.br` / `.gz` sibling of `path` the client accepts."""
+    offered = parse_accept_encoding(accept_encoding)
+    for encoding, suffix in PRECOMPRESSED_VARIANTS:
+        if offered.get(encoding, offered.get("*", 0.0)) <= 0:
+            continue
+        variant = path.with_name(path.name + suffix)
+        try:
+            return variant, variant.stat(), encoding
+        except OSError:
+            continue
+    return None
+
+
+class MediaFiles(StaticFiles):
+    def __init__(
+        self,
+        *,
+        directory: PathLike,
+        max_age: int = MEDIA_MAX_AGE,
+        accel_redirect_prefix: str | None = None,
+    ) -> None:
+        super().__init__(directory=directory)
+        self.root = Path(directory).resolve()
+        self.cache_control = f"public, max-age={max_age}, immutable"
+        self.accel_redirect_prefix = (
+            accel_redirect_prefix.rstrip("/") + "/" if accel_redirect_prefix else None
+        )
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        path = Path(full_path)
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        headers = {"Cache-Control": self.cache_control}
+
+        if self.accel_redirect_prefix is not None:
+            # nginx handles conditional and Range requests and picks the
+            # .gz/.br variant itself (gzip_static / brotli_static)
+            relative = path.resolve().relative_to(self.root).as_posix()
+            headers["X-Accel-Redirect"] = self.accel_redirect_prefix + relative
+            return Response(status_code=status_code, headers=headers, media_type=media_type)
+
+        if media_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+            headers["Vary"] = "Accept-Encoding"
+            variant = precompressed_variant(
+                path, request_headers.get("accept-encoding", "")
+            )
+            if variant is not None:
+                path, stat_result, headers["Content-Encoding"] = variant
+
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -1,11 +1,15 @@
 import uuid
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy import delete, insert
+from sqlmodel import Session, col, func, select
 
 from app.core.security import get_password_hash, verify_password
 from app.models import (
+    Event,
+    EventOccurrence,
     OAuthAccount,
     User,
     UserCreate,
@@ -240,3 +244,116 @@ def get_or_create_user_from_google(
         expires_at=expires_at,
     )
     return new_user
+
+
+# Long-term events get occurrences at most this many days ahead (and past
+# ones are kept this far back). The window is moved forward by
+# `ensure_event_occurrences_current` (at startup, see app/main.py) or
+# `seed_events.py --refresh-occurrences`
+EVENT_OCCURRENCE_HORIZON_DAYS = 180
+# ...once it is this many days short of the full horizon
+EVENT_OCCURRENCE_REFRESH_DAYS = 30
+# pg_advisory_xact_lock key serializing concurrent refreshes
+EVENT_OCCURRENCE_REFRESH_LOCK = 4_401_180
+
+
+def event_occurrence_dates(event: Event, *, today: date | None = None) -> list[date]:
+    """Every day `event` takes place, within the occurrence horizon."""
+    today = today or date.today()
+    horizon = timedelta(days=EVENT_OCCURRENCE_HORIZON_DAYS)
+
+    first = event.start_date
+    if event.is_long_term:
+        first = max(first, today - horizon)
+    last = event.end_date or (today + horizon if event.is_long_term else event.start_date)
+    last = min(last, max(event.start_date, today) + horizon)
+    # A long-term event that ended before the window has no occurrences
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def sync_event_occurrences(
+    *, session: Session, events: Sequence[Event], today: date | None = None
+) -> int:
+    """
+    Replace the occurrences of `events` (which must have ids, i.e. be
+    flushed) with freshly generated ones, in one delete and one batched
+    insert. Returns the number of rows written; the caller commits.
+    """
+    event_ids = [event.id for event in events if event.id is not None]
+    if not event_ids:
+        return 0
+    rows = [
+        {"event_id": event.id, "date": day, "start_time_local": event.start_time_local}
+        for event in events
+        if event.id is not None
+        for day in event_occurrence_dates(event, today=today)
+    ]
+    session.exec(  # type: ignore[call-overload]
+        delete(EventOccurrence).where(col(EventOccurrence.event_id).in_(event_ids))
+    )
+    if rows:
+        session.exec(insert(EventOccurrence), params=rows)  # type: ignore[call-overload]
+    return len(rows)
+
+
+def refresh_event_occurrences(*, session: Session, today: date | None = None) -> int:
+    """Regenerate the occurrences of every event."""
+    events = session.exec(select(Event)).all()
+    return sync_event_occurrences(session=session, events=events, today=today)
+
+
+def _stale_long_term_events(session: Session, *, today: date, due: date) -> int:
+    """
+    Number of long-term events whose stored occurrences end before
+    min(end_date, `due`) while that day is still inside their window, i.e.
+    open-ended or far-ending events the window has to be moved for.
+    """
+    horizon = timedelta(days=EVENT_OCCURRENCE_HORIZON_DAYS)
+    per_event = (
+        select(
+            col(Event.start_date),
+            func.least(func.coalesce(col(Event.end_date), due), due).label("wanted"),
+            func.max(EventOccurrence.date).label("last"),
+        )
+        .select_from(Event)
+        .outerjoin(EventOccurrence, col(EventOccurrence.event_id) == col(Event.id))
+        .where(col(Event.is_long_term).is_(True))
+        .group_by(col(Event.id))
+        .subquery()
+    )
+    return session.exec(
+        select(func.count()).where(
+            func.coalesce(per_event.c.last, date.min) < per_event.c.wanted,
+            per_event.c.wanted >= func.greatest(per_event.c.start_date, today - horizon),
+        )
+    ).one()
+
+
+def ensure_event_occurrences_current(
+    *, session: Session, today: date | None = None
+) -> bool:
+    """
+    Regenerate every event's occurrences if the stored occurrences of a
+    long-term event end less than EVENT_OCCURRENCE_HORIZON_DAYS -
+    EVENT_OCCURRENCE_REFRESH_DAYS days after `today` (or before its
+    end_date, if that comes first). Concurrent callers (several workers)
+    wait on an advisory lock and re-check. Commits; returns whether a
+    refresh happened.
+    """
+    today = today or date.today()
+    due = today + timedelta(
+        days=EVENT_OCCURRENCE_HORIZON_DAYS - EVENT_OCCURRENCE_REFRESH_DAYS
+    )
+
+    def stale() -> bool:
+        return _stale_long_term_events(session, today=today, due=due) > 0
+
+    if not stale():
+        return False
+    session.exec(select(func.pg_advisory_xact_lock(EVENT_OCCURRENCE_REFRESH_LOCK)))
+    if not stale():
+        session.commit()
+        return False
+    refresh_event_occurrences(session=session, today=today)
+    session.commit()
+    return True
@@ -1,114 +1,188 @@
-from pathlib import Path
+"""
+ASGI application factories.
+
+- `create_public_app()`: the JSON API, /metrics and /blog-media. No admin
+  middleware; a session cookie is only decoded on the Google OAuth routes.
+- `create_admin_app()`: only the SQLAdmin panel at /admin, with its session
+  middleware and the 50 MB multipart limit for admin forms.
+- `create_app()`: both in one process (the admin part only when
+  ADMIN_ENABLED), as `app` below for `fastapi run app/main.py`.
+
+Public and admin workers can be deployed separately, e.g.
+
+    uvicorn --factory app.main:create_public_app --workers 4
+    uvicorn --factory app.main:create_admin_app
+"""
+import logging
+from contextlib import asynccontextmanager
 
-import sentry_sdk
-from fastapi import FastAPI, Request
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.routing import APIRoute
+from sqlmodel import Session
 from starlette.middleware.cors import CORSMiddleware
-from starlette.staticfiles import StaticFiles
-from starlette.formparsers import MultiPartParser
-from starlette.requests import Request as StarletteRequest
 
+from app import crud
 from app.api.main import api_router
+from app.api.responses import ORJSONResponse
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.admin import setup_admin
-
+from app.core.db import SSH_TUNNEL_PORT, engine, needs_ssh_tunnel
+from app.core.media import BLOG_MEDIA_ROOT
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.querydebug import QueryDebugMiddleware
+from app.core.sessions import ScopedSessionMiddleware
+from app.core.statements import warm_up_statements
+from app.core.static import MediaFiles
 
-from contextlib import asynccontextmanager
-from app.ssh_util import ssh_tunnel
-
-# Increase max_part_size for multipart forms globally
-# This allows larger content (e.g., HTML with Base64 images) in admin panel
-# Default is 1024KB, we increase it to 50MB
-# Store original form method
-_original_form = StarletteRequest.form
-
-async def _custom_form(self: StarletteRequest):
-    """Custom form method with increased max_part_size."""
-    # Only parse form data for POST/PUT/PATCH requests with Content-Type header
-    if self.method not in ("POST", "PUT", "PATCH"):
-        return await _original_form(self)
-    
-    # Check if Content-Type header exists
-    content_type = self.headers.get("Content-Type", "")
-    if not content_type or "multipart/form-data" not in content_type:
-        return await _original_form(self)
-    
-    # Parse multipart form with increased size limit
-    parser = MultiPartParser(
-        headers=self.headers,
-        stream=self.stream(),
-        max_part_size=50 * 1024 * 1024  # 50MB instead of default 1MB
-    )
-    return await parser.parse()
+logger = logging.getLogger(__name__)
 
-# Monkey-patch Request.form to use increased limit
-StarletteRequest.form = _custom_form
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
+    import sentry_sdk
+
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+def refresh_event_occurrences() -> None:
+    """
+    Move the occurrence window forward if it runs short; a failure is
+    logged so it can't block startup.
+    """
+    with Session(engine) as session:
+        try:
+            if crud.ensure_event_occurrences_current(session=session):
+                logger.info("Refreshed event occurrences")
+        except Exception as e:
+            logger.warning("Event occurrence refresh failed: %s", e)
+
+
+async def warm_up() -> None:
+    if settings.EVENT_OCCURRENCES_REFRESH_ON_STARTUP:
+        # Workers starting together wait on one advisory lock, one refreshes
+        await anyio.to_thread.run_sync(refresh_event_occurrences)
+    if settings.DB_WARMUP_ENABLED:
+        # Fill SQLAlchemy's compiled cache before the first request
+        await anyio.to_thread.run_sync(warm_up_statements, engine)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    # Check if we need SSH tunnel (only if POSTGRES_SERVER is not localhost)
-    needs_ssh_tunnel = (
-        settings.ENVIRONMENT == "local" 
-        and settings.POSTGRES_SERVER not in ("localhost", "127.0.0.1")
-    )
-    
-    if needs_ssh_tunnel:
-        print("Starting SSH Tunnel for local development (using port 5433)...")
-        # Use port 5433 for SSH tunnel to avoid conflict with local PostgreSQL
-        with ssh_tunnel(local_port=5433):
+    # app.core.db.engine already points at the tunnel port when one is needed
+    if needs_ssh_tunnel():
+        # paramiko is only needed for local development against the VPS
+        from app.ssh_util import ssh_tunnel
+
+        print(f"Starting SSH Tunnel for local development (using port {SSH_TUNNEL_PORT})...")
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
             print("SSH Tunnel active.")
-            # Modify database connection to use SSH tunnel
-            from sqlalchemy import create_engine
-            tunnel_uri = str(settings.SQLALCHEMY_DATABASE_URI).replace(
-                f":{settings.POSTGRES_PORT}", ":5433"
-            ).replace(
-                settings.POSTGRES_SERVER, "127.0.0.1"
-            )
-            # Update the global engine to use tunnel
-            from app.core import db
-            db.engine = create_engine(tunnel_uri)
+            await warm_up()
             yield
             print("SSH Tunnel closing...")
     else:
         print("Using local database connection (no SSH tunnel needed).")
+        await warm_up()
         yield
     # Shutdown
+    engine.dispose()
 
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    generate_unique_id_function=custom_generate_unique_id,
-    lifespan=lifespan,
-)
 
-# Set all CORS enabled origins
-if settings.all_cors_origins:
+def create_public_app() -> FastAPI:
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        generate_unique_id_function=custom_generate_unique_id,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+
+    # authlib keeps the OAuth state in the session between the redirect and
+    # the callback; no other public route reads it
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.all_cors_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        ScopedSessionMiddleware,
+        path_prefixes=(
+            f"{settings.API_V1_STR}/login/google",
+            f"{settings.API_V1_STR}/auth/google",
+        ),
+        secret_key=settings.SECRET_KEY,
+        same_site="lax",
     )
 
-app.include_router(api_router, prefix=settings.API_V1_STR)
+    # Set all CORS enabled origins
+    if settings.all_cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.all_cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        cache_size=settings.COMPRESSION_CACHE_SIZE,
+        # MediaFiles serves its own precompressed variants
+        exclude_path_prefixes=("/blog-media",),
+    )
+
+    if settings.QUERY_DEBUG:
+        app.add_middleware(QueryDebugMiddleware)
+
+    # Outermost, so the recorded time includes the other middleware
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", tags=["metrics"], include_in_schema=False)
+        def metrics() -> PlainTextResponse:
+            return PlainTextResponse(
+                registry.render_prometheus(),
+                media_type="text/plain; version=0.0.4",
+            )
+
+    app.include_router(api_router, prefix=settings.API_V1_STR)
+
+    # Blog post images from import_docx_blog_posts_markdown.py and admin uploads
+    BLOG_MEDIA_ROOT.mkdir(parents=True, exist_ok=True)
+    app.mount(
+        "/blog-media",
+        MediaFiles(
+            directory=BLOG_MEDIA_ROOT,
+            accel_redirect_prefix=settings.MEDIA_ACCEL_REDIRECT_PREFIX,
+        ),
+        name="blog-media",
+    )
+    return app
+
+
+def create_admin_app() -> FastAPI:
+    app = FastAPI(
+        title=f"{settings.PROJECT_NAME} admin",
+        openapi_url=None,
+        lifespan=lifespan,
+    )
+    _mount_admin(app)
+    return app
+
+
+def create_app() -> FastAPI:
+    app = create_public_app()
+    if settings.ADMIN_ENABLED:
+        _mount_admin(app)
+    return app
+
+
+def _mount_admin(app: FastAPI) -> None:
+    # sqladmin is only imported when the panel is mounted. Its session and
+    # form-size middleware wrap the /admin sub-app only.
+    from app.admin import setup_admin
+
+    setup_admin(app, secret_key=settings.SECRET_KEY)
 
-# Blog post images written by import_docx_blog_posts_markdown.py (data/blog_media/{slug}/)
-_blog_media_root = Path(__file__).resolve().parent.parent / "data" / "blog_media"
-_blog_media_root.mkdir(parents=True, exist_ok=True)
-app.mount(
-    "/blog-media",
-    StaticFiles(directory=str(_blog_media_root)),
-    name="blog-media",
-)
 
-# Setup admin panel
-setup_admin(app, secret_key=settings.SECRET_KEY)
+app = create_app()
@@ -6,6 +6,7 @@ from typing import Optional
 
 import sqlalchemy as sa
 from pydantic import EmailStr
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
 # =====================================================
@@ -61,6 +62,9 @@ class Tour(SQLModel, table=True):
     additional_description: str = Field(max_length=1000)
     max_capacity: Optional[int] = None
     slug: str = Field(unique=True, max_length=255)
+    # Meeting point coordinates from the offline gazetteer (app/core/geo.py)
+    latitude: float | None = None
+    longitude: float | None = None
     
     # Relationships
     dates: list["TourDate"] = Relationship(back_populates="tour")
@@ -82,6 +86,17 @@ class TourDate(SQLModel, table=True):
     # Relationships
     tour: Optional[Tour] = Relationship(back_populates="dates")
 
+    # Tour detail lookup (tours.slug -> tour_date by tour_id and id) is an
+    # index-only scan
+    __table_args__ = (
+        sa.Index(
+            "ix_tour_date_tour_id_id",
+            "tour_id",
+            "id",
+            postgresql_include=["date", "time"],
+        ),
+    )
+
 # -----------------------------------------------------
 # Blog Posts
 # -----------------------------------------------------
@@ -140,7 +155,7 @@ class Event(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     slug: str = Field(unique=True, index=True, max_length=255)
     title: str = Field(max_length=255)
-    category: str = Field(max_length=100)
+    category: str = Field(index=True, max_length=100)
     summary_short: str = Field(sa_column=sa.Column(sa.Text, nullable=False))
     summary_long: str = Field(sa_column=sa.Column(sa.Text, nullable=False))
     start_date: date = Field(index=True)
@@ -150,11 +165,14 @@ class Event(SQLModel, table=True):
     timezone: str = Field(max_length=100)
     venue_name: str | None = Field(default=None, max_length=255)
     venue_address: str | None = Field(default=None, max_length=255)
-    neighborhood: str | None = Field(default=None, max_length=100)
+    neighborhood: str | None = Field(default=None, index=True, max_length=100)
     city: str = Field(max_length=100)
+    # From the offline gazetteer (app/core/geo.py); GiST-indexed for `near`
+    latitude: float | None = None
+    longitude: float | None = None
     country: str = Field(max_length=100)
-    language: str = Field(max_length=10)
-    price_type: str = Field(max_length=50)
+    language: str = Field(index=True, max_length=10)
+    price_type: str = Field(index=True, max_length=50)
     price_currency: str | None = Field(default=None, max_length=10)
     price_value: Decimal | None = Field(
         default=None,
@@ -174,13 +192,14 @@ class Event(SQLModel, table=True):
     )
     image_alt: str | None = Field(default=None, max_length=500)
     image_credit: str | None = Field(default=None, max_length=255)
+    # JSONB with GIN indexes, for `tags @> ...` / `source_urls @> ...` lookups
     tags: list[str] | None = Field(
         default=None,
-        sa_column=sa.Column(sa.JSON, nullable=True),
+        sa_column=sa.Column(JSONB, nullable=True),
     )
     source_urls: list[str] | None = Field(
         default=None,
-        sa_column=sa.Column(sa.JSON, nullable=True),
+        sa_column=sa.Column(JSONB, nullable=True),
     )
     status: str = Field(max_length=50)
     source_batch: str | None = Field(default=None, max_length=100)
@@ -190,10 +209,51 @@ class Event(SQLModel, table=True):
     created_at: datetime | None = Field(default_factory=datetime.now)
     updated_at: datetime | None = Field(default_factory=datetime.now)
 
+    __table_args__ = (
+        sa.Index(
+            "ix_events_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        sa.Index(
+            "ix_events_source_urls",
+            "source_urls",
+            postgresql_using="gin",
+            postgresql_ops={"source_urls": "jsonb_path_ops"},
+        ),
+    )
+
     def __str__(self) -> str:
         return self.title
 
 
+# One row per day an event takes place (multi-day and long-term events get
+# a row for every day, open-ended ones up to EVENT_OCCURRENCE_HORIZON_DAYS
+# ahead), so calendar views are index range scans on `date`. Maintained by
+# crud.sync_event_occurrences from seed_events.py and the admin.
+class EventOccurrence(SQLModel, table=True):
+    __tablename__ = "event_occurrence"
+
+    id: int | None = Field(default=None, primary_key=True)
+    event_id: int = Field(
+        sa_column=sa.Column(
+            sa.Integer,
+            sa.ForeignKey("events.id", ondelete="CASCADE"),
+            nullable=False,
+        )
+    )
+    date: date
+    start_time_local: str | None = Field(default=None, max_length=20)
+
+    __table_args__ = (
+        sa.Index("ix_event_occurrence_date_event_id", "date", "event_id"),
+        sa.Index(
+            "ix_event_occurrence_event_id_date", "event_id", "date", unique=True
+        ),
+    )
+
+
 class EventPublic(SQLModel):
     id: int
     slug: str
@@ -211,6 +271,8 @@ class EventPublic(SQLModel):
     neighborhood: str | None = None
     city: str
     country: str
+    latitude: float | None = None
+    longitude: float | None = None
     language: str
     price_type: str
     price_currency: str | None = None
@@ -231,6 +293,59 @@ class EventsPublic(SQLModel):
     count: int
 
 
+# Columns returned by `/events/?view=summary` (list page, Instagram cards)
+EVENT_SUMMARY_FIELDS = (
+    "id",
+    "slug",
+    "title",
+    "start_date",
+    "end_date",
+    "is_long_term",
+    "official_url",
+    "updated_at",
+)
+
+
+class EventSummaryPublic(SQLModel):
+    id: int
+    slug: str
+    title: str
+    start_date: date
+    end_date: date | None = None
+    is_long_term: bool
+    official_url: str | None = None
+    updated_at: datetime | None = None
+
+
+class EventsSummaryPublic(SQLModel):
+    data: list[EventSummaryPublic]
+    count: int
+
+
+class EventFacetCount(SQLModel):
+    value: str
+    count: int
+
+
+# Counts of visible, active events per value of each filterable field
+class EventFacetsPublic(SQLModel):
+    category: list[EventFacetCount]
+    neighborhood: list[EventFacetCount]
+    price_type: list[EventFacetCount]
+    language: list[EventFacetCount]
+    tags: list[EventFacetCount]
+
+
+class EventOccurrencePublic(EventSummaryPublic):
+    date: date
+    start_time_local: str | None = None
+
+
+class EventsCalendarPublic(SQLModel):
+    data: list[EventOccurrencePublic]
+    count: int
+
+
 # -----------------------------------------------------
 # Site Users (Renamed from User to avoid conflict)
 # Mapped to 'users' table
@@ -1,133 +1,321 @@
+import argparse
 import logging
 import os
+import select
 import socket
-import subprocess
+import tempfile
+import threading
 import time
-import psycopg
+from collections.abc import Iterator
 from contextlib import contextmanager
+from pathlib import Path
+
+import paramiko
+import psycopg
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 SSH_HOST_ALIAS = "vps_server"   # как в ~/.ssh/config
+SSH_CONFIG_PATH = Path.home() / ".ssh" / "config"
 LOCAL_PORT = 5432
 REMOTE_HOST = "127.0.0.1"
 REMOTE_PORT = 5432
 
+# Keepalive / health check interval for the SSH transport (seconds)
+KEEPALIVE_INTERVAL = 30
+FORWARD_BUFFER_SIZE = 64 * 1024
+
 DB_USER = "app_user"
 DB_PASS = os.getenv("POSTGRES_PASSWORD")
 DB_NAME = "anastasia_db"
 
 
-def wait_port(host: str, port: int, timeout_s: float = 5.0) -> None:
-    deadline = time.time() + timeout_s
-    last_err = None
-    while time.time() < deadline:
-        try:
-            with socket.create_connection((host, port), timeout=0.5):
+def _port_in_use(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+            return True
+    except OSError:
+        return False
+
+
+def _pid_file(local_port: int) -> Path:
+    return Path(tempfile.gettempdir()) / f"ssh-tunnel-{local_port}.pid"
+
+
+def _shared_tunnel_pid(local_port: int) -> int | None:
+    """PID of a live `python -m app.ssh_util --serve` process owning the port."""
+    try:
+        pid = int(_pid_file(local_port).read_text().strip())
+        os.kill(pid, 0)
+    except (OSError, ValueError):
+        return None
+    return pid
+
+
+class SSHTunnel:
+    """
+    In-process local port forward 127.0.0.1:local_port -> remote_host:remote_port
+    over a single paramiko transport.
+
+    Connections are accepted on a background thread; each one is forwarded
+    through its own direct-tcpip channel. A monitor thread checks the
+    transport every KEEPALIVE_INTERVAL seconds and reconnects if it dropped,
+    and new connections also reconnect on demand.
+    """
+
+    def __init__(
+        self,
+        local_port: int,
+        remote_host: str = REMOTE_HOST,
+        remote_port: int = REMOTE_PORT,
+        host_alias: str = SSH_HOST_ALIAS,
+    ) -> None:
+        self.local_port = local_port
+        self.remote_host = remote_host
+        self.remote_port = remote_port
+        self.host_alias = host_alias
+        self._client: paramiko.SSHClient | None = None
+        self._server: socket.socket | None = None
+        self._connect_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def _connect(self) -> paramiko.SSHClient:
+        ssh_config = (
+            paramiko.SSHConfig.from_path(str(SSH_CONFIG_PATH))
+            if SSH_CONFIG_PATH.exists()
+            else paramiko.SSHConfig()
+        )
+        host = ssh_config.lookup(self.host_alias)
+
+        client = paramiko.SSHClient()
+        client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.RejectPolicy())
+        client.connect(
+            hostname=host.get("hostname", self.host_alias),
+            port=int(host.get("port", 22)),
+            username=host.get("user"),
+            key_filename=host.get("identityfile"),
+            sock=paramiko.ProxyCommand(host["proxycommand"])
+            if "proxycommand" in host
+            else None,
+            timeout=10,
+        )
+        transport = client.get_transport()
+        assert transport is not None
+        transport.set_keepalive(KEEPALIVE_INTERVAL)
+        return client
+
+    def is_healthy(self) -> bool:
+        transport = self._client.get_transport() if self._client else None
+        return bool(transport and transport.is_active())
+
+    def ensure_connected(self) -> None:
+        with self._connect_lock:
+            if self.is_healthy():
                 return
+            if self._client is not None:
+                logger.warning("SSH tunnel on port %d dropped, reconnecting...", self.local_port)
+                self._client.close()
+            self._client = self._connect()
+
+    def start(self) -> None:
+        started = time.perf_counter()
+        self.ensure_connected()
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            server.bind(("127.0.0.1", self.local_port))
         except OSError as e:
-            last_err = e
-            time.sleep(0.1)
-    raise TimeoutError(f"Port {host}:{port} not ready. Last error: {last_err}")
+            server.close()
+            self.close()
+            raise RuntimeError(
+                f"Port {self.local_port} is already in use. "
+                "Stop the process using it or pick another port for the SSH tunnel."
+            ) from e
+        server.listen(16)
+        server.settimeout(0.5)
+        self._server = server
 
+        for target in (self._accept_loop, self._monitor_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
 
-@contextmanager
-def ssh_tunnel(local_port: int = LOCAL_PORT):
-    # Check if port is already in use and try to free it (only SSH processes)
-    try:
-        with socket.create_connection(("127.0.0.1", local_port), timeout=0.1):
-            # Port is in use, try to find and kill only SSH processes
-            logger = logging.getLogger(__name__)
+        logger.info(
+            "SSH tunnel 127.0.0.1:%d -> %s:%s:%d ready in %.0f ms",
+            self.local_port,
+            self.host_alias,
+            self.remote_host,
+            self.remote_port,
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=2)
+        self._threads.clear()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _monitor_loop(self) -> None:
+        while not self._stopped.wait(KEEPALIVE_INTERVAL):
             try:
-                # Try to find processes using this port
-                result = subprocess.run(
-                    ["lsof", "-ti", f":{local_port}"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    pids = result.stdout.strip().split('\n')
-                    for pid in pids:
-                        try:
-                            # Check if it's an SSH process, not PostgreSQL
-                            ps_result = subprocess.run(
-                                ["ps", "-p", pid, "-o", "comm="],
-                                capture_output=True,
-                                text=True,
-                                timeout=1
-                            )
-                            process_name = ps_result.stdout.strip().lower()
-                            # Only kill SSH processes, not PostgreSQL
-                            if "ssh" in process_name or "postgres" not in process_name:
-                                subprocess.run(["kill", "-9", pid], timeout=1)
-                                logger.warning(f"Killed process {pid} ({process_name}) using port {local_port}")
-                            else:
-                                logger.warning(f"Port {local_port} is used by {process_name} (PID {pid}), not killing it")
-                                raise RuntimeError(
-                                    f"Port {local_port} is already in use by {process_name}. "
-                                    f"Please use a different port for SSH tunnel or stop the process."
-                                )
-                        except Exception:
-                            pass
-                    # Wait a bit for port to be released
-                    time.sleep(0.5)
-            except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                # lsof not available or failed, just wait
-                time.sleep(1)
-    except (OSError, ConnectionRefusedError):
-        # Port is free, proceed
-        pass
-    
-    # -N: no remote command
-    # -L: local port forward
-    # -o ExitOnForwardFailure=yes: fail fast if port bind/forward fails
-    # -o ServerAlive*: keepalive
-    cmd = [
-        "ssh",
-        "-N",
-        "-L", f"{local_port}:{REMOTE_HOST}:{REMOTE_PORT}",
-        "-o", "ExitOnForwardFailure=yes",
-        "-o", "ServerAliveInterval=30",
-        "-o", "ServerAliveCountMax=3",
-        SSH_HOST_ALIAS,
-    ]
-
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+                self.ensure_connected()
+            except Exception as e:
+                logger.error("SSH tunnel health check failed: %s", e)
+
+    def _accept_loop(self) -> None:
+        while not self._stopped.is_set():
+            server = self._server
+            if server is None:
+                return
+            try:
+                conn, addr = server.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            threading.Thread(target=self._forward, args=(conn, addr), daemon=True).start()
+
+    def _forward(self, conn: socket.socket, addr: tuple[str, int]) -> None:
+        try:
+            self.ensure_connected()
+            assert self._client is not None
+            transport = self._client.get_transport()
+            assert transport is not None
+            channel = transport.open_channel(
+                "direct-tcpip", (self.remote_host, self.remote_port), addr
+            )
+        except Exception as e:
+            logger.error("SSH tunnel could not open channel: %s", e)
+            conn.close()
+            return
+
+        try:
+            while not self._stopped.is_set():
+                readable, _, _ = select.select([conn, channel], [], [], 1.0)
+                if conn in readable:
+                    data = conn.recv(FORWARD_BUFFER_SIZE)
+                    if not data:
+                        break
+                    channel.sendall(data)
+                if channel in readable:
+                    data = channel.recv(FORWARD_BUFFER_SIZE)
+                    if not data:
+                        break
+                    conn.sendall(data)
+        except OSError:
+            pass
+        finally:
+            channel.close()
+            conn.close()
+
+
+class TunnelManager:
+    """
+    Reference-counted registry of SSH tunnels, one per local port.
+
+    Nested or repeated `ssh_tunnel()` calls in one process share the same
+    live tunnel; it is closed when the last user releases it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tunnels: dict[int, SSHTunnel] = {}
+        self._refcounts: dict[int, int] = {}
+
+    def acquire(self, local_port: int) -> SSHTunnel:
+        with self._lock:
+            tunnel = self._tunnels.get(local_port)
+            if tunnel is None:
+                tunnel = SSHTunnel(local_port)
+                tunnel.start()
+                self._tunnels[local_port] = tunnel
+                self._refcounts[local_port] = 0
+            else:
+                tunnel.ensure_connected()
+            self._refcounts[local_port] += 1
+            return tunnel
+
+    def release(self, local_port: int) -> None:
+        with self._lock:
+            self._refcounts[local_port] -= 1
+            if self._refcounts[local_port] > 0:
+                return
+            del self._refcounts[local_port]
+            self._tunnels.pop(local_port).close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            for tunnel in self._tunnels.values():
+                tunnel.close()
+            self._tunnels.clear()
+            self._refcounts.clear()
+
+
+tunnel_manager = TunnelManager()
+
+
+@contextmanager
+def ssh_tunnel(local_port: int = LOCAL_PORT) -> Iterator[None]:
+    # A long-running `python -m app.ssh_util --serve` already forwards this port
+    pid = _shared_tunnel_pid(local_port)
+    if pid is not None and _port_in_use(local_port):
+        logger.info("Reusing shared SSH tunnel on port %d (pid %d)", local_port, pid)
+        yield
+        return
 
+    tunnel_manager.acquire(local_port)
     try:
-        # ждём пока ssh реально поднял прослушивание порта
-        wait_port("127.0.0.1", local_port, timeout_s=8.0)
         yield
-    except Exception:
-        # выведем stderr ssh для диагностики
-        try:
-            err = proc.stderr.read()
-        except Exception:
-            err = ""
-        raise RuntimeError(f"SSH tunnel failed.\nssh stderr:\n{err}") from None
     finally:
-        proc.terminate()
+        tunnel_manager.release(local_port)
+
+
+def serve(local_port: int) -> None:
+    """Keep a tunnel open so other scripts can reuse it without reconnecting."""
+    pid_file = _pid_file(local_port)
+    with ssh_tunnel(local_port):
+        pid_file.write_text(str(os.getpid()))
+        logger.info("Serving shared SSH tunnel on port %d, Ctrl-C to stop", local_port)
         try:
-            proc.wait(timeout=3)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            proc.wait(timeout=1)  # Wait for process to fully terminate
-        # Small delay to ensure port is released
-        time.sleep(0.5)
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pid_file.unlink(missing_ok=True)
 
 
 def main():
-    with ssh_tunnel():
+    parser = argparse.ArgumentParser(description="SSH tunnel to the VPS database")
+    parser.add_argument("--port", type=int, default=LOCAL_PORT)
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the tunnel open for other scripts until interrupted",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.serve:
+        serve(args.port)
+        return
+
+    with ssh_tunnel(args.port):
         conn = psycopg.connect(
             host="127.0.0.1",
-            port=str(LOCAL_PORT),
+            port=str(args.port),
             user=DB_USER,
             password=DB_PASS,
             dbname=DB_NAME,
@@ -141,4 +329,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
@@ -4,9 +4,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-import emails  # type: ignore
 import jwt
-from jinja2 import Template
 from jwt.exceptions import InvalidTokenError
 
 from app.core import security
@@ -36,6 +34,9 @@ def render_email_template(*, template_name: str, context: dict[str, Any]) -> str
         )
         logger.error(error_msg)
         raise FileNotFoundError(error_msg)
+    # jinja2 and emails are imported on first use to keep app startup fast
+    from jinja2 import Template
+
     template_str = template_path.read_text()
     html_content = Template(template_str).render(context)
     return html_content
@@ -48,6 +49,7 @@ def send_email(
     html_content: str = "",
 ) -> None:
     assert settings.emails_enabled, "no provided configuration for email variables"
+    import emails  # type: ignore
     
     def clean_string(s: str, aggressive: bool = False) -> str:
         """Clean string from problematic Unicode characters that cause ASCII encoding errors."""
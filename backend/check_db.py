@@ -2,8 +2,7 @@
 import sys
 import logging
 from sqlalchemy import text
-from app.core.db import engine
-from app.core.config import settings
+from app.core.db import SSH_TUNNEL_PORT, engine, needs_ssh_tunnel
 from app.ssh_util import ssh_tunnel
 
 # Configure logging
@@ -13,10 +12,10 @@ logger = logging.getLogger(__name__)
 def check_connection():
     logger.info("Attempting to connect to PostgreSQL using app.core.db.engine...")
     try:
-        # In local environment, create SSH tunnel before connecting to DB
-        if settings.ENVIRONMENT == "local":
+        # In local environment with a remote DB, create SSH tunnel before connecting
+        if needs_ssh_tunnel():
             logger.info("Local environment detected, creating SSH tunnel...")
-            with ssh_tunnel():
+            with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
                 logger.info("SSH tunnel active, checking database connection...")
                 with engine.connect() as conn:
                     result = conn.execute(text("SELECT 1"))
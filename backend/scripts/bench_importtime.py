@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Measure the cold-start import time of the FastAPI app.
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter a few
+times and reports the best total plus the slowest top-level packages.
+Heavy optional modules (sentry_sdk, passlib, emails, authlib, paramiko,
+and sqladmin/jinja2 with --no-admin) must not be imported at startup. The
+run fails if any of them is, or if the total exceeds the budget.
+
+Usage:
+    python scripts/bench_importtime.py [--budget-ms 1500] [--runs 5] [--top 15] [--no-admin]
+
+--no-admin measures an API-only worker (ADMIN_ENABLED=false).
+"""
+
+# ruff: noqa: T201
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+_backend_dir = Path(__file__).parent.parent
+
+# Import-time budget for `import app.main`, in milliseconds (best of --runs)
+IMPORT_TIME_BUDGET_MS = 1500
+# Deferred until first use; importing one of these at startup is a regression
+LAZY_MODULES = ("sentry_sdk", "passlib", "emails", "authlib", "paramiko")
+# Only needed by the admin panel, so absent when ADMIN_ENABLED=false
+ADMIN_MODULES = ("sqladmin", "jinja2")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Profile app.main import time")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--no-admin", action="store_true", help="Profile with ADMIN_ENABLED=false"
+    )
+    return parser.parse_args()
+
+
+def profile_import(env: dict[str, str]) -> tuple[float, dict[str, float], set[str]]:
+    """
+    Import app.main once in a new interpreter.
+
+    Returns (total ms, cumulative ms per top-level package, imported top-level
+    package names).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=_backend_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"❌ import app.main failed:\n{result.stderr[-2000:]}")
+
+    per_package: dict[str, float] = defaultdict(float)
+    imported = set()
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        package = name.strip().split(".")[0]
+        imported.add(package)
+        # Nested imports are indented further; count only the outermost ones
+        # so time is not double counted
+        if len(name) - len(name.lstrip()) == 1:
+            per_package[package] += int(cumulative) / 1000
+    return sum(per_package.values()), dict(per_package), imported
+
+
+def main() -> None:
+    args = parse_args()
+    env = dict(os.environ)
+    if args.no_admin:
+        env["ADMIN_ENABLED"] = "false"
+
+    runs = [profile_import(env) for _ in range(args.runs)]
+    total, per_package, imported = min(runs, key=lambda run: run[0])
+
+    print(f"import app.main: {total:.0f} ms (best of {args.runs}), budget {args.budget_ms:.0f} ms")
+    for package, ms in sorted(per_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {ms:8.1f} ms  {package}")
+
+    failed = False
+    lazy_modules = LAZY_MODULES + (ADMIN_MODULES if args.no_admin else ())
+    eager = [module for module in lazy_modules if module in imported]
+    if eager:
+        failed = True
+        print(f"❌ Imported at startup but should be lazy: {', '.join(eager)}")
+    if total > args.budget_ms:
+        failed = True
+        print(f"❌ Over budget by {total - args.budget_ms:.0f} ms")
+    if failed:
+        sys.exit(1)
+    print("✓ Within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for API response serialization.
+
+Compares the old path (FastAPI response_model validation + jsonable_encoder +
+stdlib json), the ORJSONResponse default and the ModelResponse fast path for
+EventsPublic, BlogPostsPublic and UsersPublic with N items.
+
+Usage:
+    python scripts/bench_serialization.py [--items 1000] [--repeat 20]
+"""
+
+# ruff: noqa: E402, T201
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+import uuid
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+_script_dir = Path(__file__).parent
+_backend_dir = _script_dir.parent
+sys.path.insert(0, str(_backend_dir))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.api.responses import ModelResponse, ORJSONResponse
+from app.models import (
+    BlogPostListItem,
+    BlogPostsPublic,
+    EventPublic,
+    EventsPublic,
+    UserPublic,
+    UsersPublic,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    return parser.parse_args()
+
+
+def build_events(n: int) -> EventsPublic:
+    today = date.today()
+    data = [
+        EventPublic(
+            id=i,
+            slug=f"event-{i}",
+            title=f"Event {i}",
+            category="music",
+            summary_short="Short summary " * 4,
+            summary_long="Long summary text. " * 40,
+            start_date=today + timedelta(days=i % 30),
+            end_date=today + timedelta(days=i % 30 + 2),
+            start_time_local="20:00",
+            timezone="America/Argentina/Buenos_Aires",
+            venue_name="Usina del Arte",
+            venue_address="Agustín R. Caffarena 1",
+            neighborhood="La Boca",
+            city="Buenos Aires",
+            country="Argentina",
+            language="ru",
+            price_type="paid",
+            price_currency="ARS",
+            price_value=Decimal("15000.50"),
+            official_url=f"https://example.com/events/{i}",
+            tags=["music", "concert", "outdoor"],
+            source_urls=[f"https://example.com/source/{i}"],
+            status="confirmed",
+            is_long_term=i % 5 == 0,
+        )
+        for i in range(n)
+    ]
+    return EventsPublic(data=data, count=n)
+
+
+def build_blog_posts(n: int) -> BlogPostsPublic:
+    now = datetime.now()
+    data = [
+        BlogPostListItem(
+            id=i,
+            title=f"Post {i}",
+            slug=f"post-{i}",
+            description="Description " * 10,
+            cover_image_url=f"/blog-media/post-{i}/cover.webp",
+            reading_time_minutes=7,
+            created_at=now - timedelta(days=i),
+        )
+        for i in range(n)
+    ]
+    return BlogPostsPublic(data=data, count=n)
+
+
+def build_users(n: int) -> UsersPublic:
+    data = [
+        UserPublic(
+            id=uuid.uuid4(),
+            email=f"user{i}@example.com",
+            full_name=f"User {i}",
+            is_active=True,
+        )
+        for i in range(n)
+    ]
+    return UsersPublic(data=data, count=n)
+
+
+def stdlib_path(model: BaseModel) -> bytes:
+    # What FastAPI did before: re-validate against response_model, run
+    # jsonable_encoder, then json.dumps through JSONResponse.
+    validated = type(model).model_validate(model.model_dump())
+    return json.dumps(
+        jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def orjson_path(model: BaseModel) -> bytes:
+    validated = type(model).model_validate(model.model_dump())
+    return ORJSONResponse(jsonable_encoder(validated)).body
+
+
+def fast_path(model: BaseModel) -> bytes:
+    return ModelResponse(model).body
+
+
+def bench(name: str, fn: Callable[[BaseModel], bytes], model: BaseModel, repeat: int) -> float:
+    best = min(timeit.repeat(lambda: fn(model), number=1, repeat=repeat))
+    print(f"  {name:<10} {best * 1000:8.2f} ms  ({len(fn(model)) / 1024:.0f} KB)")
+    return best
+
+
+def main() -> None:
+    args = parse_args()
+    print(f"Serializing {args.items} items, best of {args.repeat} runs")
+    for label, model in (
+        ("EventsPublic", build_events(args.items)),
+        ("BlogPostsPublic", build_blog_posts(args.items)),
+        ("UsersPublic", build_users(args.items)),
+    ):
+        print(label)
+        baseline = bench("stdlib", stdlib_path, model, args.repeat)
+        bench("orjson", orjson_path, model, args.repeat)
+        fast = bench("fast-path", fast_path, model, args.repeat)
+        print(f"  speedup    {baseline / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
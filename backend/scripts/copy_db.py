@@ -4,24 +4,43 @@ Script to copy PostgreSQL database from remote server to local database.
 
 This script:
 1. Creates an SSH tunnel to the remote server
-2. Dumps the remote database using pg_dump
-3. Restores the dump to the local database
+2. Dumps the remote database using pg_dump (directory format, -j parallel jobs)
+3. Restores the dump to the local database (pg_restore -j)
 4. Repairs duplicate emails on public.user (if any) so ix_user_email can be created
 
+With --stream, pg_dump output is piped straight into pg_restore and no dump is
+written to disk. --table / --exclude-table limit the copy to some tables.
+With --incremental, only rows newer than the local watermark of INCREMENTAL_TABLES
+are pulled and upserted; nothing is dropped. Deleted rows and edits to tables
+without updated_at (tours, tour_date) need a full copy.
+Progress (MB/s and estimated rows/s) is printed while pg_dump/pg_restore run.
+
 pg_restore may exit with code 1 when duplicate keys prevent a unique index; those cases
 are treated as non-fatal and fixed by deleting duplicate user rows (smallest id kept).
 
 Usage:
     python scripts/copy_db.py [--local-db-name LOCAL_DB_NAME] [--local-db-user LOCAL_DB_USER] [--local-db-host LOCAL_DB_HOST] [--local-db-port LOCAL_DB_PORT]
+                              [-j JOBS] [--stream] [--table TABLE ...] [--exclude-table TABLE ...]
 
 If local database parameters are not provided, they will use the same values as remote database
 from settings (config.py), or defaults to localhost:5432.
 """
+import io
 import os
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
+from typing import IO
+
+import psycopg
+from psycopg import sql
 
 # Add backend directory to sys.path
 _script_dir = Path(__file__).parent
@@ -36,6 +55,24 @@ SSH_HOST_ALIAS = "vps_server"
 # Use different port for SSH tunnel to avoid conflict with local PostgreSQL
 SSH_TUNNEL_PORT = 5433
 
+# Parallel pg_dump/pg_restore jobs for directory-format dumps
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+# Seconds between live progress lines
+PROGRESS_INTERVAL = 5.0
+# Lines of pg_dump/pg_restore output kept for error reports
+STDERR_TAIL_LINES = 200
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Tables synced by --incremental: append-only ones by id, edited ones by
+# updated_at (bumped on every write, see app/admin.py). Tours and tour dates
+# are edited in place without an updated_at, so only a full copy picks them
+# up. Value is the watermark column; order respects foreign keys.
+INCREMENTAL_TABLES = {
+    "blog_posts": "updated_at",
+    "events": "updated_at",
+    "contacts": "id",
+}
+
 # Remote database settings from config
 REMOTE_DB_USER = settings.POSTGRES_USER
 REMOTE_DB_NAME = settings.POSTGRES_DB
@@ -89,7 +126,40 @@ def parse_args():
     parser.add_argument(
         "--dump-file",
         type=str,
-        help="Path to save dump file (optional, if not provided uses temporary file)"
+        help="Directory to save the dump in (optional, if not provided uses a temporary directory)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Parallel pg_dump/pg_restore jobs (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Pipe pg_dump straight into pg_restore without an intermediate dump (single job)"
+    )
+    parser.add_argument(
+        "--table",
+        action="append",
+        dest="tables",
+        metavar="TABLE",
+        help="Only copy this table (repeatable, pg_dump -t pattern)"
+    )
+    parser.add_argument(
+        "--exclude-table",
+        action="append",
+        dest="exclude_tables",
+        metavar="TABLE",
+        help="Skip this table (repeatable, pg_dump -T pattern)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Only pull rows newer than the local watermark (updated_at or id) and upsert them "
+            f"instead of a full drop-and-restore ({', '.join(INCREMENTAL_TABLES)})"
+        )
     )
     
     return parser.parse_args()
@@ -421,13 +491,172 @@ def drop_local_database(db_name: str, db_user: str, db_host: str, db_port: str,
         return False
 
 
-def dump_remote_database(dump_file: Path, db_user: str, db_password: str, db_name: str) -> bool:
-    """Dump remote database through SSH tunnel using local pg_dump."""
-    print(f"Dumping remote database '{db_name}' through SSH tunnel...")
-    
+_TABLE_START_RE = re.compile(
+    r'(?:dumping contents of table|processing data for table) "(?:[^"]*\.)?([^"]+)"'
+)
+_TABLE_DONE_RE = re.compile(r"finished item \d+ TABLE DATA (?:\S+ )?(\S+)")
+
+
+class CopyProgress:
+    """
+    Live throughput reporting for pg_dump / pg_restore.
+
+    Bytes come from `measure()` (dump directory size or bytes piped between
+    processes). Rows are estimated from pg_class.reltuples of the tables that
+    pg_dump/pg_restore report as finished in their verbose output.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        measure: Callable[[], int],
+        row_estimates: dict[str, int],
+        parallel: bool,
+        interval: float = PROGRESS_INTERVAL,
+    ):
+        self.label = label
+        self.measure = measure
+        self.row_estimates = row_estimates
+        self.parallel = parallel
+        self.interval = interval
+        self.started = time.monotonic()
+        self.finished_tables: set[str] = set()
+        self.current_table: str | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "CopyProgress":
+        self.started = time.monotonic()
+        self._thread.start()
+        return self
+
+    def feed(self, line: str) -> None:
+        """Track table progress from a verbose pg_dump/pg_restore line."""
+        done = _TABLE_DONE_RE.search(line)
+        if done:
+            self.finished_tables.add(done.group(1))
+            return
+        started = _TABLE_START_RE.search(line)
+        if started:
+            # Without -j, a table is finished when the next one starts
+            if not self.parallel and self.current_table:
+                self.finished_tables.add(self.current_table)
+            self.current_table = started.group(1)
+            print(f"  → {started.group(1)}")
+
+    def rows_done(self) -> int:
+        return sum(self.row_estimates.get(table, 0) for table in self.finished_tables)
+
+    def report(self, final: bool = False) -> None:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        megabytes = self.measure() / 1024 / 1024
+        rows = self.rows_done()
+        prefix = "✓" if final else "…"
+        print(
+            f"  {prefix} {self.label}: {megabytes:.1f} MB in {elapsed:.0f}s "
+            f"({megabytes / elapsed:.1f} MB/s), ~{rows:,} rows ({rows / elapsed:,.0f} rows/s)"
+        )
+
+    def stop(self) -> None:
+        if self.current_table:
+            self.finished_tables.add(self.current_table)
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.report(final=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.report()
+
+
+def directory_size(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return sum(entry.stat().st_size for entry in path.iterdir() if entry.is_file())
+
+
+def _pump_stderr(stream: IO[str], tail: deque, progress: CopyProgress | None = None) -> None:
+    """Read verbose output line by line instead of buffering it in memory."""
+    for line in stream:
+        line = line.rstrip()
+        tail.append(line)
+        if progress is not None:
+            progress.feed(line)
+        lowered = line.lower()
+        if "error" in lowered or "warning" in lowered:
+            print(f"  {line}")
+
+
+def estimate_table_rows(
+    db_host: str,
+    db_port: str,
+    db_user: str,
+    db_password: str,
+    db_name: str,
+    tables: list[str] | None = None,
+) -> dict[str, int]:
+    """Row estimates per public table from pg_class.reltuples (instant, no scan)."""
+    sql = (
+        "SELECT c.relname, GREATEST(c.reltuples, 0)::bigint FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE c.relkind = 'r' AND n.nspname = 'public'"
+    )
+    env = os.environ.copy()
+    env["PGPASSWORD"] = db_password
+    try:
+        result = subprocess.run(
+            [get_psql_path(), "-h", db_host, "-p", db_port, "-U", db_user, "-d", db_name, "-tA", "-F", "\t", "-c", sql],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    estimates = {}
+    for line in result.stdout.splitlines():
+        name, _, count = line.partition("\t")
+        if name and count.isdigit() and (not tables or name in tables):
+            estimates[name] = int(count)
+    return estimates
+
+
+def table_filter_args(tables: list[str] | None, exclude_tables: list[str] | None) -> list[str]:
+    args = []
+    for table in tables or []:
+        args += ["-t", table]
+    for table in exclude_tables or []:
+        args += ["-T", table]
+    return args
+
+
+def dump_remote_database(
+    dump_dir: Path,
+    db_user: str,
+    db_password: str,
+    db_name: str,
+    *,
+    jobs: int = DEFAULT_JOBS,
+    tables: list[str] | None = None,
+    exclude_tables: list[str] | None = None,
+    row_estimates: dict[str, int] | None = None,
+) -> bool:
+    """Dump remote database through SSH tunnel as a directory-format dump with -j jobs."""
+    print(f"Dumping remote database '{db_name}' through SSH tunnel ({jobs} parallel jobs)...")
+
+    if dump_dir.exists():
+        if not (dump_dir / "toc.dat").exists():
+            print(f"❌ {dump_dir} exists and is not a pg_dump directory")
+            return False
+        shutil.rmtree(dump_dir)
+
     # Get pg_dump path (prefer PostgreSQL 16 for compatibility)
     pg_dump_path = get_pg_dump_path()
-    
+
     # Build pg_dump command (using local pg_dump through SSH tunnel)
     dump_cmd = [
         pg_dump_path,
@@ -435,50 +664,52 @@ def dump_remote_database(dump_file: Path, db_user: str, db_password: str, db_nam
         "-p", str(SSH_TUNNEL_PORT),  # Use SSH tunnel port (not local PostgreSQL port)
         "-U", db_user,
         "-d", db_name,
-        "-F", "c",  # Custom format (compressed)
-        "-f", str(dump_file),
-        "-v"  # Verbose
+        "-F", "d",  # Directory format (compressed, supports parallel dump/restore)
+        "-j", str(jobs),
+        "-f", str(dump_dir),
+        "-v",  # Verbose
+        *table_filter_args(tables, exclude_tables),
     ]
-    
+
     env = os.environ.copy()
     env["PGPASSWORD"] = db_password
-    
+
+    progress = CopyProgress(
+        "pg_dump", lambda: directory_size(dump_dir), row_estimates or {}, parallel=jobs > 1
+    ).start()
+    tail: deque = deque(maxlen=STDERR_TAIL_LINES)
     try:
-        result = subprocess.run(
-            dump_cmd,
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minutes timeout
-        )
-        
-        if result.returncode != 0:
-            print(f"❌ pg_dump failed:")
-            print(result.stderr)
-            # Check if it's a version mismatch error
-            if "version mismatch" in result.stderr.lower():
-                print()
-                print("💡 Version mismatch detected. Solutions:")
-                print("   1. Install PostgreSQL 16 client tools locally:")
-                print("      brew install postgresql@16")
-                print("      Then use: /opt/homebrew/opt/postgresql@16/bin/pg_dump")
-                print("   2. Or use --no-version-check flag (if available in your pg_dump version)")
-            return False
-        
-        if not dump_file.exists() or dump_file.stat().st_size == 0:
-            print(f"❌ Dump file is empty or doesn't exist")
-            return False
-        
-        print(f"✓ Database dumped successfully to {dump_file}")
-        print(f"  Dump size: {dump_file.stat().st_size / 1024 / 1024:.2f} MB")
-        return True
-        
-    except subprocess.TimeoutExpired:
-        print("❌ pg_dump timed out (took more than 10 minutes)")
-        return False
+        proc = subprocess.Popen(dump_cmd, env=env, stderr=subprocess.PIPE, text=True)
+        assert proc.stderr is not None
+        _pump_stderr(proc.stderr, tail, progress)
+        returncode = proc.wait()
     except Exception as e:
+        progress.stop()
         print(f"❌ Error during dump: {e}")
         return False
+    progress.stop()
+
+    if returncode != 0:
+        stderr = "\n".join(tail)
+        print("❌ pg_dump failed:")
+        print(stderr)
+        # Check if it's a version mismatch error
+        if "version mismatch" in stderr.lower():
+            print()
+            print("💡 Version mismatch detected. Solutions:")
+            print("   1. Install PostgreSQL 16 client tools locally:")
+            print("      brew install postgresql@16")
+            print("      Then use: /opt/homebrew/opt/postgresql@16/bin/pg_dump")
+            print("   2. Or use --no-version-check flag (if available in your pg_dump version)")
+        return False
+
+    if not (dump_dir / "toc.dat").exists():
+        print("❌ Dump directory is empty or doesn't exist")
+        return False
+
+    print(f"✓ Database dumped successfully to {dump_dir}")
+    print(f"  Dump size: {directory_size(dump_dir) / 1024 / 1024:.2f} MB")
+    return True
 
 
 def repair_user_email_duplicates(
@@ -507,7 +738,7 @@ def repair_user_email_duplicates(
     )
 
     print("Post-restore: fixing duplicate emails on public.user (if any)...")
-    for description, sql in (
+    for description, statement in (
         ("delete duplicate user rows (keep smallest id)", delete_sql),
         ("create unique index ix_user_email", index_sql),
     ):
@@ -525,7 +756,7 @@ def repair_user_email_duplicates(
                 "-v",
                 "ON_ERROR_STOP=1",
                 "-c",
-                sql,
+                statement,
             ],
             env=env,
             capture_output=True,
@@ -545,23 +776,10 @@ def repair_user_email_duplicates(
     return True
 
 
-def restore_local_database(
-    dump_file: Path,
-    db_name: str,
-    db_user: str,
-    db_host: str,
-    db_port: str,
-    db_password: str
-) -> bool:
-    """Restore dump to local database."""
-    print(f"Restoring dump to local database '{db_name}'...")
-    
+def _restore_cmd(db_name: str, db_user: str, db_host: str, db_port: str, jobs: int) -> list[str]:
     # Get pg_restore path (prefer PostgreSQL 16 for compatibility with dumps from PostgreSQL 16)
-    pg_restore_path = get_pg_restore_path()
-    
-    # Build pg_restore command
-    restore_cmd = [
-        pg_restore_path,
+    cmd = [
+        get_pg_restore_path(),
         "-h", db_host,
         "-p", db_port,
         "-U", db_user,
@@ -569,48 +787,335 @@ def restore_local_database(
         "-v",  # Verbose
         "--clean",  # Clean (drop) database objects before recreating
         "--if-exists",  # Don't error if object doesn't exist
-        str(dump_file)
     ]
-    
+    if jobs > 1:
+        cmd += ["-j", str(jobs)]
+    return cmd
+
+
+def _check_restore_result(returncode: int, tail: deque, db_name: str) -> bool:
+    # pg_restore: 0 = ok, 1 = completed with warnings/non-fatal issues, 2 = fatal
+    if returncode not in (0, 1):
+        print(f"❌ pg_restore failed (exit code {returncode})")
+        print("\n".join(tail))
+        return False
+
+    if returncode == 1:
+        print(
+            "⚠ pg_restore reported warnings or non-fatal errors "
+            "(often duplicate keys when creating indexes). Continuing..."
+        )
+
+    print(f"✓ pg_restore finished for '{db_name}'")
+    return True
+
+
+def restore_local_database(
+    dump_dir: Path,
+    db_name: str,
+    db_user: str,
+    db_host: str,
+    db_port: str,
+    db_password: str,
+    *,
+    jobs: int = DEFAULT_JOBS,
+    row_estimates: dict[str, int] | None = None,
+) -> bool:
+    """Restore a directory-format dump to the local database with -j jobs."""
+    print(f"Restoring dump to local database '{db_name}' ({jobs} parallel jobs)...")
+
+    restore_cmd = _restore_cmd(db_name, db_user, db_host, db_port, jobs) + [str(dump_dir)]
+
     env = os.environ.copy()
     if db_password:
         env["PGPASSWORD"] = db_password
-    
+
+    dump_size = directory_size(dump_dir)
+    progress = CopyProgress(
+        "pg_restore", lambda: dump_size, row_estimates or {}, parallel=jobs > 1
+    ).start()
+    tail: deque = deque(maxlen=STDERR_TAIL_LINES)
     try:
-        result = subprocess.run(
-            restore_cmd,
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minutes timeout
-        )
-        
-        combined = (result.stderr or "") + (result.stdout or "")
+        proc = subprocess.Popen(restore_cmd, env=env, stderr=subprocess.PIPE, text=True)
+        assert proc.stderr is not None
+        _pump_stderr(proc.stderr, tail, progress)
+        returncode = proc.wait()
+    except Exception as e:
+        progress.stop()
+        print(f"❌ Error during restore: {e}")
+        return False
+    progress.stop()
 
-        # pg_restore: 0 = ok, 1 = completed with warnings/non-fatal issues, 2 = fatal
-        if result.returncode not in (0, 1):
-            print(f"❌ pg_restore failed (exit code {result.returncode})")
-            print(combined)
-            return False
+    return _check_restore_result(returncode, tail, db_name)
+
+
+def stream_copy_database(
+    remote_user: str,
+    remote_password: str,
+    remote_name: str,
+    db_name: str,
+    db_user: str,
+    db_host: str,
+    db_port: str,
+    db_password: str,
+    *,
+    tables: list[str] | None = None,
+    exclude_tables: list[str] | None = None,
+    row_estimates: dict[str, int] | None = None,
+) -> bool:
+    """
+    Pipe pg_dump (custom format, stdout) straight into pg_restore (stdin).
+    No intermediate file is written; pg_restore cannot run parallel jobs
+    when reading from a pipe, so this is single-threaded on the restore side.
+    """
+    print(f"Streaming remote database '{remote_name}' into local '{db_name}'...")
+
+    dump_cmd = [
+        get_pg_dump_path(),
+        "-h", "127.0.0.1",
+        "-p", str(SSH_TUNNEL_PORT),
+        "-U", remote_user,
+        "-d", remote_name,
+        "-F", "c",
+        "-v",
+        *table_filter_args(tables, exclude_tables),
+    ]
+    restore_cmd = _restore_cmd(db_name, db_user, db_host, db_port, jobs=1)
+
+    dump_env = os.environ.copy()
+    dump_env["PGPASSWORD"] = remote_password
+    restore_env = os.environ.copy()
+    if db_password:
+        restore_env["PGPASSWORD"] = db_password
+
+    transferred = 0
+    progress = CopyProgress(
+        "stream", lambda: transferred, row_estimates or {}, parallel=False
+    ).start()
+    dump_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+    restore_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+
+    try:
+        # Binary pipes: the dump itself flows through stdout/stdin
+        dump = subprocess.Popen(dump_cmd, env=dump_env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        restore = subprocess.Popen(restore_cmd, env=restore_env, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert dump.stdout and dump.stderr and restore.stdin and restore.stderr
+        # Only pg_dump's table messages drive row progress; pg_restore just logs
+        readers = [
+            threading.Thread(
+                target=_pump_stderr,
+                args=(io.TextIOWrapper(dump.stderr, errors="replace"), dump_tail, progress),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=_pump_stderr,
+                args=(io.TextIOWrapper(restore.stderr, errors="replace"), restore_tail),
+                daemon=True,
+            ),
+        ]
+        for reader in readers:
+            reader.start()
+
+        while chunk := dump.stdout.read(STREAM_CHUNK_SIZE):
+            restore.stdin.write(chunk)
+            transferred += len(chunk)
+        restore.stdin.close()
+
+        dump_code = dump.wait()
+        restore_code = restore.wait()
+        for reader in readers:
+            reader.join()
+    except BrokenPipeError:
+        dump.kill()
+        dump_code = dump.wait()
+        restore_code = restore.wait()
+    except Exception as e:
+        progress.stop()
+        print(f"❌ Error during streaming copy: {e}")
+        return False
+    progress.stop()
+
+    if dump_code != 0:
+        print("❌ pg_dump failed:")
+        print("\n".join(dump_tail))
+        return False
+    return _check_restore_result(restore_code, restore_tail, db_name)
+
+
+def _table_columns(cur, table: str) -> list[str]:
+    cur.execute(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = 'public' AND table_name = %s ORDER BY ordinal_position",
+        (table,),
+    )
+    return [row[0] for row in cur.fetchall()]
+
+
+def sync_table_incremental(
+    remote_conn, local_conn, table: str, watermark_column: str
+) -> tuple[list[int], int]:
+    """
+    Copy rows of `table` whose watermark column is newer than the local
+    maximum and upsert them by id. Returns (upserted ids, bytes transferred).
+    """
+    table_id = sql.Identifier(table)
+    watermark_id = sql.Identifier(watermark_column)
+
+    with local_conn.cursor() as local_cur, remote_conn.cursor() as remote_cur:
+        columns = _table_columns(local_cur, table)
+        if not columns:
+            print(f"  ⚠ {table}: missing locally, run a full copy first")
+            return [], 0
+        column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+
+        local_cur.execute(sql.SQL("SELECT max({}) FROM {}").format(watermark_id, table_id))
+        watermark = local_cur.fetchone()[0]
 
-        if result.returncode == 1 or "ERROR" in combined.upper():
-            print(
-                "⚠ pg_restore reported warnings or non-fatal errors "
-                "(often duplicate keys when creating indexes). Continuing..."
+        # id watermarks only pick up new rows; timestamps use >= so rows
+        # written in the same instant as the watermark are re-upserted
+        where = sql.SQL("")
+        params: tuple = ()
+        if watermark is not None:
+            operator = ">" if watermark_column == "id" else ">="
+            where = sql.SQL("WHERE {} {} %s").format(watermark_id, sql.SQL(operator))
+            params = (watermark,)
+
+        staging = sql.Identifier(f"_sync_{table}")
+        local_cur.execute(
+            sql.SQL("CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP").format(
+                staging, table_id
             )
-            if result.stderr:
-                print(result.stderr)
+        )
 
-        print(f"✓ pg_restore finished for '{db_name}'")
-        return True
-        
-    except subprocess.TimeoutExpired:
-        print("❌ pg_restore timed out (took more than 10 minutes)")
+        transferred = 0
+        copy_out = sql.SQL("COPY (SELECT {} FROM {} {}) TO STDOUT (FORMAT BINARY)").format(
+            column_list, table_id, where
+        )
+        copy_in = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(staging, column_list)
+        with remote_cur.copy(copy_out, params) as source, local_cur.copy(copy_in) as target:
+            for chunk in source:
+                target.write(chunk)
+                transferred += len(chunk)
+
+        updates = sql.SQL(", ").join(
+            sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(column))
+            for column in columns
+            if column != "id"
+        )
+        local_cur.execute(
+            sql.SQL(
+                "INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} "
+                "ON CONFLICT (id) DO UPDATE SET {updates} RETURNING id"
+            ).format(table=table_id, columns=column_list, staging=staging, updates=updates)
+        )
+        ids = [row[0] for row in local_cur.fetchall()]
+        local_cur.execute(
+            sql.SQL(
+                "SELECT setval(pg_get_serial_sequence(%s, 'id'), max(id)) FROM {} HAVING max(id) IS NOT NULL"
+            ).format(table_id),
+            (table,),
+        )
+    local_conn.commit()
+    return ids, transferred
+
+
+def resync_event_occurrences(
+    event_ids: list[int],
+    db_name: str,
+    db_user: str,
+    db_host: str,
+    db_port: str,
+    db_password: str,
+) -> int:
+    """
+    Regenerate the local event_occurrence rows of the upserted events, the
+    same way the admin and seed_events.py do. Returns the rows written.
+    """
+    from sqlalchemy.engine import URL
+    from sqlmodel import Session, col, create_engine, select
+
+    from app import crud
+    from app.models import Event
+
+    engine = create_engine(
+        URL.create(
+            "postgresql+psycopg",
+            username=db_user,
+            password=db_password or None,
+            host=db_host,
+            port=int(db_port),
+            database=db_name,
+        )
+    )
+    try:
+        with Session(engine) as session:
+            events = session.exec(select(Event).where(col(Event.id).in_(event_ids))).all()
+            written = crud.sync_event_occurrences(session=session, events=events)
+            session.commit()
+            return written
+    finally:
+        engine.dispose()
+
+
+def incremental_sync(
+    db_name: str,
+    db_user: str,
+    db_host: str,
+    db_port: str,
+    db_password: str,
+    tables: list[str] | None = None,
+) -> bool:
+    """Pull new/updated rows of INCREMENTAL_TABLES from the remote database (inside the tunnel)."""
+    selected = {
+        table: column
+        for table, column in INCREMENTAL_TABLES.items()
+        if not tables or table in tables
+    }
+    if not selected:
+        print(f"❌ No incremental tables selected (supported: {', '.join(INCREMENTAL_TABLES)})")
         return False
-    except Exception as e:
-        print(f"❌ Error during restore: {e}")
+
+    started = time.monotonic()
+    total_rows = 0
+    total_bytes = 0
+    try:
+        with psycopg.connect(
+            host="127.0.0.1",
+            port=SSH_TUNNEL_PORT,
+            user=REMOTE_DB_USER,
+            password=REMOTE_DB_PASSWORD,
+            dbname=REMOTE_DB_NAME,
+            connect_timeout=10,
+        ) as remote_conn, psycopg.connect(
+            host=db_host,
+            port=db_port,
+            user=db_user,
+            password=db_password or None,
+            dbname=db_name,
+            connect_timeout=10,
+        ) as local_conn:
+            remote_conn.read_only = True
+            for table, column in selected.items():
+                ids, transferred = sync_table_incremental(remote_conn, local_conn, table, column)
+                total_rows += len(ids)
+                total_bytes += transferred
+                print(f"  ✓ {table}: {len(ids)} rows upserted ({transferred / 1024:.1f} KB, by {column})")
+                if table == "events" and ids:
+                    written = resync_event_occurrences(
+                        ids, db_name, db_user, db_host, db_port, db_password
+                    )
+                    print(f"  ✓ event_occurrence: {written} rows for {len(ids)} events")
+    except psycopg.Error as e:
+        print(f"❌ Incremental sync failed: {e}")
         return False
 
+    elapsed = time.monotonic() - started
+    print(
+        f"✓ Incremental sync finished: {total_rows} rows, "
+        f"{total_bytes / 1024:.1f} KB in {elapsed:.1f}s"
+    )
+    return True
+
 
 def main():
     """Main function."""
@@ -648,20 +1153,50 @@ def main():
     local_db_port = args.local_db_port or LOCAL_DB_PORT
     local_db_password = args.local_db_password or LOCAL_DB_PASSWORD
     
-    # Determine dump file path
+    # Determine dump directory path
     if args.dump_file:
         dump_file = Path(args.dump_file)
         dump_file.parent.mkdir(parents=True, exist_ok=True)
     else:
-        # Use temporary file
+        # Use temporary directory
         temp_dir = tempfile.gettempdir()
-        dump_file = Path(temp_dir) / f"{REMOTE_DB_NAME}_dump_{os.getpid()}.dump"
+        dump_file = Path(temp_dir) / f"{REMOTE_DB_NAME}_dump_{os.getpid()}"
     
     print(f"Remote database: {REMOTE_DB_NAME}@{REMOTE_DB_USER} (via SSH tunnel)")
     print(f"Local database: {local_db_name}@{local_db_user} ({local_db_host}:{local_db_port})")
-    print(f"Dump file: {dump_file}")
+    if args.incremental:
+        print("Mode: incremental (upsert rows newer than the local watermark)")
+    elif args.stream:
+        print("Mode: streaming (pg_dump | pg_restore, no intermediate dump)")
+    else:
+        print(f"Dump directory: {dump_file} ({args.jobs} parallel jobs)")
+    if args.tables:
+        print(f"Tables: {', '.join(args.tables)}")
+    if args.exclude_tables:
+        print(f"Excluded tables: {', '.join(args.exclude_tables)}")
     print()
     
+    if args.incremental:
+        if args.drop_existing or args.stream:
+            print("❌ --incremental cannot be combined with --drop-existing or --stream")
+            sys.exit(1)
+        print("Establishing SSH tunnel for incremental sync...")
+        try:
+            with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
+                if not incremental_sync(
+                    local_db_name,
+                    local_db_user,
+                    local_db_host,
+                    local_db_port,
+                    local_db_password,
+                    args.tables,
+                ):
+                    sys.exit(1)
+        except Exception as e:
+            print(f"❌ SSH tunnel error: {e}")
+            sys.exit(1)
+        return
+
     # Drop existing database if requested
     if args.drop_existing:
         if not drop_local_database(local_db_name, local_db_user, local_db_host, local_db_port, local_db_password):
@@ -682,7 +1217,40 @@ def main():
     try:
         # Use different port for SSH tunnel to avoid conflict with local PostgreSQL
         with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
-            if not dump_remote_database(dump_file, REMOTE_DB_USER, REMOTE_DB_PASSWORD, REMOTE_DB_NAME):
+            row_estimates = estimate_table_rows(
+                "127.0.0.1",
+                str(SSH_TUNNEL_PORT),
+                REMOTE_DB_USER,
+                REMOTE_DB_PASSWORD,
+                REMOTE_DB_NAME,
+                args.tables,
+            )
+            if args.stream:
+                if not stream_copy_database(
+                    REMOTE_DB_USER,
+                    REMOTE_DB_PASSWORD,
+                    REMOTE_DB_NAME,
+                    local_db_name,
+                    local_db_user,
+                    local_db_host,
+                    local_db_port,
+                    local_db_password,
+                    tables=args.tables,
+                    exclude_tables=args.exclude_tables,
+                    row_estimates=row_estimates,
+                ):
+                    print("❌ Failed to stream remote database")
+                    sys.exit(1)
+            elif not dump_remote_database(
+                dump_file,
+                REMOTE_DB_USER,
+                REMOTE_DB_PASSWORD,
+                REMOTE_DB_NAME,
+                jobs=args.jobs,
+                tables=args.tables,
+                exclude_tables=args.exclude_tables,
+                row_estimates=row_estimates,
+            ):
                 print("❌ Failed to dump remote database")
                 sys.exit(1)
     except Exception as e:
@@ -692,13 +1260,15 @@ def main():
     print()
     
     # Restore to local database
-    if not restore_local_database(
+    if not args.stream and not restore_local_database(
         dump_file,
         local_db_name,
         local_db_user,
         local_db_host,
         local_db_port,
-        local_db_password
+        local_db_password,
+        jobs=args.jobs,
+        row_estimates=row_estimates,
     ):
         print("❌ Failed to restore database")
         sys.exit(1)
@@ -715,10 +1285,10 @@ def main():
     
     print()
     
-    # Clean up temporary dump file if it was created automatically
+    # Clean up temporary dump directory if it was created automatically
     if not args.dump_file and dump_file.exists():
-        print(f"Cleaning up temporary dump file: {dump_file}")
-        dump_file.unlink()
+        print(f"Cleaning up temporary dump directory: {dump_file}")
+        shutil.rmtree(dump_file)
     
     print()
     print("✓ Database copy completed successfully!")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Export events, contacts or blog posts as NDJSON or CSV.
+
+Rows are streamed through a server-side cursor and written batch by batch
+(see app/core/export.py), so memory stays flat for any table size. The
+same export is served at /api/v1/export/{name} for superusers.
+
+Usage:
+    python scripts/export_data.py {events,contacts,blog-posts} [--format ndjson|csv]
+        [--out FILE] [--batch-size N]
+
+Without --out the export goes to stdout and progress to stderr.
+"""
+
+# ruff: noqa: E402, T201
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import BinaryIO, get_args
+
+from sqlalchemy.engine import Engine
+
+_script_dir = Path(__file__).parent
+_backend_dir = _script_dir.parent
+sys.path.insert(0, str(_backend_dir))
+
+from app.core.db import SSH_TUNNEL_PORT, create_tunnel_engine, needs_ssh_tunnel
+from app.core.export import EXPORT_BATCH_SIZE, ExportFormat, ExportName, iter_export
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream a table export")
+    parser.add_argument("name", choices=get_args(ExportName))
+    parser.add_argument("--format", choices=get_args(ExportFormat), default="ndjson")
+    parser.add_argument("--out", type=Path, help="Output file (default: stdout)")
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+    return parser.parse_args()
+
+
+def write_export(engine: Engine, args: argparse.Namespace, out: BinaryIO) -> int:
+    """Write the export to `out`; returns the number of bytes written."""
+    written = 0
+    for chunk in iter_export(engine, args.name, args.format, batch_size=args.batch_size):
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def run(engine: Engine, args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    if args.out is None:
+        written = write_export(engine, args, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    else:
+        with args.out.open("wb") as f:
+            written = write_export(engine, args, f)
+    elapsed = time.perf_counter() - started
+    target = args.out or "stdout"
+    print(
+        f"✓ Exported {args.name} to {target} ({written / 1024:.0f} KiB in {elapsed:.1f}s)",
+        file=sys.stderr,
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    if needs_ssh_tunnel():
+        from app.ssh_util import ssh_tunnel
+
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
+            tunnel_engine = create_tunnel_engine()
+            try:
+                run(tunnel_engine, args)
+            finally:
+                tunnel_engine.dispose()
+        return
+
+    from app.core.db import engine
+
+    run(engine, args)
+
+
+if __name__ == "__main__":
+    main()
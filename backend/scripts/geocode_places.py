@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Fill latitude/longitude of events and tours from the offline gazetteer.
+
+Events are located by venue name, venue address and neighborhood, tours by
+their meeting point (see app/core/geo.py); nothing is sent over the
+network. Rows that already have coordinates are left alone unless --all
+is given, so coordinates fixed by hand in the admin survive a rerun.
+
+Usage:
+    python scripts/geocode_places.py [--all] [--dry-run]
+"""
+
+# ruff: noqa: E402, T201
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, col, select
+
+_script_dir = Path(__file__).parent
+_backend_dir = _script_dir.parent
+sys.path.insert(0, str(_backend_dir))
+
+from app.core.db import SSH_TUNNEL_PORT, create_tunnel_engine, needs_ssh_tunnel
+from app.core.geo import geocode
+from app.core.querydebug import track_queries
+from app.models import Event, Tour
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Geocode events and tours offline")
+    parser.add_argument(
+        "--all", action="store_true", help="Recompute rows that already have coordinates"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing")
+    return parser.parse_args()
+
+
+def geocode_rows(session: Session, model: type[Event] | type[Tour], *, recompute: bool) -> Counter[str]:
+    """Geocode one table; returns how many rows matched each place kind."""
+    statement = select(model)
+    if not recompute:
+        statement = statement.where(col(model.latitude).is_(None))
+    stats: Counter[str] = Counter()
+    for row in session.exec(statement):
+        if isinstance(row, Event):
+            place = geocode(row.venue_name, row.venue_address, row.neighborhood)
+        else:
+            place = geocode(row.meeting_point)
+        if place is None:
+            stats["unmatched"] += 1
+            continue
+        stats[place.kind] += 1
+        row.latitude, row.longitude = place.latitude, place.longitude
+        session.add(row)
+    return stats
+
+
+def run(engine: Engine, args: argparse.Namespace) -> None:
+    with track_queries("geocode_places"), Session(engine) as session:
+        for model in (Event, Tour):
+            stats = geocode_rows(session, model, recompute=args.all)
+            summary = ", ".join(f"{kind}={count}" for kind, count in sorted(stats.items()))
+            print(f"  {model.__tablename__}: {summary or 'nothing to do'}")
+        if args.dry_run:
+            session.rollback()
+            print("Dry run, nothing written")
+        else:
+            session.commit()
+            print("✓ Coordinates saved")
+
+
+def main() -> None:
+    args = parse_args()
+    if needs_ssh_tunnel():
+        from app.ssh_util import ssh_tunnel
+
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
+            tunnel_engine = create_tunnel_engine()
+            try:
+                run(tunnel_engine, args)
+            finally:
+                tunnel_engine.dispose()
+        return
+
+    from app.core.db import engine
+
+    run(engine, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -79,6 +79,8 @@ if _early_args.production:
             os.environ["POSTGRES_DB"] = dbname
 
 from app.core.config import settings
+from app.core.db import SSH_TUNNEL_PORT, create_tunnel_engine
+from app.core.querydebug import track_queries
 from app.models import BlogPost
 from app.ssh_util import ssh_tunnel
 from app.translit import transliterate
@@ -451,17 +453,9 @@ def main():
                     print(f"\n  Trying to use SSH tunnel to connect to production database...")
                     # Use SSH tunnel from ssh_util.py (same as other parts of the app)
                     try:
-                        with ssh_tunnel(local_port=5433):
+                        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
                             print("  ✓ SSH tunnel active, connecting...")
-                            # Modify URI to use SSH tunnel (same approach as app/main.py)
-                            # Replace port first, then host (order matters to avoid partial matches)
-                            tunnel_uri = str(settings.SQLALCHEMY_DATABASE_URI).replace(
-                                f":{settings.POSTGRES_PORT}", ":5433"
-                            ).replace(
-                                f"@{settings.POSTGRES_SERVER}:", "@127.0.0.1:"
-                            )
-                            from sqlalchemy import create_engine
-                            tunnel_engine = create_engine(tunnel_uri)
+                            tunnel_engine = create_tunnel_engine()
                             # Retry with tunnel
                             return process_files(tunnel_engine)
                     except Exception as tunnel_error:
@@ -485,7 +479,7 @@ def main():
                 print(f"    - Network connectivity")
                 sys.exit(1)
         
-        with Session(engine) as session:
+        with track_queries("import_docx_blog_posts"), Session(engine) as session:
             # Verify connection and show database info
             try:
                 from sqlalchemy import text
@@ -537,15 +531,13 @@ def main():
     # Use same approach as app/main.py, app/backend_pre_start.py, app/alembic/env.py
     if needs_ssh_tunnel:
         print("Local environment with remote database detected, creating SSH tunnel...")
-        with ssh_tunnel(local_port=5433):
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
             print("SSH tunnel active, processing files...")
-            # Same tunnel URI modification as in app/main.py
-            from sqlalchemy import create_engine
-            tunnel_uri = str(settings.SQLALCHEMY_DATABASE_URI).replace(
-                f":{settings.POSTGRES_PORT}", ":5433"
-            ).replace(settings.POSTGRES_SERVER, "127.0.0.1")
-            tunnel_engine = create_engine(tunnel_uri)
-            process_files(tunnel_engine)
+            tunnel_engine = create_tunnel_engine()
+            try:
+                process_files(tunnel_engine)
+            finally:
+                tunnel_engine.dispose()
     else:
         # Use direct connection - same as app/core/db.py and other parts of the app
         print("Using direct database connection...")
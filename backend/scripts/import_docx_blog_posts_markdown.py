@@ -13,7 +13,6 @@ Same database connection behavior as import_docx_blog_posts.py (SSH tunnel in lo
 from __future__ import annotations
 
 import argparse
-import io
 import os
 import posixpath
 import re
@@ -27,16 +26,8 @@ from typing import Optional
 import mammoth
 import paramiko
 from mammoth.images import img_element
-from PIL import Image
 from sqlmodel import Session, select
 
-# Match StaticFiles mount path in app/main.py
-BLOG_MEDIA_URL_PREFIX = "/blog-media"
-
-# Optional downscale for large raster images (same idea as legacy HTML importer)
-MAX_IMAGE_PIXELS = 1200
-WEBP_QUALITY = 75
-
 _script_dir = Path(__file__).parent
 _backend_dir = _script_dir.parent
 sys.path.insert(0, str(_backend_dir))
@@ -73,6 +64,9 @@ if _early_args.production:
             os.environ["POSTGRES_DB"] = dbname
 
 from app.core.config import settings
+from app.core.db import SSH_TUNNEL_PORT, create_tunnel_engine
+from app.core.media import encode_webp, public_url
+from app.core.querydebug import track_queries
 from app.models import BlogPost
 from app.ssh_util import ssh_tunnel
 from app.translit import transliterate
@@ -275,19 +269,6 @@ def _markdown_plain_preview(md: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
-def _prepare_image_for_webp(image_bytes: bytes) -> Image.Image:
-    img = Image.open(io.BytesIO(image_bytes))
-    if img.mode not in ("RGB", "RGBA"):
-        if img.mode == "P" and "transparency" in img.info:
-            img = img.convert("RGBA")
-        else:
-            img = img.convert("RGB")
-    w, h = img.size
-    if max(w, h) > MAX_IMAGE_PIXELS:
-        img.thumbnail((MAX_IMAGE_PIXELS, MAX_IMAGE_PIXELS), Image.Resampling.LANCZOS)
-    return img
-
-
 def make_convert_image(
     slug: str,
     post_images_dir: Optional[Path],
@@ -320,20 +301,18 @@ def make_convert_image(
         with image.open() as f:
             raw = f.read()
         try:
-            img = _prepare_image_for_webp(raw)
+            payload = encode_webp(raw)
         except OSError:
             filename = f"{uuid.uuid4().hex}.bin"
             save_bytes(filename, raw)
-            public_path = f"{BLOG_MEDIA_URL_PREFIX}/{slug}/{filename}"
+            public_path = public_url(slug, filename)
             if not first_public_url:
                 first_public_url.append(public_path)
             return {"src": public_path}
 
         filename = f"{uuid.uuid4().hex}.webp"
-        out = io.BytesIO()
-        img.save(out, format="WEBP", quality=WEBP_QUALITY)
-        save_bytes(filename, out.getvalue())
-        public_path = f"{BLOG_MEDIA_URL_PREFIX}/{slug}/{filename}"
+        save_bytes(filename, payload)
+        public_path = public_url(slug, filename)
         if not first_public_url:
             first_public_url.append(public_path)
         return {"src": public_path}
@@ -564,14 +543,9 @@ def main():
                 if hostname in ("db", "postgres", "database"):
                     print("\n  Trying SSH tunnel...")
                     try:
-                        with ssh_tunnel(local_port=5433):
+                        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
                             print("  ✓ SSH tunnel active, connecting...")
-                            tunnel_uri = str(settings.SQLALCHEMY_DATABASE_URI).replace(
-                                f":{settings.POSTGRES_PORT}", ":5433"
-                            ).replace(f"@{settings.POSTGRES_SERVER}:", "@127.0.0.1:")
-                            from sqlalchemy import create_engine
-
-                            tunnel_engine = create_engine(tunnel_uri)
+                            tunnel_engine = create_tunnel_engine()
                             return process_files(
                                 tunnel_engine,
                                 remote_sftp=remote_sftp,
@@ -586,7 +560,7 @@ def main():
                 print(f"\n✗ Error: Failed to connect to database: {e}")
                 sys.exit(1)
 
-        with Session(engine) as session:
+        with track_queries("import_docx_blog_posts_markdown"), Session(engine) as session:
             try:
                 from sqlalchemy import text
 
@@ -636,14 +610,12 @@ def main():
 
     if needs_ssh_tunnel:
         print("Local environment with remote database, creating SSH tunnel...")
-        with ssh_tunnel(local_port=5433):
-            from sqlalchemy import create_engine
-
-            tunnel_uri = str(settings.SQLALCHEMY_DATABASE_URI).replace(
-                f":{settings.POSTGRES_PORT}", ":5433"
-            ).replace(settings.POSTGRES_SERVER, "127.0.0.1")
-            tunnel_engine = create_engine(tunnel_uri)
-            process_files(tunnel_engine, write_images=not args.dry_run)
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
+            tunnel_engine = create_tunnel_engine()
+            try:
+                process_files(tunnel_engine, write_images=not args.dry_run)
+            finally:
+                tunnel_engine.dispose()
     else:
         print("Using direct database connection...")
         if not args.production:
@@ -1,7 +1,13 @@
 import asyncio
 import argparse
+import hashlib
 import json
+import logging
+import re
+import sys
+import time
 from datetime import date, timedelta
+from functools import partial
 from pathlib import Path
 
 import httpx
@@ -10,11 +16,22 @@ from playwright.async_api import async_playwright
 _script_dir = Path(__file__).parent
 _output_dir = _script_dir.parent / "data" / "instagram_cards"
 _manifest_path = _output_dir / "cards.json"
+# Image name -> fingerprint of what it shows, see card_fingerprint
+_fingerprints_path = _output_dir / "fingerprints.json"
+
+logger = logging.getLogger(__name__)
 
 LOCAL_SITE_URL = "http://localhost:3000"
 LOCAL_API_URL = "http://127.0.0.1:8000"
 PROD_SITE_URL = "https://anastasiashimuk.com"
 PROD_API_URL = "https://anastasiashimuk.com"
+VIEWPORT = {"width": 1080, "height": 1350}
+DEFAULT_CONCURRENCY = 4
+# The build id appears in the RSC payload ("buildId") or, on pages router
+# pages, in the /_next/static/<id>/_buildManifest.js script URL
+BUILD_ID_RE = re.compile(
+    r'\\?"buildId\\?":\\?"([^"\\]+)|/_next/static/([^/"]+)/_buildManifest\.js'
+)
 
 
 def parse_args():
@@ -26,6 +43,21 @@ def parse_args():
         action="store_true",
         help="Use production site/API instead of local development URLs.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Cards rendered at the same time (default: {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Render every card, even if an unchanged one is already saved.",
+    )
+    parser.add_argument(
+        "--build-id",
+        help="Frontend build id to fingerprint cards with (default: read from the site).",
+    )
     return parser.parse_args()
 
 
@@ -37,7 +69,10 @@ def get_base_urls(production: bool):
 
 async def fetch_active_short_term_events(api_url: str):
     async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.get(f"{api_url}/api/v1/events/", params={"limit": 1000})
+        response = await client.get(
+            f"{api_url}/api/v1/events/",
+            params={"limit": 1000, "view": "summary"},
+        )
         response.raise_for_status()
 
     events = response.json().get("data", [])
@@ -51,6 +86,46 @@ async def fetch_active_short_term_events(api_url: str):
     ]
 
 
+async def fetch_build_id(site_url: str):
+    """The frontend's build id, or None if the page does not show one."""
+    async with httpx.AsyncClient(timeout=30) as client:
+        response = await client.get(f"{site_url}/events")
+        response.raise_for_status()
+    match = BUILD_ID_RE.search(response.text)
+    build_id = match and (match.group(1) or match.group(2))
+    # `next dev` reports a constant id, whatever the code looks like
+    if not build_id or build_id == "development":
+        return None
+    return build_id
+
+
+def card_fingerprint(*parts):
+    """
+    Hash of everything a card image depends on: event cards use the event's
+    slug, updated_at and order, the title card its date range; both add the
+    frontend build id.
+    """
+    payload = json.dumps(parts, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_fingerprints():
+    try:
+        return json.loads(_fingerprints_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def title_date_range(events):
+    """The range the title card shows (see the frontend's title page)."""
+    week_start = get_instagram_week_start().isoformat()
+    end_date = max(
+        max(event["start_date"], event.get("end_date") or event["start_date"])
+        for event in events
+    )
+    return week_start, end_date
+
+
 def get_instagram_week_start():
     today = date.today()
     if today.weekday() == 6:
@@ -93,44 +168,133 @@ async def save_title_card(page, site_url: str):
     return image_path.name
 
 
+async def open_pages(browser, count: int):
+    """A pool of `count` pages, each in its own browser context."""
+    pages = asyncio.Queue()
+    for _ in range(count):
+        context = await browser.new_context(viewport=VIEWPORT, device_scale_factor=1)
+        await pages.put(await context.new_page())
+    return pages
+
+
+async def render(pages, save):
+    """
+    Run `save(page)` on a free page from the pool; the queue only hands out
+    as many pages as it holds, so at most --concurrency cards load at once.
+    """
+    page = await pages.get()
+    started = time.perf_counter()
+    try:
+        image_name = await save(page)
+    finally:
+        await pages.put(page)
+    logger.info(f"Saved {_output_dir / image_name} ({time.perf_counter() - started:.1f}s)")
+    return image_name
+
+
 async def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     args = parse_args()
     site_url, api_url = get_base_urls(args.production)
     _output_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
 
     events = await fetch_active_short_term_events(api_url)
     if not events:
-        print("No active events found.")
+        logger.info("No active events found.")
         return
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page(
-            viewport={"width": 1080, "height": 1350},
-            device_scale_factor=1,
+    ordered = list(enumerate(events, start=1))
+    build_id = args.build_id or await fetch_build_id(site_url)
+    if build_id is None:
+        logger.warning("Frontend build id unknown, rendering every card")
+
+    # (image name, fingerprint, save) per card, title first
+    cards_to_save = [
+        (
+            "0-title.png",
+            card_fingerprint("title", *title_date_range(events), build_id),
+            partial(save_title_card, site_url=site_url),
         )
+    ]
+    cards_to_save += [
+        (
+            f"{order}-{event['slug']}.png",
+            card_fingerprint(event["slug"], event.get("updated_at"), order, build_id),
+            partial(save_card, site_url=site_url, slug=event["slug"], order=order),
+        )
+        for order, event in ordered
+    ]
 
-        title_image_name = await save_title_card(page, site_url)
-        print(f"Saved {_output_dir / title_image_name}")
-
-        cards = {}
-        for order, event in enumerate(events, start=1):
-            slug = event["slug"]
-            image_name = await save_card(page, site_url, slug, order)
-            cards[slug] = {
-                "order": order,
-                "title": event["title"],
-                "official_url": event.get("official_url"),
-            }
-            print(f"Saved {_output_dir / image_name}")
-
-        await browser.close()
+    previous = load_fingerprints()
+    reusable = {
+        image_name
+        for image_name, fingerprint, _ in cards_to_save
+        if not args.force
+        and build_id is not None
+        and previous.get(image_name) == fingerprint
+        and (_output_dir / image_name).exists()
+    }
+    pending = [
+        (image_name, save)
+        for image_name, _, save in cards_to_save
+        if image_name not in reusable
+    ]
+    logger.info(f"Reusing {len(reusable)} unchanged cards, rendering {len(pending)}")
+
+    concurrency = max(1, min(args.concurrency, len(pending)))
+    results = []
+    if pending:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            pages = await open_pages(browser, concurrency)
+
+            tasks = [render(pages, save) for _, save in pending]
+            # Cards are saved as they finish; a failed card does not stop the others
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            await browser.close()
+
+    failed = set()
+    for (image_name, _), result in zip(pending, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed {image_name}: {result}")
+            failed.add(image_name)
+
+    fingerprints = {
+        image_name: fingerprint
+        for image_name, fingerprint, _ in cards_to_save
+        if image_name not in failed
+    }
+    # Cards of events that dropped out or moved to another position
+    for image_name in previous.keys() - fingerprints.keys():
+        (_output_dir / image_name).unlink(missing_ok=True)
+    _fingerprints_path.write_text(
+        json.dumps(fingerprints, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
 
+    # Built in event order, not completion order, so reruns give the same file
+    cards = {
+        event["slug"]: {
+            "order": order,
+            "title": event["title"],
+            "official_url": event.get("official_url"),
+        }
+        for order, event in ordered
+        if f"{order}-{event['slug']}.png" not in failed
+    }
     _manifest_path.write_text(
         json.dumps(cards, ensure_ascii=False, indent=2) + "\n",
         encoding="utf-8",
     )
-    print(f"Saved {_manifest_path}")
+    logger.info(f"Saved {_manifest_path}")
+    logger.info(
+        f"Rendered {len(results) - len(failed)} cards, reused {len(reusable)},"
+        f" with concurrency {concurrency} in {time.perf_counter() - started:.1f}s"
+    )
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Load-test the public API of a running server.
+
+Every public endpoint gets --requests requests with --concurrency of them in
+flight. Throughput and p50/p95/p99 latency are reported per endpoint. The
+results can be saved as a JSON baseline, and a later run compared against
+it: the run fails (exit code 1) if an endpoint's p95 grows, or its
+throughput drops, by more than --threshold.
+
+Usage:
+    python scripts/load_test.py [--base-url URL] [--requests N] [--concurrency C]
+        [--seed] [--save-baseline PATH] [--baseline PATH] [--threshold 0.2]
+
+--seed fills the configured (local) database with BENCH_* volumes of
+synthetic tours, dates, events and blog posts first; see
+tests/benchmarks/seed.py. The server must run with FEATURE_SHOW_EVENTS=True
+for the events endpoints.
+"""
+
+# ruff: noqa: E402, T201
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+_script_dir = Path(__file__).parent
+_backend_dir = _script_dir.parent
+sys.path.insert(0, str(_backend_dir))
+
+from app.core.config import settings
+
+API = settings.API_V1_STR
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the public API")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seed", action="store_true", help="Seed benchmark data first")
+    parser.add_argument("--save-baseline", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare results with this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression of p95 / throughput (default: 0.2)",
+    )
+    return parser.parse_args()
+
+
+def seed() -> None:
+    if settings.POSTGRES_SERVER not in ("localhost", "127.0.0.1", "db"):
+        raise SystemExit(
+            f"❌ Refusing to seed benchmark data into {settings.POSTGRES_SERVER}"
+        )
+    from sqlmodel import Session
+
+    from app.core.db import engine
+    from tests.benchmarks.seed import BenchmarkVolumes, seed_benchmark_data
+
+    volumes = BenchmarkVolumes.from_env()
+    print(f"Seeding benchmark data: {vars(volumes)}")
+    with Session(engine) as session:
+        seed_benchmark_data(session, volumes)
+    engine.dispose()
+    print("✓ Seeded")
+
+
+async def discover_endpoints(client: httpx.AsyncClient) -> dict[str, str]:
+    """Public endpoints, with detail URLs taken from the list responses."""
+    endpoints = {
+        "health_check": f"{API}/utils/health-check/",
+        "features": f"{API}/utils/features",
+        "tours_list": f"{API}/tours/",
+        "events_list": f"{API}/events/?limit=100",
+        "events_list_summary": f"{API}/events/?limit=1000&view=summary",
+        "events_tag": f"{API}/events/?limit=100&tags=milonga",
+        "events_near": f"{API}/events/?limit=100&near=-34.6037,-58.3816&radius=1000",
+        "blog_posts_list": f"{API}/blog-posts/?limit=100",
+    }
+
+    tours = (await client.get(f"{API}/tours/?limit=1")).json()
+    if tours:
+        endpoints["tour_detail"] = f"{API}/tours/{tours[0]['slug']}/{tours[0]['date_id']}"
+
+    events = await client.get(f"{API}/events/?limit=1&view=summary")
+    if events.status_code == 200 and events.json()["data"]:
+        endpoints["event_detail"] = f"{API}/events/{events.json()['data'][0]['slug']}"
+    elif events.status_code != 200:
+        print("⚠ Events are disabled (FEATURE_SHOW_EVENTS), skipping them")
+        for name in ("events_list", "events_list_summary", "events_tag", "events_near"):
+            del endpoints[name]
+
+    posts = (await client.get(f"{API}/blog-posts/?limit=1")).json()
+    if posts["data"]:
+        endpoints["blog_post_detail"] = f"{API}/blog-posts/{posts['data'][0]['slug']}"
+
+    return endpoints
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient, url: str, requests: int, concurrency: int
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await client.get(url)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=30
+    ) as client:
+        endpoints = await discover_endpoints(client)
+        results = {}
+        print(f"{'endpoint':<22}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for name, url in endpoints.items():
+            # Warm up connections and caches
+            await run_endpoint(client, url, min(args.concurrency, args.requests), args.concurrency)
+            result = await run_endpoint(client, url, args.requests, args.concurrency)
+            results[name] = result
+            print(
+                f"{name:<22}{result['throughput_rps']:>10.1f}{result['p50_ms']:>10.1f}"
+                f"{result['p95_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['errors']:>8}"
+            )
+        return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {base['p95_ms']:.1f} → {result['p95_ms']:.1f} ms"
+            )
+        if result["throughput_rps"] < base["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {base['throughput_rps']:.1f} → "
+                f"{result['throughput_rps']:.1f} req/s"
+            )
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    if args.seed:
+        seed()
+
+    results = asyncio.run(run(args))
+    failed = any(result["errors"] for result in results.values())
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"✓ Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            failed = True
+            print(f"❌ Regressions beyond {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+        else:
+            print(f"✓ No regressions beyond {args.threshold:.0%}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Pre-generate compressed variants of blog media for app/core/static.py.
+
+Every SVG/text file under the media root gets a `<name>.gz` (gzip -9) and,
+when the brotli package is installed, a `<name>.br` (quality 11) sibling.
+Variants that are already newer than their source are left alone, so the
+script can run after each import. WebP and other binary images are
+skipped: they are compressed already.
+
+With --nginx, the script also prints the nginx config for
+MEDIA_ACCEL_REDIRECT_PREFIX: an `internal` location that serves the files
+the app names in its X-Accel-Redirect headers (Content-Type and
+Cache-Control come from the app response).
+
+Usage:
+    python scripts/precompress_media.py [--root PATH] [--nginx] [--prefix /_blog_media_internal]
+"""
+
+# ruff: noqa: E402, T201
+from __future__ import annotations
+
+import argparse
+import gzip
+import mimetypes
+import sys
+from pathlib import Path
+
+_script_dir = Path(__file__).parent
+_backend_dir = _script_dir.parent
+sys.path.insert(0, str(_backend_dir))
+
+from app.core.compression import COMPRESSIBLE_CONTENT_TYPES, brotli
+from app.core.media import BLOG_MEDIA_ROOT
+from app.core.static import PRECOMPRESSED_VARIANTS
+
+VARIANT_SUFFIXES = tuple(suffix for _, suffix in PRECOMPRESSED_VARIANTS)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-compress blog media")
+    parser.add_argument("--root", type=Path, default=BLOG_MEDIA_ROOT)
+    parser.add_argument(
+        "--nginx", action="store_true", help="Print the nginx X-Accel-Redirect location"
+    )
+    parser.add_argument(
+        "--prefix",
+        default="/_blog_media_internal",
+        help="MEDIA_ACCEL_REDIRECT_PREFIX the app runs with",
+    )
+    return parser.parse_args()
+
+
+def is_compressible(path: Path) -> bool:
+    if path.suffix in VARIANT_SUFFIXES:
+        return False
+    media_type = mimetypes.guess_type(path.name)[0] or ""
+    return media_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+
+
+def write_variant(source: Path, suffix: str, body: bytes) -> bool:
+    """Write `source` + suffix unless it is up to date; True if written."""
+    target = source.with_name(source.name + suffix)
+    if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+        return False
+    if suffix == ".br":
+        payload = brotli.compress(body, quality=11)
+    else:
+        payload = gzip.compress(body, compresslevel=9, mtime=0)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(payload)
+    tmp.replace(target)
+    return True
+
+
+def precompress(root: Path) -> tuple[int, int]:
+    """Returns (compressible files, variants written)."""
+    suffixes = VARIANT_SUFFIXES if brotli is not None else (".gz",)
+    files = written = 0
+    for path in sorted(root.rglob("*")):
+        if not path.is_file() or not is_compressible(path):
+            continue
+        files += 1
+        body = path.read_bytes()
+        for suffix in suffixes:
+            written += write_variant(path, suffix, body)
+    return files, written
+
+
+def nginx_location(root: Path, prefix: str) -> str:
+    prefix = prefix.rstrip("/")
+    return (
+        f"location {prefix}/ {{\n"
+        f"    internal;\n"
+        f"    alias {root.resolve()}/;\n"
+        f"    sendfile on;\n"
+        f"    tcp_nopush on;\n"
+        f"    # Serve the .gz / .br variants written by this script\n"
+        f"    gzip_static on;\n"
+        f"    gzip_vary on;\n"
+        f"    # brotli_static on;  # with ngx_brotli\n"
+        f"}}"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.root.is_dir():
+        raise SystemExit(f"❌ Media root not found: {args.root}")
+
+    if brotli is None:
+        print("⚠ brotli is not installed, writing .gz variants only")
+    files, written = precompress(args.root)
+    print(f"✓ {files} compressible files, {written} variants written under {args.root}")
+
+    if args.nginx:
+        print()
+        print(nginx_location(args.root, args.prefix))
+
+
+if __name__ == "__main__":
+    main()
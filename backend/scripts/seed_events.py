@@ -3,11 +3,17 @@
 Seed events from backend/data/events JSON files.
 
 Usage:
-    python scripts/seed_events.py [--file PATH] [--force] [--hidden] [--dry-run] [--production]
+    python scripts/seed_events.py [--file PATH] [--force] [--hidden] [--dry-run]
+        [--refresh-occurrences] [--production]
 
 By default, existing events are skipped and imported events are public
 (`is_visible=true`). Use --force to update existing records and --hidden to
-import records without showing them on the public site.
+import records without showing them on the public site. Created and updated
+events get their event_occurrence rows regenerated, and coordinates from the
+offline gazetteer (see scripts/geocode_places.py).
+
+The API moves the occurrence window of long-term events forward at startup;
+workers that run for weeks need --refresh-occurrences from a scheduled job.
 """
 
 # ruff: noqa: E402, T201
@@ -24,7 +30,7 @@ from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 from sqlmodel import Session, select
 
@@ -61,7 +67,11 @@ if _early_args.production:
             os.environ["POSTGRES_PORT"] = port
             os.environ["POSTGRES_DB"] = dbname
 
+from app import crud
 from app.core.config import settings
+from app.core.db import SSH_TUNNEL_PORT, create_tunnel_engine, needs_ssh_tunnel
+from app.core.geo import geocode
+from app.core.querydebug import track_queries
 from app.models import Event
 from app.ssh_util import ssh_tunnel
 
@@ -89,6 +99,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Parse and report changes without writing to database",
     )
+    parser.add_argument(
+        "--refresh-occurrences",
+        action="store_true",
+        help="Regenerate event_occurrence rows for all events (moves the "
+        "horizon of open-ended events forward; run e.g. weekly)",
+    )
     parser.add_argument(
         "--production",
         action="store_true",
@@ -140,6 +156,9 @@ def load_events(file_path: Path, visible: bool) -> list[Event]:
     ):
         for item in payload.get(collection_name, []):
             image = item.get("image") or {}
+            place = geocode(
+                item.get("venue_name"), item.get("venue_address"), item.get("neighborhood")
+            )
             start_date = parse_date(item.get("start_date"))
             if start_date is None:
                 raise ValueError(f"Event {item['slug']} has no start_date")
@@ -160,6 +179,8 @@ def load_events(file_path: Path, visible: bool) -> list[Event]:
                 neighborhood=item.get("neighborhood"),
                 city=item.get("city") or payload.get("city") or "Buenos Aires",
                 country=item.get("country") or payload.get("country") or "Argentina",
+                latitude=place.latitude if place else None,
+                longitude=place.longitude if place else None,
                 language=language,
                 price_type=item["price_type"],
                 price_currency=item.get("price_currency"),
@@ -197,6 +218,7 @@ def seed_events(
     created = 0
     updated = 0
     skipped = 0
+    changed: list[Event] = []
 
     for event in events:
         existing = session.exec(select(Event).where(Event.slug == event.slug)).first()
@@ -210,15 +232,22 @@ def seed_events(
             if not dry_run:
                 update_event(existing, event)
                 session.add(existing)
+                changed.append(existing)
             continue
 
         created += 1
         print(f"  - create: {event.slug}")
         if not dry_run:
             session.add(event)
+            changed.append(event)
 
     if not dry_run:
+        # Flush for the new ids; committing first would expire the events
+        # and reload them one by one
+        session.flush()
+        occurrences = crud.sync_event_occurrences(session=session, events=changed)
         session.commit()
+        print(f"  Occurrences written: {occurrences}")
 
     return created, updated, skipped
 
@@ -246,15 +275,6 @@ def _is_host_resolution_error(error: Exception) -> bool:
     )
 
 
-def _create_tunnel_engine() -> Engine:
-    tunnel_uri = (
-        str(settings.SQLALCHEMY_DATABASE_URI)
-        .replace(f":{settings.POSTGRES_PORT}", ":5433")
-        .replace(f"@{settings.POSTGRES_SERVER}:", "@127.0.0.1:")
-    )
-    return create_engine(tunnel_uri)
-
-
 def process_with_engine(
     engine: Engine,
     args: argparse.Namespace,
@@ -277,23 +297,31 @@ def process_with_engine(
         print(f"\nCannot resolve database host '{host}' from this environment.")
         print("This host usually works only inside Docker networks.")
         print("Trying SSH tunnel fallback...")
-        with ssh_tunnel(local_port=5433):
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
             print("SSH tunnel active, connecting to production database...")
-            process_with_engine(
-                _create_tunnel_engine(),
-                args,
-                events,
-                allow_tunnel_fallback=False,
-            )
+            tunnel_engine = create_tunnel_engine()
+            try:
+                process_with_engine(
+                    tunnel_engine,
+                    args,
+                    events,
+                    allow_tunnel_fallback=False,
+                )
+            finally:
+                tunnel_engine.dispose()
         return
 
-    with Session(engine) as session:
+    with track_queries("seed_events"), Session(engine) as session:
         created, updated, skipped = seed_events(
             session,
             events,
             force=args.force,
             dry_run=args.dry_run,
         )
+        if args.refresh_occurrences and not args.dry_run:
+            occurrences = crud.refresh_event_occurrences(session=session)
+            session.commit()
+            print(f"Refreshed occurrences of all events: {occurrences} rows")
 
     action = "Would import" if args.dry_run else "Imported"
     print(f"{action}: created={created}, updated={updated}, skipped={skipped}")
@@ -312,26 +340,19 @@ def main() -> None:
 
     confirm_production_write(args)
 
-    needs_ssh_tunnel = (
-        not args.production
-        and settings.ENVIRONMENT == "local"
-        and settings.POSTGRES_SERVER not in ("localhost", "127.0.0.1")
-    )
-
-    if needs_ssh_tunnel:
+    if not args.production and needs_ssh_tunnel():
         print("Local environment with remote database detected, creating SSH tunnel...")
-        with ssh_tunnel(local_port=5433):
-            tunnel_uri = (
-                str(settings.SQLALCHEMY_DATABASE_URI)
-                .replace(f":{settings.POSTGRES_PORT}", ":5433")
-                .replace(settings.POSTGRES_SERVER, "127.0.0.1")
-            )
-            process_with_engine(
-                create_engine(tunnel_uri),
-                args,
-                events,
-                allow_tunnel_fallback=False,
-            )
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT):
+            tunnel_engine = create_tunnel_engine()
+            try:
+                process_with_engine(
+                    tunnel_engine,
+                    args,
+                    events,
+                    allow_tunnel_fallback=False,
+                )
+            finally:
+                tunnel_engine.dispose()
         return
 
     from app.core.db import engine
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Build an anonymized, optionally rescaled snapshot of the database for load testing.
+
+Unlike copy_db.py, which copies production verbatim, this script:
+1. Reads every site table (through the SSH tunnel, or --local)
+2. Replaces PII (contacts, users, user, oauth_accounts, admin_users) with
+   deterministic fakes: the same input and --seed always give the same output,
+   so foreign keys and repeated values stay consistent across runs
+3. Samples or synthesizes rows to a target size per table (--scale), by
+   resampling real rows so column distributions follow production
+4. Writes a COPY-ready bundle: one CSV per table, load.sql and manifest.json;
+   load.sql regenerates event_occurrence from the loaded events
+
+Usage:
+    python scripts/snapshot_db.py --out data/snapshot [--scale contacts=1000000] [--scale events=100000] [--seed SEED] [--local]
+
+Load the bundle into an empty, migrated database with:
+    cd data/snapshot && psql -d DB_NAME -f load.sql
+"""
+
+# ruff: noqa: E402, T201
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import random
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import psycopg
+from psycopg import sql
+
+_script_dir = Path(__file__).parent
+_backend_dir = _script_dir.parent
+sys.path.insert(0, str(_backend_dir))
+
+from app.core.config import settings
+from app.core.db import SSH_TUNNEL_PORT
+from app.core.security import get_password_hash
+from app.crud import EVENT_OCCURRENCE_HORIZON_DAYS
+from app.ssh_util import ssh_tunnel
+
+# Tables in foreign key order (parents first)
+SNAPSHOT_TABLES = [
+    "tours",
+    "tour_date",
+    "user",
+    "oauth_accounts",
+    "users",
+    "admin_users",
+    "blog_posts",
+    "events",
+    "contacts",
+]
+
+# Only tables nothing else references can be sampled down or synthesized;
+# synthesized rows get new ids and suffixed unique values.
+SCALABLE_TABLES = {
+    "tour_date": (),
+    "blog_posts": ("slug",),
+    "events": ("slug",),
+    "contacts": (),
+}
+
+# TRUNCATE events ... CASCADE empties event_occurrence, and rescaled events
+# get new ids, so load.sql regenerates the occurrences from the loaded events
+# with the rules of crud.event_occurrence_dates (as the backfill migration)
+EVENT_OCCURRENCE_REFRESH_SQL = """\
+INSERT INTO event_occurrence (event_id, date, start_time_local)
+SELECT span.id, day::date, span.start_time_local
+FROM (
+    SELECT
+        e.id,
+        e.start_time_local,
+        CASE WHEN e.is_long_term
+            THEN GREATEST(e.start_date, CURRENT_DATE - {horizon})
+            ELSE e.start_date END AS first_day,
+        LEAST(
+            COALESCE(
+                e.end_date,
+                CASE WHEN e.is_long_term
+                    THEN CURRENT_DATE + {horizon} ELSE e.start_date END
+            ),
+            GREATEST(e.start_date, CURRENT_DATE) + {horizon}
+        ) AS last_day
+    FROM events e
+) span
+CROSS JOIN LATERAL generate_series(span.first_day, span.last_day, interval '1 day') AS day;"""
+
+FIRST_NAMES = [
+    "Ana", "Lucía", "Sofía", "Martina", "Valentina", "Camila", "Olga", "Irina",
+    "Mateo", "Santiago", "Juan", "Diego", "Nicolás", "Ivan", "Dmitry", "Pavel",
+]
+LAST_NAMES = [
+    "García", "Fernández", "López", "Martínez", "González", "Rodríguez",
+    "Pérez", "Romero", "Ivanova", "Petrov", "Smirnova", "Kuznetsov",
+]
+LOREM_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua ut enim ad minim veniam"
+).split()
+# Every scrubbed account gets this password, so load tests can still log in
+SCRUBBED_PASSWORD = "loadtest-password"
+# Rows fetched per round trip from the server-side cursor
+READ_BATCH_SIZE = 5000
+
+
+class Scrubber:
+    """Deterministic fake values derived from an HMAC of the original value."""
+
+    def __init__(self, seed: str):
+        self.key = seed.encode()
+
+    def digest(self, value: Any) -> bytes:
+        return hmac.new(self.key, str(value).encode(), hashlib.sha256).digest()
+
+    def number(self, value: Any) -> int:
+        return int.from_bytes(self.digest(value)[:8], "big")
+
+    def name(self, value: Any) -> str | None:
+        if value is None:
+            return None
+        n = self.number(value)
+        return f"{FIRST_NAMES[n % len(FIRST_NAMES)]} {LAST_NAMES[(n >> 8) % len(LAST_NAMES)]}"
+
+    def email(self, value: Any) -> str | None:
+        if value is None:
+            return None
+        return f"user{self.digest(value).hex()[:12]}@example.com"
+
+    def phone(self, value: Any) -> str | None:
+        if value is None:
+            return None
+        return f"+54 11 {self.number(value) % 10**8:08d}"
+
+    def text(self, value: Any) -> str | None:
+        """Lorem text with the same number of words as the original."""
+        if value is None:
+            return None
+        words = max(1, len(str(value).split()))
+        n = self.number(value)
+        return " ".join(LOREM_WORDS[(n + i) % len(LOREM_WORDS)] for i in range(words))
+
+    def token(self, value: Any) -> str | None:
+        if value is None:
+            return None
+        return self.digest(value).hex()
+
+    def url(self, value: Any) -> str | None:
+        if value is None:
+            return None
+        return f"https://example.com/avatars/{self.digest(value).hex()[:16]}.png"
+
+
+def pii_rules(scrubber: Scrubber) -> dict[str, dict[str, Callable[[Any], Any]]]:
+    """Per table: column -> function replacing the original value."""
+    password_hash = get_password_hash(SCRUBBED_PASSWORD)
+    return {
+        "contacts": {
+            "name": scrubber.name,
+            "email": scrubber.email,
+            "phone": scrubber.phone,
+            "message": scrubber.text,
+        },
+        "users": {
+            "name": scrubber.name,
+            "email": scrubber.email,
+            "password": lambda _: password_hash,
+            "image": scrubber.url,
+        },
+        "user": {
+            "email": scrubber.email,
+            "full_name": scrubber.name,
+            "hashed_password": lambda v: password_hash if v else None,
+            "image": scrubber.url,
+        },
+        "oauth_accounts": {
+            "provider_user_id": scrubber.token,
+            "access_token": lambda _: None,
+            "refresh_token": lambda _: None,
+        },
+        "admin_users": {
+            "password_hash": lambda _: password_hash,
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Write an anonymized, rescaled COPY bundle of the database"
+    )
+    parser.add_argument("--out", required=True, help="Output directory for the bundle")
+    parser.add_argument(
+        "--scale",
+        action="append",
+        default=[],
+        metavar="TABLE=ROWS",
+        help=f"Target row count for a table (repeatable; one of {', '.join(SCALABLE_TABLES)})",
+    )
+    parser.add_argument(
+        "--seed",
+        default="snapshot",
+        help="Seed for deterministic fakes and sampling (default: snapshot)",
+    )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Read from the configured database directly instead of through the SSH tunnel",
+    )
+    return parser.parse_args()
+
+
+def parse_scale(values: list[str]) -> dict[str, int]:
+    targets = {}
+    for value in values:
+        table, _, rows = value.partition("=")
+        if table not in SCALABLE_TABLES or not rows.isdigit():
+            raise SystemExit(
+                f"Invalid --scale {value!r}: expected TABLE=ROWS with TABLE in "
+                f"{', '.join(SCALABLE_TABLES)}"
+            )
+        targets[table] = int(rows)
+    return targets
+
+
+def to_csv_value(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def csv_field(value: Any) -> str:
+    """
+    NULL is an unquoted empty field and every other value is quoted, so
+    COPY ... (FORMAT csv) reads "" back as an empty string and only the
+    unquoted empty field as NULL.
+    """
+    if value is None:
+        return ""
+    return '"' + str(to_csv_value(value)).replace('"', '""') + '"'
+
+
+def read_columns(conn: psycopg.Connection, table: str) -> list[str]:
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("SELECT * FROM {} LIMIT 0").format(sql.Identifier(table)))
+        return [column.name for column in cur.description or []]
+
+
+def read_rows(conn: psycopg.Connection, table: str) -> Iterator[tuple]:
+    """All rows of `table` in id order, READ_BATCH_SIZE at a time."""
+    with conn.cursor(name=f"snapshot_{table}") as cur:
+        cur.itersize = READ_BATCH_SIZE
+        cur.execute(sql.SQL("SELECT * FROM {} ORDER BY 1").format(sql.Identifier(table)))
+        yield from cur
+
+
+def rescale_rows(
+    table: str,
+    columns: list[str],
+    rows: Iterable[tuple],
+    target: int,
+    rng: random.Random,
+) -> Iterator[tuple]:
+    """
+    Yield `target` rows: a sample of real rows when shrinking, or all real
+    rows followed by resampled copies (new id, suffixed unique columns).
+    At most `target` source rows are held in memory (reservoir sampling).
+    """
+    kept: list[tuple] = []
+    total = 0
+    for row in rows:
+        if len(kept) < target:
+            kept.append(row)
+        else:
+            index = rng.randint(0, total)
+            if index < target:
+                kept[index] = row
+        total += 1
+
+    if total >= target:
+        yield from sorted(kept, key=lambda row: row[0])
+        return
+
+    yield from kept
+    if not kept:
+        return
+    id_index = columns.index("id")
+    unique_indexes = [columns.index(column) for column in SCALABLE_TABLES[table]]
+    next_id = max(row[id_index] for row in kept) + 1
+    for copy_number in range(target - total):
+        row = list(rng.choice(kept))
+        row[id_index] = next_id + copy_number
+        for index in unique_indexes:
+            row[index] = f"{row[index]}-{copy_number + 1}"
+        yield tuple(row)
+
+
+class CountedRows:
+    """Iterate `rows` once, counting them."""
+
+    def __init__(self, rows: Iterable[tuple]):
+        self.rows = rows
+        self.count = 0
+
+    def __iter__(self) -> Iterator[tuple]:
+        for row in self.rows:
+            self.count += 1
+            yield row
+
+
+def write_table(
+    path: Path,
+    columns: list[str],
+    rows: Iterable[tuple],
+    rules: dict[str, Callable[[Any], Any]],
+) -> int:
+    scrub = [(columns.index(column), fn) for column, fn in rules.items() if column in columns]
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as f:
+        f.write(",".join(csv_field(column) for column in columns) + "\n")
+        for row in rows:
+            values = list(row)
+            for index, fn in scrub:
+                values[index] = fn(values[index])
+            f.write(",".join(csv_field(value) for value in values) + "\n")
+            count += 1
+    return count
+
+
+def write_load_script(out_dir: Path, tables: dict[str, list[str]]) -> None:
+    lines = [
+        "-- Generated by scripts/snapshot_db.py; run from this directory:",
+        "--   psql -d DB_NAME -f load.sql",
+        "\\set ON_ERROR_STOP on",
+        "BEGIN;",
+        "TRUNCATE "
+        + ", ".join(f'"{table}"' for table in tables)
+        + " CASCADE;",
+    ]
+    for table, columns in tables.items():
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        lines.append(
+            f"\\copy \"{table}\" ({column_list}) FROM '{table}.csv' WITH (FORMAT csv, HEADER true)"
+        )
+    for table, columns in tables.items():
+        if "id" in columns:
+            lines.append(
+                f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), max(id)) "
+                f"FROM \"{table}\" HAVING max(id) IS NOT NULL AND "
+                f"pg_get_serial_sequence('\"{table}\"', 'id') IS NOT NULL;"
+            )
+    if "events" in tables:
+        lines.append(
+            EVENT_OCCURRENCE_REFRESH_SQL.format(horizon=EVENT_OCCURRENCE_HORIZON_DAYS)
+        )
+    lines.append("COMMIT;")
+    (out_dir / "load.sql").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def build_snapshot(conn: psycopg.Connection, out_dir: Path, targets: dict[str, int], seed: str) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rules = pii_rules(Scrubber(seed))
+    rng = random.Random(seed)
+    manifest: dict[str, Any] = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "seed": seed,
+        "tables": {},
+    }
+    loaded: dict[str, list[str]] = {}
+
+    for table in SNAPSHOT_TABLES:
+        started = time.monotonic()
+        try:
+            columns = read_columns(conn, table)
+        except psycopg.errors.UndefinedTable:
+            conn.rollback()
+            print(f"  - skip {table}: table not found")
+            continue
+
+        rows = CountedRows(read_rows(conn, table))
+        output_rows = (
+            rescale_rows(table, columns, rows, targets[table], rng)
+            if table in targets
+            else rows
+        )
+        count = write_table(out_dir / f"{table}.csv", columns, output_rows, rules.get(table, {}))
+        source_rows = rows.count
+        loaded[table] = columns
+        manifest["tables"][table] = {
+            "source_rows": source_rows,
+            "rows": count,
+            "scrubbed_columns": sorted(set(rules.get(table, {})) & set(columns)),
+        }
+        print(
+            f"  ✓ {table}: {source_rows} → {count} rows "
+            f"({time.monotonic() - started:.1f}s)"
+        )
+
+    write_load_script(out_dir, loaded)
+    (out_dir / "manifest.json").write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def connect(local: bool) -> psycopg.Connection:
+    return psycopg.connect(
+        host=settings.POSTGRES_SERVER if local else "127.0.0.1",
+        port=settings.POSTGRES_PORT if local else SSH_TUNNEL_PORT,
+        user=settings.POSTGRES_USER,
+        password=settings.POSTGRES_PASSWORD,
+        dbname=settings.POSTGRES_DB,
+        connect_timeout=10,
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    targets = parse_scale(args.scale)
+    out_dir = Path(args.out)
+    if not out_dir.is_absolute():
+        out_dir = Path.cwd() / out_dir
+
+    print(f"Writing anonymized snapshot to {out_dir}")
+    for table, rows in targets.items():
+        print(f"  target {table}: {rows:,} rows")
+
+    if args.local:
+        with connect(local=True) as conn:
+            build_snapshot(conn, out_dir, targets, args.seed)
+    else:
+        with ssh_tunnel(local_port=SSH_TUNNEL_PORT), connect(local=False) as conn:
+            conn.read_only = True
+            build_snapshot(conn, out_dir, targets, args.seed)
+
+    print(f"✓ Snapshot written. Load it with: cd {out_dir} && psql -d DB_NAME -f load.sql")
+
+
+if __name__ == "__main__":
+    main()
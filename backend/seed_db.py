@@ -1,9 +1,13 @@
 
+import logging
 import sys
 import os
+import queue
 import re
+import threading
+import time
 import psycopg
-from psycopg import OperationalError
+from psycopg import OperationalError, sql
 
 # Add project root to sys.path to find app module
 # Assuming this script is in backend/
@@ -12,6 +16,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from app.ssh_util import ssh_tunnel
 from app.core.config import settings
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Configuration
 DB_HOST = "127.0.0.1"
 DB_PORT = "5432"
@@ -75,90 +82,303 @@ DDL_STATEMENTS = {
     """
 }
 
-def parse_sql_dump(file_path):
+# Read the dump in chunks so memory stays constant regardless of dump size
+READ_CHUNK_SIZE = 1024 * 1024
+# Rows are handed to the per-table COPY workers in batches
+COPY_BATCH_SIZE = 1000
+# Bounded per-table queues (in batches) keep memory flat if a table loads slowly
+COPY_QUEUE_SIZE = 16
+
+# MySQL dump tokens: whitespace, comments, quoted strings/identifiers,
+# punctuation and bare words (numbers, NULL, keywords). "partial" is a
+# comment, string or identifier cut off by the end of the read buffer.
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>(?:--|\#)[^\n]*\n|/\*.*?\*/)
+    | (?P<string>'[^'\\]*(?:(?:\\.|'')[^'\\]*)*')
+    | (?P<dquoted>"[^"\\]*(?:(?:\\.|"")[^"\\]*)*")
+    | (?P<ident>`[^`]*(?:``[^`]*)*`)
+    | (?P<partial>(?:(?:--|\#)[^\n]*
+                    |/\*(?:[^*]|\*(?!/))*
+                    |'[^'\\]*(?:(?:\\.|'')[^'\\]*)*\\?
+                    |"[^"\\]*(?:(?:\\.|"")[^"\\]*)*\\?
+                    |`[^`]*(?:``[^`]*)*
+                   )\Z)
+    | (?P<punct>[(),;])
+    | (?P<word>[^\s(),;'"`]+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_MYSQL_ESCAPES = {
+    "0": "",  # NUL is not allowed in PostgreSQL text
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "Z": "\x1a",
+}
+# Backslash escapes, plus the doubled delimiter of the enclosing quote
+_ESCAPE_RES = {
+    "'": re.compile(r"\\(.)|''", re.DOTALL),
+    '"': re.compile(r'\\(.)|""', re.DOTALL),
+}
+
+# MySQL "zero" dates have no PostgreSQL equivalent
+_ZERO_DATES = {"0000-00-00", "0000-00-00 00:00:00"}
+
+
+def _unescape(match):
+    if match.group(1) is None:
+        return match.group(0)[0]
+    return _MYSQL_ESCAPES.get(match.group(1), match.group(1))
+
+
+def iter_tokens(f):
+    """
+    Yield (kind, value) tokens from a MySQL dump text stream.
+
+    Quote-aware: semicolons, parentheses and escaped quotes inside strings
+    never end a statement. Comments and whitespace are skipped. The stream
+    is read in READ_CHUNK_SIZE chunks; only the current token is ever held
+    beyond that.
+    """
+    buffer = ""
+    eof = False
+    while not eof:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            # Terminate a trailing "-- comment" without a newline
+            chunk = "\n"
+        buffer += chunk
+        pos = 0
+        for match in _TOKEN_RE.finditer(buffer):
+            kind = match.lastgroup
+            end = match.end()
+            # A token touching the end of the buffer may continue in the next
+            # chunk. So may a string the regex had to cut short at a doubled
+            # quote ('it' + 's'), which a complete string is never followed by.
+            if not eof and (
+                end == len(buffer)
+                or kind == "partial"
+                or (kind in ("string", "dquoted") and buffer[end] == buffer[match.start()])
+            ):
+                break
+            if kind == "partial":
+                raise ValueError(f"Unterminated token in SQL dump near: {match.group()[:80]!r}")
+            pos = end
+            if kind == "space" or kind == "comment":
+                continue
+            value = match.group(kind)
+            if kind == "string" or kind == "dquoted":
+                value = _ESCAPE_RES[value[0]].sub(_unescape, value[1:-1])
+                kind = "string"
+            elif kind == "ident":
+                value = value[1:-1].replace("``", "`")
+            yield kind, value
+        buffer = buffer[pos:]
+
+
+def _parse_value(kind, value):
+    if kind == "string":
+        return None if value in _ZERO_DATES else value
+    if value.upper() == "NULL":
+        return None
+    # Numbers and other bare literals: COPY parses them by column type
+    return value
+
+
+def iter_insert_rows(f):
+    """
+    Stream rows out of the INSERT statements of a MySQL dump.
+
+    Yields (table, columns, row) with one tuple per VALUES group; every
+    other statement (CREATE TABLE, SET, LOCK, ...) is skipped.
+    """
+    tokens = iter_tokens(f)
+    for kind, value in tokens:
+        if not (kind == "word" and value.upper() == "INSERT"):
+            # Skip to the end of this statement
+            while not (kind == "punct" and value == ";"):
+                kind, value = next(tokens, ("punct", ";"))
+            continue
+
+        kind, value = next(tokens)
+        while kind == "word" and value.upper() in ("INTO", "IGNORE"):
+            kind, value = next(tokens)
+        table = value
+
+        columns = []
+        kind, value = next(tokens)
+        if (kind, value) == ("punct", "("):
+            for kind, value in tokens:
+                if (kind, value) == ("punct", ")"):
+                    break
+                if kind != "punct":
+                    columns.append(value)
+            kind, value = next(tokens)
+        if not (kind == "word" and value.upper() == "VALUES"):
+            raise ValueError(f"Unsupported INSERT into {table}: expected VALUES, got {value!r}")
+
+        # (v, v, ...), (v, v, ...), ... ;
+        row = []
+        for kind, value in tokens:
+            if kind == "punct":
+                if value == "(":
+                    row = []
+                elif value == ")":
+                    yield table, columns, tuple(row)
+                elif value == ";":
+                    break
+            else:
+                row.append(_parse_value(kind, value))
+
+
+class TableLoader:
+    """
+    Loads one table through COPY on its own connection and thread.
+
+    Rows arrive in batches through a bounded queue, so the dump reader,
+    the loaders for other tables and the database all work concurrently.
+    """
+
+    _DONE = object()
+
+    def __init__(self, table, connect):
+        self.table = table
+        self.connect = connect
+        self.rows = 0
+        self.error = None
+        self._batch = []
+        self._columns = None
+        self._queue = queue.Queue(maxsize=COPY_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._run, name=f"copy-{table}", daemon=True)
+        self._thread.start()
+
+    def add(self, columns, row):
+        if columns != self._columns:
+            self._flush()
+            self._columns = columns
+        self._batch.append(row)
+        if len(self._batch) >= COPY_BATCH_SIZE:
+            self._flush()
+
+    def finish(self):
+        self._flush()
+        self._put(self._DONE)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.rows
+
+    def _flush(self):
+        if self._batch:
+            self._put((self._columns, self._batch))
+            self._batch = []
+
+    def _put(self, item):
+        # Don't block forever on a queue nobody drains after a failure
+        while self.error is None:
+            try:
+                self._queue.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+        raise self.error
+
+    def _run(self):
+        try:
+            with self.connect() as conn, conn.cursor() as cur:
+                item = self._queue.get()
+                while item is not self._DONE:
+                    columns, batch = item
+                    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+                        sql.Identifier(self.table),
+                        sql.SQL(", ").join(map(sql.Identifier, columns)),
+                    )
+                    with cur.copy(statement) as copy:
+                        # One COPY for consecutive batches with the same columns
+                        while item is not self._DONE and item[0] == columns:
+                            for row in item[1]:
+                                copy.write_row(row)
+                            self.rows += len(item[1])
+                            item = self._queue.get()
+        except Exception as e:
+            self.error = e
+            # Unblock the reader
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+
+def load_sql_dump(file_path, connect):
     """
-    Parses the MySQL dump and extracts INSERT statements.
-    Returns a list of clean SQL statements for PostgreSQL.
+    Stream the dump into the DDL_STATEMENTS tables via parallel COPY.
+
+    Returns {table: rows loaded}. Tables found in the dump but not in
+    DDL_STATEMENTS are skipped.
     """
     if not os.path.exists(file_path):
-        print(f"Error: SQL dump file not found at {file_path}")
+        logger.error(f"Error: SQL dump file not found at {file_path}")
         sys.exit(1)
 
-    insert_statements = []
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Extract INSERT INTO statements
-    # Pattern to find INSERT INTO `table` (...) VALUES ... ;
-    # We use multiple regex or simple string finding because regex for nested parenthesis is hard.
-    # The dump format is consistent: INSERT INTO `table` (...) VALUES ...;
-    
-    # Split by semicolon is risky if semicolon is in quotes.
-    # But usually dumps put newline after ;
-    
-    # Strategy: Find "INSERT INTO", read until ";" at the end of line/block.
-    
-    # We can iterate through the content.
-    
-    # Simpler approach: regex to find the whole INSERT block?
-    # The file is not huge (24KB).
-    
-    matches = re.finditer(r"INSERT INTO `(.*?)` \((.*?)\) VALUES", content, re.IGNORECASE)
-    
-    # We construct the queries manually.
-    
-    # Actually, replacing backticks and escaping strings might be enough if we just process the whole file as a set of commands?
-    # No, we only want inserts.
-    
-    # Let's find specific table inserts.
-    for table_name in DDL_STATEMENTS.keys():
-        # Regex to capture the values part
-        # INSERT INTO `table_name` (...) VALUES (tuples);
-        pattern = re.compile(f"INSERT INTO `{table_name}`.*?(VALUES.*?);", re.DOTALL | re.IGNORECASE)
-        match = pattern.search(content)
-        if match:
-            insert_cmd = match.group(0)
-            
-            # Convert MySQL syntax to Postgres
-            # 1. Replace backticks with double quotes
-            insert_cmd = insert_cmd.replace("`", '"')
-            
-            # 2. Fix string masking: MySQL \' -> Postgres ''
-            # This is tricky because we might replace ' inside a string if we are not careful.
-            # But standard replace should work for \' -> ''
-            insert_cmd = insert_cmd.replace(r"\'", "''")
-            
-            insert_statements.append(insert_cmd)
-            
-    return insert_statements
+    loaders = {}
+    skipped = set()
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            for table, columns, row in iter_insert_rows(f):
+                loader = loaders.get(table)
+                if loader is None:
+                    if table not in DDL_STATEMENTS:
+                        if table not in skipped:
+                            logger.warning(f"  Skipping {table} (no DDL)")
+                            skipped.add(table)
+                        continue
+                    logger.info(f"  Loading {table}...")
+                    loader = loaders[table] = TableLoader(table, connect)
+                loader.add(columns, row)
+    finally:
+        counts = {}
+        errors = []
+        for table, loader in loaders.items():
+            try:
+                counts[table] = loader.finish()
+            except Exception as e:
+                errors.append((table, e))
+    for table, e in errors:
+        logger.error(f"  Error loading {table}: {e}")
+    if errors:
+        sys.exit(1)
+    return counts
+
 
 def main():
-    print(f"Connecting to database at {DB_HOST}:{DB_PORT}...")
+    logger.info(f"Connecting to database at {DB_HOST}:{DB_PORT}...")
     
     try:
         # In local environment, create SSH tunnel before connecting to DB
         if settings.ENVIRONMENT == "local":
-            print("Local environment detected, creating SSH tunnel...")
+            logger.info("Local environment detected, creating SSH tunnel...")
             with ssh_tunnel():
-                print("SSH tunnel active, connecting to database...")
+                logger.info("SSH tunnel active, connecting to database...")
                 _seed_database()
         else:
             # In production/staging, connect directly without tunnel
-            print(f"Connecting directly (environment: {settings.ENVIRONMENT})...")
+            logger.info(f"Connecting directly (environment: {settings.ENVIRONMENT})...")
             _seed_database()
     except OperationalError as e:
-        print(f"FAILURE: Could not connect to database.\nError: {e}")
+        logger.error(f"FAILURE: Could not connect to database.\nError: {e}")
         sys.exit(1)
     except Exception as e:
-        print(f"FAILURE: An unexpected error occurred.\nError: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"FAILURE: An unexpected error occurred.\nError: {e}")
         sys.exit(1)
 
-def _seed_database():
-    """Helper function to seed the database"""
-    conn = psycopg.connect(
+def _connect():
+    return psycopg.connect(
         host=DB_HOST,
         port=DB_PORT,
         user=DB_USER,
@@ -166,48 +386,44 @@ def _seed_database():
         dbname=DB_NAME,
         connect_timeout=10
     )
+
+def _seed_database():
+    """Helper function to seed the database"""
+    conn = _connect()
     conn.autocommit = True
     
-    print("Connected!")
+    logger.info("Connected!")
     
     with conn.cursor() as cur:
         # 1. Drop existing tables
-        print("Dropping existing tables...")
+        logger.info("Dropping existing tables...")
         for table in DDL_STATEMENTS.keys():
             cur.execute(f'DROP TABLE IF EXISTS "{table}" CASCADE')
         
         # 2. Create tables
-        print("Creating tables...")
+        logger.info("Creating tables...")
         for table, ddl in DDL_STATEMENTS.items():
-            print(f"  Creating {table}...")
+            logger.info(f"  Creating {table}...")
             cur.execute(ddl)
         
-        # 3. Insert data
-        print("Inserting data...")
-        inserts = parse_sql_dump(SQL_FILE)
-        for sql in inserts:
-            # Extract table name from SQL for logging
-            match = re.search(r'INSERT INTO "([^"]+)"', sql)
-            table_name = match.group(1) if match else "unknown"
-            print(f"  Inserting into {table_name}...")
-            try:
-                cur.execute(sql)
-            except Exception as e:
-                print(f"  Error inserting into {table_name}: {e}")
-                # Print start of SQL to debug
-                print(f"  SQL snippet: {sql[:100]}...")
-                sys.exit(1)
-        
+        # 3. Load data
+        logger.info("Loading data...")
+        started = time.monotonic()
+        counts = load_sql_dump(SQL_FILE, _connect)
+        for table, rows in counts.items():
+            logger.info(f"  {table}: {rows} rows")
+        logger.info(f"  Loaded {sum(counts.values())} rows in {time.monotonic() - started:.1f}s")
+
         # 4. Reset sequences (fix auto-increment)
-        print("Resetting sequences...")
+        logger.info("Resetting sequences...")
         for table in DDL_STATEMENTS.keys():
             try:
                 # Assuming 'id' is the serial column
                 cur.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), max(id)) FROM \"{table}\"")
             except Exception as e:
-                print(f"  Could not reset sequence for {table} (might be empty): {e}")
+                logger.warning(f"  Could not reset sequence for {table} (might be empty): {e}")
 
-    print("SUCCESS: Database seeded successfully!")
+    logger.info("SUCCESS: Database seeded successfully!")
     conn.close()
 
 if __name__ == "__main__":
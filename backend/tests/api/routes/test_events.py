@@ -0,0 +1,155 @@
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app import crud
+from app.api.routes.events import invalidate_event_facets
+from app.core.config import settings
+from app.models import EVENT_SUMMARY_FIELDS, Event
+from tests.utils.queries import assert_max_queries
+from tests.utils.utils import random_lower_string
+
+
+@pytest.fixture
+def visible_event(db: Session, monkeypatch: pytest.MonkeyPatch) -> Generator[Event, None, None]:
+    monkeypatch.setattr(settings, "FEATURE_SHOW_EVENTS", True)
+    event = Event(
+        slug=f"event-{random_lower_string()}",
+        title="Milonga",
+        category="tango",
+        summary_short="short",
+        summary_long="long " * 100,
+        start_date=date.today(),
+        timezone="America/Argentina/Buenos_Aires",
+        city="Buenos Aires",
+        country="Argentina",
+        language="ru",
+        price_type="free",
+        tags=["tango"],
+        status="confirmed",
+        is_visible=True,
+    )
+    db.add(event)
+    db.commit()
+    db.refresh(event)
+    yield event
+    db.exec(delete(Event).where(Event.id == event.id))  # type: ignore[call-overload]
+    db.commit()
+
+
+def test_read_events_full(client: TestClient, visible_event: Event) -> None:
+    r = client.get(f"{settings.API_V1_STR}/events/")
+    assert r.status_code == 200
+    item = next(e for e in r.json()["data"] if e["slug"] == visible_event.slug)
+    assert item["summary_long"] == visible_event.summary_long
+    assert item["tags"] == ["tango"]
+
+
+def test_read_events_summary_view(client: TestClient, visible_event: Event) -> None:
+    r = client.get(f"{settings.API_V1_STR}/events/", params={"view": "summary"})
+    assert r.status_code == 200
+    item = next(e for e in r.json()["data"] if e["slug"] == visible_event.slug)
+    assert set(item) == set(EVENT_SUMMARY_FIELDS)
+
+
+def test_read_events_sparse_fields(client: TestClient, visible_event: Event) -> None:
+    r = client.get(f"{settings.API_V1_STR}/events/", params={"fields": "slug,title"})
+    assert r.status_code == 200
+    item = next(e for e in r.json()["data"] if e["slug"] == visible_event.slug)
+    assert item == {"id": visible_event.id, "slug": visible_event.slug, "title": "Milonga"}
+
+
+@pytest.mark.usefixtures("visible_event")
+def test_read_events_unknown_field(client: TestClient) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/events/", params={"fields": "slug,is_visible"}
+    )
+    assert r.status_code == 422
+    assert "is_visible" in r.json()["detail"]
+
+
+@pytest.mark.usefixtures("visible_event")
+def test_read_events_query_budget(client: TestClient) -> None:
+    # One count, one page select, regardless of the number of events
+    with assert_max_queries(2):
+        r = client.get(f"{settings.API_V1_STR}/events/")
+    assert r.status_code == 200
+
+
+def test_read_events_calendar(
+    client: TestClient, db: Session, visible_event: Event
+) -> None:
+    crud.sync_event_occurrences(session=db, events=[visible_event])
+    db.commit()
+    today = date.today().isoformat()
+
+    r = client.get(
+        f"{settings.API_V1_STR}/events/calendar", params={"from": today, "to": today}
+    )
+    assert r.status_code == 200
+    item = next(e for e in r.json()["data"] if e["slug"] == visible_event.slug)
+    assert item["date"] == today
+    assert set(item) == {*EVENT_SUMMARY_FIELDS, "date", "start_time_local"}
+
+
+@pytest.mark.usefixtures("visible_event")
+def test_read_events_calendar_range_limit(client: TestClient) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/events/calendar",
+        params={"from": "2030-01-01", "to": "2030-06-01"},
+    )
+    assert r.status_code == 422
+
+
+def test_read_events_near(
+    client: TestClient, db: Session, visible_event: Event
+) -> None:
+    # Plaza Dorrego, San Telmo
+    visible_event.latitude, visible_event.longitude = -34.6205, -58.3717
+    db.add(visible_event)
+    db.commit()
+    url = f"{settings.API_V1_STR}/events/"
+
+    r = client.get(url, params={"near": "-34.6212,-58.3731", "radius": 500})
+    assert r.status_code == 200
+    assert visible_event.slug in {e["slug"] for e in r.json()["data"]}
+
+    # Palermo is ~6 km away
+    r = client.get(url, params={"near": "-34.5781,-58.4265", "radius": 2000})
+    assert visible_event.slug not in {e["slug"] for e in r.json()["data"]}
+
+    assert client.get(url, params={"near": "nowhere"}).status_code == 422
+
+
+def test_read_events_filters(client: TestClient, visible_event: Event) -> None:
+    url = f"{settings.API_V1_STR}/events/"
+
+    r = client.get(url, params={"category": "tango", "price_type": "free", "tags": "tango"})
+    assert r.status_code == 200
+    assert visible_event.slug in {e["slug"] for e in r.json()["data"]}
+
+    for params in ({"category": "theatre"}, {"tags": "tango,wine"}, {"language": "en"}):
+        r = client.get(url, params=params)
+        assert visible_event.slug not in {e["slug"] for e in r.json()["data"]}
+
+
+@pytest.mark.usefixtures("visible_event")
+def test_read_event_facets(client: TestClient) -> None:
+    invalidate_event_facets()
+
+    r = client.get(f"{settings.API_V1_STR}/events/facets")
+    assert r.status_code == 200
+    facets = r.json()
+    assert any(
+        item["value"] == "tango" and item["count"] >= 1 for item in facets["category"]
+    )
+    assert any(item["value"] == "tango" for item in facets["tags"])
+    assert any(item["value"] == "ru" for item in facets["language"])
+
+    # Served from the cache until it expires or an event changes
+    with assert_max_queries(0):
+        assert client.get(f"{settings.API_V1_STR}/events/facets").json() == facets
+
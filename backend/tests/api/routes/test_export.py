@@ -0,0 +1,57 @@
+import json
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models import BlogPost
+from tests.utils.utils import random_lower_string
+
+
+def test_export_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/export/contacts"
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=normal_user_token_headers).status_code == 403
+
+
+def test_export_blog_posts_ndjson(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    slug = random_lower_string()
+    post = BlogPost(title="Export", slug=slug, content_markdown="# Export")
+    db.add(post)
+    db.commit()
+
+    r = client.get(
+        f"{settings.API_V1_STR}/export/blog-posts", headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    assert r.headers["content-disposition"].startswith('attachment; filename="blog-posts-')
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert slug in {row["slug"] for row in rows}
+
+    db.delete(post)
+    db.commit()
+
+
+def test_export_events_csv(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/export/events",
+        params={"format": "csv"},
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    assert r.text.splitlines()[0].startswith("id,slug,title,")
+
+
+def test_export_unknown_table(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(f"{settings.API_V1_STR}/export/users", headers=superuser_token_headers)
+    assert r.status_code == 422
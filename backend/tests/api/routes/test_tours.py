@@ -0,0 +1,68 @@
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.models import Tour, TourDate
+from tests.utils.queries import assert_max_queries
+from tests.utils.utils import random_lower_string
+
+
+@pytest.fixture
+def tour_date(db: Session) -> Generator[TourDate, None, None]:
+    tour = Tour(
+        name="San Telmo walk",
+        slug=f"tour-{random_lower_string()}",
+        duration=120,
+        cost="20 USD",
+        additional_cost="",
+        meeting_point="Plaza Dorrego",
+        description="description",
+        additional_description="more",
+        max_capacity=None,
+    )
+    db.add(tour)
+    db.flush()
+    tour_date = TourDate(tour_id=tour.id, date=date(2030, 1, 5), time="10:00")
+    db.add(tour_date)
+    db.commit()
+    db.refresh(tour_date)
+    yield tour_date
+    db.exec(delete(TourDate).where(TourDate.id == tour_date.id))  # type: ignore[call-overload]
+    db.exec(delete(Tour).where(Tour.id == tour.id))  # type: ignore[call-overload]
+    db.commit()
+
+
+def test_read_tour_by_slug_and_date(client: TestClient, tour_date: TourDate) -> None:
+    tour = tour_date.tour
+    assert tour is not None
+
+    with assert_max_queries(1):
+        r = client.get(f"{settings.API_V1_STR}/tours/{tour.slug}/{tour_date.id}")
+    assert r.status_code == 200
+    assert r.json() == {
+        "name": "San Telmo walk",
+        "slug": tour.slug,
+        "description": "description",
+        "additional_description": "more",
+        "duration": 120,
+        "cost": "20 USD",
+        "additional_cost": "",
+        "meeting_point": "Plaza Dorrego",
+        "latitude": None,
+        "longitude": None,
+        "max_capacity": None,
+        "date": "2030-01-05",
+        "time": "10:00",
+        "date_id": tour_date.id,
+    }
+
+
+def test_read_tour_by_slug_and_date_not_found(
+    client: TestClient, tour_date: TourDate
+) -> None:
+    r = client.get(f"{settings.API_V1_STR}/tours/missing-tour/{tour_date.id}")
+    assert r.status_code == 404
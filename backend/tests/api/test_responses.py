@@ -0,0 +1,35 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+from app.api.responses import ModelResponse
+from app.models import EventPublic, EventsPublic
+
+
+def test_model_response_serializes_decimal_and_dates() -> None:
+    event = EventPublic(
+        id=1,
+        slug="tango-night",
+        title="Tango night",
+        category="music",
+        summary_short="short",
+        summary_long="long",
+        start_date=date(2026, 5, 1),
+        timezone="America/Argentina/Buenos_Aires",
+        city="Buenos Aires",
+        country="Argentina",
+        language="ru",
+        price_type="paid",
+        price_value=Decimal("1500.50"),
+        tags=["music"],
+        status="confirmed",
+        is_long_term=False,
+    )
+    response = ModelResponse(EventsPublic(data=[event], count=1))
+
+    assert response.media_type == "application/json"
+    body = json.loads(response.body)
+    assert body["count"] == 1
+    assert body["data"][0]["start_date"] == "2026-05-01"
+    assert body["data"][0]["price_value"] == "1500.50"
+    assert body["data"][0]["tags"] == ["music"]
@@ -0,0 +1,39 @@
+"""
+Benchmarks for the public API, run against the test database:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks --benchmark-save=baseline
+    RUN_BENCHMARKS=1 pytest tests/benchmarks --benchmark-compare=0001 \
+        --benchmark-compare-fail=median:20%
+
+They seed BENCH_* volumes of data (see seed.py), so they are skipped in the
+regular test run unless RUN_BENCHMARKS is set. Baselines are stored as JSON
+under .benchmarks/ by pytest-benchmark.
+"""
+import os
+from collections.abc import Generator
+
+import pytest
+from sqlmodel import Session
+
+from app.core.config import settings
+from tests.benchmarks.seed import (
+    BenchmarkData,
+    BenchmarkVolumes,
+    clear_benchmark_data,
+    seed_benchmark_data,
+)
+
+if not os.getenv("RUN_BENCHMARKS"):
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(scope="session")
+def bench_data(db: Session) -> Generator[BenchmarkData, None, None]:
+    data = seed_benchmark_data(db, BenchmarkVolumes.from_env())
+    yield data
+    clear_benchmark_data(db)
+
+
+@pytest.fixture(autouse=True)
+def show_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "FEATURE_SHOW_EVENTS", True)
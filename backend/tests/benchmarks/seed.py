@@ -0,0 +1,210 @@
+"""
+Synthetic data for the benchmark suite and scripts/load_test.py.
+
+Every seeded row has a slug starting with BENCH_PREFIX so it can be removed
+again without touching real data. Volumes come from BENCH_* environment
+variables, see `BenchmarkVolumes.from_env`.
+"""
+import os
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import sqlalchemy as sa
+from sqlmodel import Session, col, delete, select
+
+from app import crud
+from app.models import BlogPost, Event, Tour, TourDate
+
+BENCH_PREFIX = "bench-"
+INSERT_BATCH_SIZE = 1000
+
+CATEGORIES = ["tango", "music", "theatre", "exhibition", "food", "festival"]
+NEIGHBORHOODS = ["Palermo", "San Telmo", "Recoleta", "La Boca", "Belgrano", None]
+TAGS = ["tango", "free", "family", "outdoor", "night", "art", "wine", "english"]
+# On ~1% of the events, for a selective `tags` filter
+RARE_TAG = "milonga"
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua. "
+)
+
+
+@dataclass
+class BenchmarkVolumes:
+    tours: int = 20
+    dates_per_tour: int = 30
+    events: int = 2000
+    blog_posts: int = 500
+
+    @classmethod
+    def from_env(cls) -> "BenchmarkVolumes":
+        defaults = cls()
+        return cls(
+            tours=int(os.getenv("BENCH_TOURS", defaults.tours)),
+            dates_per_tour=int(os.getenv("BENCH_DATES_PER_TOUR", defaults.dates_per_tour)),
+            events=int(os.getenv("BENCH_EVENTS", defaults.events)),
+            blog_posts=int(os.getenv("BENCH_BLOG_POSTS", defaults.blog_posts)),
+        )
+
+
+@dataclass
+class BenchmarkData:
+    """Keys of seeded rows, for benchmarking the detail endpoints."""
+
+    tour_slug: str
+    tour_date_id: int
+    event_slug: str
+    blog_post_slug: str
+    volumes: BenchmarkVolumes = field(default_factory=BenchmarkVolumes)
+
+
+def _batches(rows: Iterator[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(session: Session, model: Any, rows: Iterator[dict[str, Any]]) -> None:
+    for batch in _batches(rows):
+        session.execute(sa.insert(model), batch)
+
+
+def _event_rows(count: int, rng: random.Random) -> Iterator[dict[str, Any]]:
+    today = date.today()
+    now = datetime.now()
+    for i in range(count):
+        start = today + timedelta(days=rng.randint(-30, 180))
+        paid = rng.random() < 0.6
+        yield {
+            "slug": f"{BENCH_PREFIX}event-{i}",
+            "title": f"Benchmark event {i}",
+            "category": rng.choice(CATEGORIES),
+            "summary_short": LOREM[: rng.randint(60, 120)],
+            "summary_long": LOREM * rng.randint(3, 12),
+            "start_date": start,
+            "end_date": start + timedelta(days=rng.choice([0, 0, 1, 7, 30])),
+            "start_time_local": "20:00",
+            "timezone": "America/Argentina/Buenos_Aires",
+            "venue_name": f"Venue {rng.randint(1, 200)}",
+            "neighborhood": rng.choice(NEIGHBORHOODS),
+            "city": "Buenos Aires",
+            # Spread over the city, for `near` queries
+            "latitude": rng.uniform(-34.70, -34.53),
+            "longitude": rng.uniform(-58.53, -58.35),
+            "country": "Argentina",
+            "language": rng.choice(["es", "ru", "en"]),
+            "price_type": "paid" if paid else "free",
+            "price_currency": "ARS" if paid else None,
+            "price_value": Decimal(rng.randint(5, 200) * 1000) if paid else None,
+            "official_url": f"https://example.com/events/{i}",
+            "tags": rng.sample(TAGS, rng.randint(1, 4))
+            + ([RARE_TAG] if rng.random() < 0.01 else []),
+            "source_urls": [f"https://example.com/source/{i}"],
+            "status": "confirmed",
+            "is_long_term": rng.random() < 0.1,
+            "is_visible": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def _blog_post_rows(count: int, rng: random.Random) -> Iterator[dict[str, Any]]:
+    now = datetime.now()
+    for i in range(count):
+        yield {
+            "title": f"Benchmark post {i}",
+            "slug": f"{BENCH_PREFIX}post-{i}",
+            "content_markdown": ("## Section\n\n" + LOREM * 8 + "\n\n") * rng.randint(2, 10),
+            "description": LOREM[:150],
+            "keywords": "buenos aires, tango",
+            "cover_image_url": f"/blog-media/{BENCH_PREFIX}post-{i}/cover.webp",
+            "reading_time_minutes": rng.randint(2, 15),
+            "created_at": now - timedelta(hours=i),
+            "updated_at": now,
+        }
+
+
+def seed_benchmark_data(
+    session: Session, volumes: BenchmarkVolumes, seed: int = 0
+) -> BenchmarkData:
+    """Replace previously seeded benchmark rows with `volumes` fresh ones."""
+    clear_benchmark_data(session)
+    rng = random.Random(seed)
+
+    _insert(
+        session,
+        Tour,
+        (
+            {
+                "name": f"Benchmark tour {i}",
+                "duration": rng.choice([90, 120, 150]),
+                "cost": f"{rng.randint(2, 6) * 10} USD",
+                "additional_cost": "",
+                "meeting_point": f"Meeting point {i}",
+                "description": LOREM * 6,
+                "additional_description": LOREM * 2,
+                "max_capacity": rng.choice([None, 10, 15, 20]),
+                "slug": f"{BENCH_PREFIX}tour-{i}",
+            }
+            for i in range(volumes.tours)
+        ),
+    )
+    tour_ids = session.exec(
+        select(Tour.id).where(col(Tour.slug).startswith(BENCH_PREFIX))
+    ).all()
+    today = date.today()
+    _insert(
+        session,
+        TourDate,
+        (
+            {
+                "tour_id": tour_id,
+                "date": today + timedelta(days=rng.randint(0, 365)),
+                "time": rng.choice(["10:00", "11:00", "15:00", "18:30"]),
+            }
+            for tour_id in tour_ids
+            for _ in range(volumes.dates_per_tour)
+        ),
+    )
+    _insert(session, Event, _event_rows(volumes.events, rng))
+    # For /events/calendar
+    crud.sync_event_occurrences(
+        session=session,
+        events=session.exec(
+            select(Event).where(col(Event.slug).startswith(BENCH_PREFIX))
+        ).all(),
+    )
+    _insert(session, BlogPost, _blog_post_rows(volumes.blog_posts, rng))
+    session.commit()
+
+    tour = session.exec(select(Tour).where(Tour.slug == f"{BENCH_PREFIX}tour-0")).first()
+    tour_date_id = (
+        session.exec(select(TourDate.id).where(TourDate.tour_id == tour.id)).first()
+        if tour
+        else None
+    )
+    return BenchmarkData(
+        tour_slug=f"{BENCH_PREFIX}tour-0",
+        tour_date_id=tour_date_id or 0,
+        event_slug=f"{BENCH_PREFIX}event-0",
+        blog_post_slug=f"{BENCH_PREFIX}post-0",
+        volumes=volumes,
+    )
+
+
+def clear_benchmark_data(session: Session) -> None:
+    bench_tours = select(Tour.id).where(col(Tour.slug).startswith(BENCH_PREFIX))
+    session.exec(delete(TourDate).where(col(TourDate.tour_id).in_(bench_tours)))  # type: ignore[call-overload]
+    session.exec(delete(Tour).where(col(Tour.slug).startswith(BENCH_PREFIX)))  # type: ignore[call-overload]
+    session.exec(delete(Event).where(col(Event.slug).startswith(BENCH_PREFIX)))  # type: ignore[call-overload]
+    session.exec(delete(BlogPost).where(col(BlogPost.slug).startswith(BENCH_PREFIX)))  # type: ignore[call-overload]
+    session.commit()
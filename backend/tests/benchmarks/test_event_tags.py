@@ -0,0 +1,56 @@
+"""
+The `tags` filter of /events/ (`tags @> '["milonga"]'` on JSONB, GIN
+jsonb_path_ops index) against the text match a plain json column allows.
+Meant for the 100k volume:
+
+    BENCH_EVENTS=100000 RUN_BENCHMARKS=1 pytest tests/benchmarks/test_event_tags.py
+"""
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from sqlmodel import Session, col, func, select
+
+from app.models import Event
+from tests.benchmarks.seed import RARE_TAG, BenchmarkData
+
+# Below this many events the planner may rightly prefer a sequential scan
+INDEX_SCAN_MIN_EVENTS = 50_000
+
+
+def _containment(session: Session) -> int:
+    return session.exec(
+        select(func.count()).where(col(Event.tags).contains([RARE_TAG]))
+    ).one()
+
+
+def _text_match(session: Session) -> int:
+    return session.exec(
+        select(func.count()).where(
+            sa.cast(col(Event.tags), sa.Text).like(f'%"{RARE_TAG}"%')
+        )
+    ).one()
+
+
+@pytest.mark.usefixtures("bench_data")
+def test_event_tags_text_match(benchmark: Any, db: Session) -> None:
+    benchmark.group = "event-tags"
+    assert benchmark(_text_match, db) > 0
+
+
+@pytest.mark.usefixtures("bench_data")
+def test_event_tags_containment(benchmark: Any, db: Session) -> None:
+    benchmark.group = "event-tags"
+    assert benchmark(_containment, db) == _text_match(db)
+
+
+def test_event_tags_filter_uses_gin_index(db: Session, bench_data: BenchmarkData) -> None:
+    db.exec(sa.text("ANALYZE events"))  # type: ignore[call-overload]
+    plan = "\n".join(
+        db.exec(  # type: ignore[call-overload]
+            sa.text("EXPLAIN SELECT count(*) FROM events WHERE tags @> CAST(:tags AS jsonb)"),
+            params={"tags": f'["{RARE_TAG}"]'},
+        ).scalars()
+    )
+    if bench_data.volumes.events >= INDEX_SCAN_MIN_EVENTS:
+        assert "ix_events_tags" in plan, plan
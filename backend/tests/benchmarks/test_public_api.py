@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes.events import CALENDAR_MAX_DAYS
+from app.core.config import settings
+from tests.benchmarks.seed import BenchmarkData
+
+API = settings.API_V1_STR
+# The longest range /events/calendar answers, starting today
+CALENDAR_FROM = date.today()
+CALENDAR_TO = CALENDAR_FROM + timedelta(days=CALENDAR_MAX_DAYS - 1)
+
+# (benchmark id, path template); templates are filled from BenchmarkData
+PUBLIC_ENDPOINTS = [
+    ("health_check", f"{API}/utils/health-check/"),
+    ("features", f"{API}/utils/features"),
+    ("tours_list", f"{API}/tours/"),
+    ("tour_detail", f"{API}/tours/{{tour_slug}}/{{tour_date_id}}"),
+    ("events_list", f"{API}/events/?limit=100"),
+    ("events_list_summary", f"{API}/events/?limit=1000&view=summary"),
+    ("events_tag", f"{API}/events/?limit=100&tags=milonga"),
+    ("events_near", f"{API}/events/?limit=100&near=-34.6037,-58.3816&radius=1000"),
+    ("event_detail", f"{API}/events/{{event_slug}}"),
+    ("event_facets", f"{API}/events/facets"),
+    ("events_calendar", f"{API}/events/calendar?from={CALENDAR_FROM}&to={CALENDAR_TO}"),
+    ("blog_posts_list", f"{API}/blog-posts/?limit=100"),
+    ("blog_post_detail", f"{API}/blog-posts/{{blog_post_slug}}"),
+]
+
+
+def percentile(data: list[float], q: float) -> float:
+    ordered = sorted(data)
+    index = min(len(ordered) - 1, round(q * (len(ordered) - 1)))
+    return ordered[index]
+
+
+@pytest.mark.parametrize(
+    "path", [path for _, path in PUBLIC_ENDPOINTS], ids=[name for name, _ in PUBLIC_ENDPOINTS]
+)
+def test_public_endpoint(
+    benchmark: Any, client: TestClient, bench_data: BenchmarkData, path: str
+) -> None:
+    url = path.format(**vars(bench_data))
+    assert client.get(url).status_code == 200
+
+    benchmark.group = "public-api"
+    response = benchmark(client.get, url)
+    assert response.status_code == 200
+
+    if benchmark.stats is not None:
+        rounds = benchmark.stats.stats.data
+        benchmark.extra_info.update(
+            {
+                "p50_ms": percentile(rounds, 0.50) * 1000,
+                "p95_ms": percentile(rounds, 0.95) * 1000,
+                "p99_ms": percentile(rounds, 0.99) * 1000,
+                "volumes": vars(bench_data.volumes),
+            }
+        )
@@ -0,0 +1,94 @@
+"""
+CPU cost per query of building the `select(...)` chain on every call versus
+executing the prebuilt hot statements with bound parameters. Measured with
+process time, so it is the Python-side saving (statement construction,
+cache-key generation) and not database time:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_statement_cache.py
+"""
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import and_, or_
+from sqlmodel import Session, col, func, select
+
+from app.api.routes.blog_posts import BLOG_POSTS_PAGE_STATEMENT
+from app.api.routes.events import (
+    EVENTS_COUNT_STATEMENT,
+    _page_params,
+    active_events_params,
+    events_page_statement,
+)
+from app.models import BlogPost, Event
+
+
+def _rebuilt_active_events_filter() -> Any:
+    today = date.today()
+    current_week_start = today - timedelta(days=today.weekday())
+    return or_(
+        and_(
+            col(Event.is_long_term).is_(False),
+            func.coalesce(Event.end_date, Event.start_date) >= current_week_start,
+        ),
+        and_(
+            col(Event.is_long_term).is_(True),
+            or_(col(Event.end_date).is_(None), Event.end_date >= today),
+        ),
+    )
+
+
+def events_rebuilt(session: Session) -> Any:
+    count = session.exec(
+        select(func.count())
+        .select_from(Event)
+        .where(col(Event.is_visible).is_(True), _rebuilt_active_events_filter())
+    ).one()
+    events = session.exec(
+        select(Event)
+        .where(col(Event.is_visible).is_(True), _rebuilt_active_events_filter())
+        .order_by(col(Event.start_date), col(Event.start_time_local), col(Event.title))
+        .offset(0)
+        .limit(20)
+    ).all()
+    session.expunge_all()
+    return count, events
+
+
+def events_prebuilt(session: Session) -> Any:
+    count = session.exec(EVENTS_COUNT_STATEMENT, params=active_events_params()).one()
+    events = session.exec(events_page_statement(None), params=_page_params(0, 20)).all()
+    session.expunge_all()
+    return count, events
+
+
+def blog_posts_rebuilt(session: Session) -> Any:
+    posts = session.exec(
+        select(BlogPost).order_by(col(BlogPost.created_at).desc()).offset(0).limit(20)
+    ).all()
+    session.expunge_all()
+    return posts
+
+
+def blog_posts_prebuilt(session: Session) -> Any:
+    posts = session.exec(BLOG_POSTS_PAGE_STATEMENT, params={"skip": 0, "limit": 20}).all()
+    session.expunge_all()
+    return posts
+
+
+@pytest.mark.usefixtures("bench_data")
+@pytest.mark.benchmark(group="statement-cache", timer=time.process_time)
+@pytest.mark.parametrize(
+    "query",
+    [events_rebuilt, events_prebuilt, blog_posts_rebuilt, blog_posts_prebuilt],
+    ids=lambda query: query.__name__,
+)
+def test_statement_cpu(
+    benchmark: Any,
+    db: Session,
+    query: Callable[[Session], Any],
+) -> None:
+    query(db)  # compile once, like the startup warm-up does
+    assert benchmark(query, db)
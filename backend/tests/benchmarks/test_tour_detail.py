@@ -0,0 +1,45 @@
+"""
+Per-request cost of the tour detail lookup, without HTTP: the prebuilt
+narrow-row statement the endpoint uses against building a `select(Tour,
+TourDate)` join and loading both ORM entities on every call.
+"""
+from typing import Any
+
+from sqlmodel import Session, select
+
+from app.api.routes.tours import TOUR_DETAIL_STATEMENT
+from app.models import Tour, TourDate
+from tests.benchmarks.seed import BenchmarkData
+
+
+def _orm_join(session: Session, slug: str, date_id: int) -> Any:
+    statement = (
+        select(Tour, TourDate)
+        .join(TourDate, Tour.id == TourDate.tour_id)  # type: ignore[arg-type]
+        .where(Tour.slug == slug)
+        .where(TourDate.id == date_id)
+    )
+    result = session.exec(statement).first()
+    # The identity map would otherwise return the already loaded objects
+    session.expunge_all()
+    return result
+
+
+def _narrow_row(session: Session, slug: str, date_id: int) -> Any:
+    return session.exec(
+        TOUR_DETAIL_STATEMENT, params={"slug": slug, "date_id": date_id}
+    ).first()
+
+
+def test_tour_detail_orm_join(benchmark: Any, db: Session, bench_data: BenchmarkData) -> None:
+    benchmark.group = "tour-detail"
+    result = benchmark(_orm_join, db, bench_data.tour_slug, bench_data.tour_date_id)
+    assert result is not None
+
+
+def test_tour_detail_narrow_row(
+    benchmark: Any, db: Session, bench_data: BenchmarkData
+) -> None:
+    benchmark.group = "tour-detail"
+    row = benchmark(_narrow_row, db, bench_data.tour_slug, bench_data.tour_date_id)
+    assert row is not None and row.date_id == bench_data.tour_date_id
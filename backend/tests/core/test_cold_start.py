@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+CHECK = """
+import sys
+import app.main
+print("imported:" + ",".join(m for m in {modules!r} if m in sys.modules))
+"""
+SENTINEL = "imported:"
+
+
+def _eagerly_imported(modules: tuple[str, ...], **env: str) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK.format(modules=modules)],
+        cwd=BACKEND_DIR,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # app.main may print too (e.g. the DB connection notice); the sentinel
+    # line is always printed, even when nothing heavy was imported
+    line = next(
+        line for line in reversed(result.stdout.splitlines()) if line.startswith(SENTINEL)
+    )
+    return [m for m in line.removeprefix(SENTINEL).split(",") if m]
+
+
+def test_heavy_modules_are_not_imported_at_startup() -> None:
+    assert _eagerly_imported(("sentry_sdk", "passlib", "emails", "authlib", "paramiko")) == []
+
+
+def test_admin_can_be_disabled() -> None:
+    assert _eagerly_imported(("sqladmin", "jinja2"), ADMIN_ENABLED="false") == []
@@ -0,0 +1,116 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, select_encoding
+
+
+def _make_client(minimum_size: int = 100) -> tuple[TestClient, CompressionMiddleware]:
+    app = FastAPI()
+
+    @app.get("/media/large.txt")
+    def media() -> PlainTextResponse:
+        return PlainTextResponse("m" * 2000)
+
+    @app.get("/large")
+    def large() -> dict[str, str]:
+        return {"data": "x" * 2000}
+
+    @app.get("/small")
+    def small() -> dict[str, str]:
+        return {"data": "x"}
+
+    @app.get("/text")
+    def text() -> PlainTextResponse:
+        return PlainTextResponse("y" * 2000)
+
+    @app.get("/partial")
+    def partial() -> PlainTextResponse:
+        return PlainTextResponse(
+            "p" * 1500,
+            status_code=206,
+            headers={"Content-Range": "bytes 0-1499/3047"},
+        )
+
+    @app.get("/varied")
+    def varied() -> PlainTextResponse:
+        return PlainTextResponse("v" * 2000, headers={"Vary": "Accept-Encoding"})
+
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=minimum_size, exclude_path_prefixes=("/media",)
+    )
+    client = TestClient(app)
+    client.get("/small")  # Starlette builds the middleware stack lazily
+    middleware = client.app.middleware_stack  # type: ignore[attr-defined]
+    while not isinstance(middleware, CompressionMiddleware):
+        middleware = middleware.app
+    return client, middleware
+
+
+def test_select_encoding() -> None:
+    assert select_encoding("") is None
+    assert select_encoding("identity") is None
+    assert select_encoding("gzip") == "gzip"
+    assert select_encoding("gzip;q=0") is None
+    assert select_encoding("deflate, gzip;q=0.5") == "gzip"
+
+
+def test_large_json_is_gzipped() -> None:
+    client, _ = _make_client()
+    r = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in r.headers["vary"]
+    assert r.json() == {"data": "x" * 2000}
+
+
+def test_small_response_is_not_compressed() -> None:
+    client, _ = _make_client()
+    r = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+
+
+def test_partial_response_is_not_compressed() -> None:
+    client, _ = _make_client()
+    r = client.get("/partial", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 206
+    assert "content-encoding" not in r.headers
+    assert r.text == "p" * 1500
+
+
+def test_excluded_path_is_not_compressed() -> None:
+    client, _ = _make_client()
+    r = client.get("/media/large.txt", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert "vary" not in r.headers
+
+
+def test_vary_is_not_duplicated() -> None:
+    client, _ = _make_client()
+    r = client.get("/varied", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers.get_list("vary") == ["Accept-Encoding"]
+
+
+def test_compressed_body_is_cached() -> None:
+    client, middleware = _make_client()
+    middleware.cache.clear()
+    client.get("/large", headers={"Accept-Encoding": "gzip"})
+    client.get("/large", headers={"Accept-Encoding": "gzip"})
+    client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert len(middleware.cache) == 2
+
+
+def test_cache_returns_valid_gzip() -> None:
+    _, middleware = _make_client()
+    body = b'{"data": "' + b"z" * 5000 + b'"}'
+    first = middleware.cache.get_or_compress(
+        body, "gzip", gzip_level=6, brotli_quality=5
+    )
+    second = middleware.cache.get_or_compress(
+        body, "gzip", gzip_level=6, brotli_quality=5
+    )
+    assert first is second
+    assert gzip.decompress(first) == body
@@ -0,0 +1,27 @@
+from app.core.config import settings
+from app.core.db import SSH_TUNNEL_PORT, create_db_engine, get_database_url
+
+
+def test_get_database_url_defaults_to_settings() -> None:
+    url = get_database_url()
+    assert url.host == settings.POSTGRES_SERVER
+    assert url.port == settings.POSTGRES_PORT
+    assert url.database == settings.POSTGRES_DB
+
+
+def test_get_database_url_overrides_host_and_port() -> None:
+    url = get_database_url(host="127.0.0.1", port=SSH_TUNNEL_PORT)
+    assert url.host == "127.0.0.1"
+    assert url.port == SSH_TUNNEL_PORT
+    assert url.username == settings.POSTGRES_USER
+    assert url.password == settings.POSTGRES_PASSWORD
+
+
+def test_create_db_engine_applies_pool_settings() -> None:
+    engine = create_db_engine(host="127.0.0.1", port=SSH_TUNNEL_PORT)
+    try:
+        assert engine.url.port == SSH_TUNNEL_PORT
+        assert engine.pool.size() == settings.DB_POOL_SIZE  # type: ignore[attr-defined]
+        assert engine.pool._pre_ping  # type: ignore[attr-defined]
+    finally:
+        engine.dispose()
@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+from collections.abc import Generator
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlmodel import Session, col, delete
+
+from app.core.db import engine
+from app.core.export import encode_csv, encode_ndjson, export_filename, iter_export
+from app.models import Contact
+from tests.utils.utils import random_lower_string
+
+
+def test_encode_ndjson() -> None:
+    rows = [
+        {"id": 1, "start_date": date(2026, 10, 19), "price_value": Decimal("1500.50")},
+        {"id": 2, "tags": ["tango", "free"], "updated_at": datetime(2026, 10, 19, 20, 30)},
+    ]
+    lines = encode_ndjson(rows).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "start_date": "2026-10-19", "price_value": "1500.50"},
+        {"id": 2, "tags": ["tango", "free"], "updated_at": "2026-10-19T20:30:00"},
+    ]
+
+
+def test_encode_csv() -> None:
+    rows = [
+        {"id": 1, "title": 'Milonga "La Viruta", Palermo', "tags": ["tango"], "end_date": None}
+    ]
+    header_only = encode_csv([], ["id", "title", "tags", "end_date"])
+    parsed = list(csv.reader(io.StringIO((header_only + encode_csv(rows)).decode())))
+    assert parsed == [
+        ["id", "title", "tags", "end_date"],
+        ["1", 'Milonga "La Viruta", Palermo', '["tango"]', ""],
+    ]
+
+
+def test_export_filename() -> None:
+    assert export_filename("blog-posts", "csv", date(2026, 10, 19)) == "blog-posts-2026-10-19.csv"
+
+
+@pytest.fixture
+def contacts(db: Session) -> Generator[list[Contact], None, None]:
+    prefix = random_lower_string()[:12]
+    rows = [
+        Contact(name=f"{prefix}-{i}", phone="+54 11 0000", email=f"{prefix}{i}@example.com", message="Hola")
+        for i in range(5)
+    ]
+    db.add_all(rows)
+    db.commit()
+    yield rows
+    db.exec(delete(Contact).where(col(Contact.name).startswith(prefix)))  # type: ignore[call-overload]
+    db.commit()
+
+
+def test_iter_export_batches(contacts: list[Contact]) -> None:
+    chunks = list(iter_export(engine, "contacts", "ndjson", batch_size=2))
+    exported = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    ids = [row["id"] for row in exported]
+    assert ids == sorted(ids)
+    assert {contact.id for contact in contacts} <= set(ids)
+    # One chunk per batch of 2 rows
+    assert len(chunks) == -(-len(exported) // 2)
+
+
+def test_iter_export_csv_header(contacts: list[Contact]) -> None:
+    chunks = list(iter_export(engine, "contacts", "csv", batch_size=2))
+    header = next(csv.reader(io.StringIO(chunks[0].decode())))
+    assert header == ["id", "name", "phone", "email", "message", "created_at"]
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert {contact.email for contact in contacts} <= {row["email"] for row in rows}
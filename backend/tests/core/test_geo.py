@@ -0,0 +1,35 @@
+import pytest
+
+from app.core.geo import geocode, normalize, parse_near
+
+
+def test_normalize() -> None:
+    assert normalize("  Núñez, Av. Cabildo 3000 ") == "nunez av cabildo 3000"
+
+
+def test_geocode_prefers_landmarks() -> None:
+    place = geocode("Feria de San Telmo", "Plaza Dorrego, Defensa 1000", "San Telmo")
+    assert place is not None
+    assert place.name == "Plaza Dorrego"
+
+
+def test_geocode_neighborhood_alias_and_accents() -> None:
+    place = geocode(None, "Gorriti 4800", "palermo soho")
+    assert place is not None
+    assert (place.name, place.kind) == ("Palermo", "neighborhood")
+
+    assert geocode("Cafe", "Nunez") is not None
+
+
+def test_geocode_whole_words_only() -> None:
+    # "Flores" must not match inside "Floresta"
+    place = geocode("Floresta")
+    assert place is not None and place.name == "Floresta"
+    assert geocode("Somewhere else", None) is None
+
+
+def test_parse_near() -> None:
+    assert parse_near("-34.6, -58.38") == (-34.6, -58.38)
+    for value in ("-34.6", "abc,def", "-134.6,-58.38"):
+        with pytest.raises(ValueError):
+            parse_near(value)
@@ -0,0 +1,41 @@
+import base64
+import io
+from pathlib import Path
+
+from PIL import Image
+
+from app.core.media import MAX_IMAGE_PIXELS, inline_images_to_references, store_image
+
+
+def _png(size: tuple[int, int] = (40, 30)) -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", size, "red").save(out, format="PNG")
+    return out.getvalue()
+
+
+def test_store_image_converts_to_webp(tmp_path: Path) -> None:
+    url = store_image(io.BytesIO(_png((3000, 1500))), "my-post", root=tmp_path)
+
+    assert url.startswith("/blog-media/my-post/") and url.endswith(".webp")
+    stored = tmp_path / "my-post" / url.rsplit("/", 1)[1]
+    with Image.open(stored) as img:
+        assert img.format == "WEBP"
+        assert max(img.size) == MAX_IMAGE_PIXELS
+
+
+def test_store_image_keeps_undecodable_files(tmp_path: Path) -> None:
+    url = store_image(b"not an image", "my-post", root=tmp_path)
+
+    assert url.endswith(".bin")
+    assert (tmp_path / "my-post" / url.rsplit("/", 1)[1]).read_bytes() == b"not an image"
+
+
+def test_inline_images_to_references(tmp_path: Path) -> None:
+    data_uri = "data:image/png;base64," + base64.b64encode(_png()).decode()
+    content = f'<p>Hi</p><img src="{data_uri}">\n\n![alt]({data_uri})'
+
+    result = inline_images_to_references(content, "my-post", root=tmp_path)
+
+    assert "base64" not in result
+    assert result.count("/blog-media/my-post/") == 2
+    assert len(list((tmp_path / "my-post").glob("*.webp"))) == 2
@@ -0,0 +1,58 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.metrics import (
+    MetricsRegistry,
+    RequestStats,
+    _request_stats,
+    current_request_stats,
+)
+from app.main import create_public_app
+from app.models import User
+
+
+def test_render_prometheus_histograms() -> None:
+    metrics = MetricsRegistry()
+    metrics.record_request("GET", "/api/v1/events/", 200, 0.02, RequestStats(3, 0.004))
+    metrics.record_request("GET", "/api/v1/events/", 200, 0.3, RequestStats(1, 0.001))
+
+    text = metrics.render_prometheus()
+
+    labels = 'method="GET",route="/api/v1/events/",status="200"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in text
+    assert 'http_request_db_queries_bucket{route="/api/v1/events/",le="2"} 1' in text
+    assert 'http_request_db_queries_sum{route="/api/v1/events/"} 4.0' in text
+
+
+def test_queries_are_counted_against_current_request(db: Session) -> None:
+    stats = RequestStats()
+    token = _request_stats.set(stats)
+    try:
+        db.exec(select(User)).all()
+        assert current_request_stats() is stats
+    finally:
+        _request_stats.reset(token)
+
+    assert stats.queries == 1
+    assert stats.db_time > 0
+
+
+def test_server_timing_header_and_metrics_endpoint(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/utils/health-check/")
+    assert r.status_code == 200
+    assert r.headers["server-timing"].startswith("app;dur=")
+    assert 'desc="0 queries"' in r.headers["server-timing"]
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert 'route="/api/v1/utils/health-check/"' in r.text
+
+
+def test_public_app_builds_with_metrics_enabled() -> None:
+    # Every route, /metrics included, goes through custom_generate_unique_id
+    assert settings.METRICS_ENABLED
+    app = create_public_app()
+    assert "/metrics" in {getattr(route, "path", None) for route in app.routes}
@@ -0,0 +1,38 @@
+import logging
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.querydebug import report_repeated, statement_shape, track_queries
+from app.models import User
+
+
+def test_statement_shape_groups_literals() -> None:
+    assert statement_shape(
+        "SELECT *\n  FROM events WHERE slug = 'a''b' AND id IN (%(id_1_1)s, %(id_1_2)s) LIMIT 10"
+    ) == "SELECT * FROM events WHERE slug = ? AND id IN (...) LIMIT ?"
+
+
+def test_track_queries_groups_repeated_statements(db: Session) -> None:
+    with track_queries("loop") as tracker:
+        for email in ("a@example.com", "b@example.com", "c@example.com"):
+            db.exec(select(User).where(User.email == email)).first()
+
+    assert tracker.count == 3
+    [(shape, count)] = tracker.repeated(3)
+    assert count == 3
+    assert shape.startswith("SELECT")
+
+
+def test_report_repeated_logs_possible_n_plus_one(
+    db: Session, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "QUERY_DEBUG_REPEAT_THRESHOLD", 2)
+    with track_queries("loop") as tracker:
+        for _ in range(2):
+            db.exec(select(User)).all()
+
+    with caplog.at_level(logging.WARNING, logger="app.queries"):
+        assert len(report_repeated(tracker)) == 1
+    assert "Possible N+1 in loop: 2×" in caplog.text
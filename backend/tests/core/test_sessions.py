@@ -0,0 +1,33 @@
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.sessions import ScopedSessionMiddleware
+from app.main import create_public_app
+
+
+def _has_session(request: Request) -> JSONResponse:
+    return JSONResponse({"session": "session" in request.scope})
+
+
+def test_session_only_on_scoped_paths() -> None:
+    app = Starlette(
+        routes=[
+            Route("/oauth/start", _has_session),
+            Route("/events", _has_session),
+        ]
+    )
+    app.add_middleware(
+        ScopedSessionMiddleware, path_prefixes=("/oauth",), secret_key="secret"
+    )
+    client = TestClient(app)
+
+    assert client.get("/oauth/start").json() == {"session": True}
+    assert client.get("/events").json() == {"session": False}
+
+
+def test_public_app_has_no_admin() -> None:
+    app = create_public_app()
+    assert not any(getattr(route, "path", "").startswith("/admin") for route in app.routes)
@@ -0,0 +1,28 @@
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+import app.api.main  # noqa: F401  registers the routes' hot statements
+from app.core.statements import hot_statements, warm_up_statements
+
+
+def test_hot_statements_registered() -> None:
+    names = {hot.name for hot in hot_statements()}
+    assert {
+        "events_count",
+        "events_page",
+        "event_detail",
+        "blog_posts_page",
+        "blog_post_detail",
+        "tours_page",
+        "tour_detail",
+    } <= names
+
+
+def test_warm_up_executes_every_statement(db: Session) -> None:
+    engine = db.get_bind()
+    assert isinstance(engine, Engine)
+
+    timings = warm_up_statements(engine)
+
+    assert set(timings) == {hot.name for hot in hot_statements()}
+
@@ -0,0 +1,63 @@
+import gzip
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app.core.static import MediaFiles
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg">' + b"<g/>" * 500 + b"</svg>"
+
+
+def _client(root: Path, **options: str) -> TestClient:
+    app = Starlette(routes=[Mount("/blog-media", MediaFiles(directory=root, **options))])
+    return TestClient(app)
+
+
+def test_immutable_cache_and_revalidation(tmp_path: Path) -> None:
+    (tmp_path / "post").mkdir()
+    (tmp_path / "post" / "a.webp").write_bytes(b"RIFF....WEBP")
+    client = _client(tmp_path)
+
+    response = client.get("/blog-media/post/a.webp")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["content-type"] == "image/webp"
+    assert "vary" not in response.headers
+
+    revalidated = client.get(
+        "/blog-media/post/a.webp", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+
+
+def test_serves_precompressed_variant(tmp_path: Path) -> None:
+    (tmp_path / "logo.svg").write_bytes(SVG)
+    (tmp_path / "logo.svg.gz").write_bytes(gzip.compress(SVG))
+    client = _client(tmp_path)
+
+    response = client.get("/blog-media/logo.svg", headers={"Accept-Encoding": "br, gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"] == "image/svg+xml"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == SVG  # decoded by the client
+
+    plain = client.get("/blog-media/logo.svg", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.content == SVG
+    assert plain.headers["etag"] != response.headers["etag"]
+
+
+def test_accel_redirect(tmp_path: Path) -> None:
+    (tmp_path / "post").mkdir()
+    (tmp_path / "post" / "a.webp").write_bytes(b"RIFF....WEBP")
+    client = _client(tmp_path, accel_redirect_prefix="/_media/")
+
+    response = client.get("/blog-media/post/a.webp")
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == "/_media/post/a.webp"
+    assert response.headers["content-type"] == "image/webp"
+    assert response.content == b""
+
+    assert client.get("/blog-media/post/missing.webp").status_code == 404
@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlmodel import Session, col, delete, func, select
+
+from app import crud
+from app.crud import EVENT_OCCURRENCE_HORIZON_DAYS
+from app.models import Event, EventOccurrence
+from tests.utils.utils import random_lower_string
+
+TODAY = date(2030, 3, 10)
+
+
+def _event(**values: object) -> Event:
+    defaults: dict[str, object] = {
+        "slug": f"event-{random_lower_string()}",
+        "title": "Feria",
+        "category": "market",
+        "summary_short": "short",
+        "summary_long": "long",
+        "start_date": date(2030, 3, 12),
+        "start_time_local": "18:00",
+        "timezone": "America/Argentina/Buenos_Aires",
+        "city": "Buenos Aires",
+        "country": "Argentina",
+        "language": "ru",
+        "price_type": "free",
+        "status": "confirmed",
+        "is_visible": True,
+    }
+    return Event(**{**defaults, **values})
+
+
+def test_single_day_event() -> None:
+    assert crud.event_occurrence_dates(_event(), today=TODAY) == [date(2030, 3, 12)]
+
+
+def test_multi_day_event() -> None:
+    event = _event(end_date=date(2030, 3, 14))
+    assert crud.event_occurrence_dates(event, today=TODAY) == [
+        date(2030, 3, 12),
+        date(2030, 3, 13),
+        date(2030, 3, 14),
+    ]
+
+
+def test_open_ended_long_term_event_stops_at_horizon() -> None:
+    event = _event(start_date=date(2020, 1, 1), is_long_term=True)
+    dates = crud.event_occurrence_dates(event, today=TODAY)
+    assert len(dates) == 2 * EVENT_OCCURRENCE_HORIZON_DAYS + 1
+    assert TODAY in dates
+
+
+def test_long_term_event_ended_before_window() -> None:
+    event = _event(
+        start_date=date(2020, 1, 1), end_date=date(2021, 1, 1), is_long_term=True
+    )
+    assert crud.event_occurrence_dates(event, today=TODAY) == []
+
+
+def test_sync_event_occurrences_replaces_rows(db: Session) -> None:
+    event = _event(end_date=date(2030, 3, 13))
+    db.add(event)
+    db.flush()
+
+    assert crud.sync_event_occurrences(session=db, events=[event], today=TODAY) == 2
+    event.end_date = date(2030, 3, 15)
+    assert crud.sync_event_occurrences(session=db, events=[event], today=TODAY) == 4
+    db.commit()
+
+    dates = db.exec(
+        select(EventOccurrence.date).where(EventOccurrence.event_id == event.id)
+    ).all()
+    assert sorted(dates) == [date(2030, 3, day) for day in range(12, 16)]
+
+    db.exec(delete(Event).where(col(Event.id) == event.id))  # type: ignore[call-overload]
+    db.commit()
+
+
+@pytest.mark.parametrize(
+    "end_date", [None, TODAY + timedelta(days=400)], ids=["open-ended", "far-end"]
+)
+def test_ensure_event_occurrences_current_moves_horizon(
+    db: Session, end_date: date | None
+) -> None:
+    event = _event(start_date=date(2020, 1, 1), end_date=end_date, is_long_term=True)
+    db.add(event)
+    db.flush()
+    crud.sync_event_occurrences(
+        session=db, events=[event], today=TODAY - timedelta(days=60)
+    )
+    db.commit()
+
+    assert crud.ensure_event_occurrences_current(session=db, today=TODAY)
+    last = db.exec(
+        select(func.max(EventOccurrence.date)).where(EventOccurrence.event_id == event.id)
+    ).one()
+    assert last == TODAY + timedelta(days=EVENT_OCCURRENCE_HORIZON_DAYS)
+    assert not crud.ensure_event_occurrences_current(session=db, today=TODAY)
+
+    db.exec(delete(Event).where(col(Event.id) == event.id))  # type: ignore[call-overload]
+    db.commit()
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+import seed_db
+from seed_db import iter_insert_rows
+
+DUMP = """-- phpMyAdmin SQL Dump
+/*!40101 SET NAMES utf8mb4 */;
+CREATE TABLE `tours` (`name` varchar(255) DEFAULT 'a;b');
+INSERT INTO `tours` (`id`, `name`, `max_capacity`) VALUES
+(1, 'it''s; (fine)', NULL),
+(2, 'line\\none\\'s \\\\ "q"', -3);
+INSERT INTO `users` (`id`, `emailVerified`) VALUES (1, '0000-00-00 00:00:00');
+COMMIT;
+-- trailing comment"""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_iter_insert_rows_is_quote_aware(
+    monkeypatch: pytest.MonkeyPatch, chunk_size: int
+) -> None:
+    monkeypatch.setattr(seed_db, "READ_CHUNK_SIZE", chunk_size)
+
+    rows = list(iter_insert_rows(io.StringIO(DUMP)))
+
+    assert rows == [
+        ("tours", ["id", "name", "max_capacity"], ("1", "it's; (fine)", None)),
+        ("tours", ["id", "name", "max_capacity"], ("2", 'line\none\'s \\ "q"', "-3")),
+        ("users", ["id", "emailVerified"], ("1", None)),
+    ]
+
+
+def test_iter_insert_rows_rejects_unterminated_string() -> None:
+    with pytest.raises(ValueError, match="Unterminated"):
+        list(iter_insert_rows(io.StringIO("INSERT INTO `t` VALUES (1, 'oops);")))
@@ -0,0 +1,97 @@
+import csv
+import importlib.util
+import random
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    "snapshot_db", Path(__file__).resolve().parents[2] / "scripts" / "snapshot_db.py"
+)
+assert _spec is not None and _spec.loader is not None
+snapshot_db = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(snapshot_db)
+
+COLUMNS = ["id", "slug", "title"]
+ROWS = [(i, f"event-{i}", f"Event {i}") for i in range(1, 11)]
+
+
+def test_scrubber_is_deterministic() -> None:
+    scrubber = snapshot_db.Scrubber("seed")
+
+    assert scrubber.email("ana@mail.com") == snapshot_db.Scrubber("seed").email("ana@mail.com")
+    assert scrubber.email("ana@mail.com") != snapshot_db.Scrubber("other").email("ana@mail.com")
+    assert scrubber.email("ana@mail.com").endswith("@example.com")
+    assert scrubber.phone("+54 9 11 1234") != "+54 9 11 1234"
+    assert len(scrubber.text("one two three").split()) == 3
+    for fake in (scrubber.name, scrubber.email, scrubber.phone, scrubber.text, scrubber.token, scrubber.url):
+        assert fake(None) is None
+
+
+def test_rescale_rows_samples_down() -> None:
+    rows = list(snapshot_db.rescale_rows("events", COLUMNS, iter(ROWS), 4, random.Random(0)))
+
+    assert len(rows) == 4
+    assert set(rows) <= set(ROWS)
+    assert rows == sorted(rows)
+
+
+def test_rescale_rows_synthesizes_up() -> None:
+    rows = list(snapshot_db.rescale_rows("events", COLUMNS, iter(ROWS), 25, random.Random(0)))
+
+    assert len(rows) == 25
+    assert rows[:10] == ROWS
+    assert [row[0] for row in rows[10:]] == list(range(11, 26))
+    # Unique columns are suffixed, others copied
+    assert len({row[1] for row in rows}) == 25
+    assert rows[10][1].endswith("-1")
+
+
+def test_rescale_rows_is_deterministic() -> None:
+    def run() -> list[tuple]:
+        return list(snapshot_db.rescale_rows("events", COLUMNS, iter(ROWS), 15, random.Random(3)))
+
+    assert run() == run()
+
+
+def test_write_table_keeps_nulls_distinct(tmp_path: Path) -> None:
+    path = tmp_path / "events.csv"
+    rows = [
+        (1, None, "", ["tango", 'say "hi"'], date(2026, 10, 19), Decimal("10.50"), True),
+        (2, "Palermo", "line\nbreak", None, None, None, False),
+    ]
+    columns = ["id", "neighborhood", "venue_name", "tags", "end_date", "price_value", "is_long_term"]
+
+    count = snapshot_db.write_table(path, columns, iter(rows), {"venue_name": lambda v: v})
+
+    assert count == 2
+    text = path.read_text(encoding="utf-8")
+    # NULL: unquoted empty field; empty string: ""
+    assert text.splitlines()[1].startswith('"1",,"",')
+    assert text.splitlines()[-1].endswith(',,,"false"')
+
+    with path.open(encoding="utf-8", newline="") as f:
+        parsed = list(csv.reader(f))
+    assert parsed[0] == columns
+    assert parsed[1] == ["1", "", "", '["tango", "say \\"hi\\""]', "2026-10-19", "10.50", "true"]
+    assert parsed[2] == ["2", "Palermo", "line\nbreak", "", "", "", "false"]
+
+
+@pytest.mark.parametrize("table", ["events", "contacts"])
+def test_counted_rows(table: str) -> None:
+    rows = snapshot_db.CountedRows(iter(ROWS))
+    assert len(list(snapshot_db.rescale_rows(table, COLUMNS, rows, 3, random.Random(0)))) == 3
+    assert rows.count == len(ROWS)
+
+
+def test_load_script_regenerates_event_occurrences(tmp_path: Path) -> None:
+    snapshot_db.write_load_script(tmp_path, {"events": COLUMNS, "contacts": ["id"]})
+    script = (tmp_path / "load.sql").read_text(encoding="utf-8")
+    copy_events = script.index("\\copy \"events\"")
+    refresh = script.index("INSERT INTO event_occurrence")
+    assert copy_events < refresh < script.index("COMMIT;")
+
+    snapshot_db.write_load_script(tmp_path, {"contacts": ["id"]})
+    assert "event_occurrence" not in (tmp_path / "load.sql").read_text(encoding="utf-8")
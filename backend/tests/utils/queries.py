@@ -0,0 +1,17 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.core.querydebug import QueryTracker, track_queries
+
+
+@contextmanager
+def assert_max_queries(budget: int) -> Iterator[QueryTracker]:
+    """
+    Fail if the block runs more than `budget` SQL statements, including
+    those of requests made through the TestClient.
+    """
+    with track_queries("test", process_wide=True) as tracker:
+        yield tracker
+    assert tracker.count <= budget, (
+        f"{tracker.count} queries, budget is {budget}:\n{tracker.summary()}"
+    )